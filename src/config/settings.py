@@ -1,7 +1,7 @@
 """Configuration management for Polymarket API."""
 
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -36,6 +36,10 @@ class PolymarketConfig(BaseSettings):
     db_path: str = Field(
         default="data/orders.db", description="SQLite database path for order persistence"
     )
+    db_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous level; FULL also fsyncs the WAL on every commit",
+    )
 
     # Concurrency settings
     max_concurrent_orders: int = Field(
@@ -26,9 +26,9 @@ class OrderEvent(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderEventData:
-    """Event data container."""
+    """Event data container (slotted: one is built for every published event)."""
 
     event: OrderEvent
     order_id: str
@@ -58,6 +58,7 @@ class EventBus:
         """
         self.logger = logger or logging.getLogger(__name__)
         self._subscribers: dict[OrderEvent, list[CallbackType]] = {}
+        self._all_subscribers: list[CallbackType] = []
         self._event_queue: asyncio.Queue[OrderEventData] = asyncio.Queue(maxsize=1000)
         self._worker_task: Optional[asyncio.Task] = None
         self._running = False
@@ -95,6 +96,15 @@ class EventBus:
         self._subscribers[event].append(callback)
         self.logger.debug(f"Subscribed to {event.value}")
 
+    def subscribe_all(self, callback: CallbackType):
+        """Subscribe to every event type with a single registration.
+
+        Args:
+            callback: Async callback function
+        """
+        self._all_subscribers.append(callback)
+        self.logger.debug("Subscribed to all events")
+
     async def publish(self, event_data: OrderEventData):
         """Publish event (non-blocking).
 
@@ -106,6 +116,21 @@ class EventBus:
         except asyncio.QueueFull:
             self.logger.error(f"Event queue full, dropping {event_data.event.value}")
 
+    async def publish_many(self, events: list[OrderEventData]):
+        """Publish several events in order with a single call (non-blocking).
+
+        Args:
+            events: Event data to publish, in dispatch order
+        """
+        queue = self._event_queue
+        for index, event_data in enumerate(events):
+            try:
+                queue.put_nowait(event_data)
+            except asyncio.QueueFull:
+                dropped = ", ".join(e.event.value for e in events[index:])
+                self.logger.error(f"Event queue full, dropping {dropped}")
+                return
+
     async def _process_events(self):
         """Worker that dispatches events to subscribers."""
         while self._running:
@@ -124,9 +149,9 @@ class EventBus:
         Args:
             event_data: Event data to dispatch
         """
-        subscribers = self._subscribers.get(event_data.event, [])
-        for callback in subscribers:
-            try:
-                await callback(event_data)
-            except Exception as e:
-                self.logger.error(f"Subscriber error for {event_data.event.value}: {e}")
+        for subscribers in (self._subscribers.get(event_data.event, ()), self._all_subscribers):
+            for callback in subscribers:
+                try:
+                    await callback(event_data)
+                except Exception as e:
+                    self.logger.error(f"Subscriber error for {event_data.event.value}: {e}")
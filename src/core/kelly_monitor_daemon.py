@@ -269,17 +269,19 @@ class KellyMonitorDaemon:
             except Exception as e:
                 self.logger.error(f"Monitor loop error: {e}", exc_info=True)
 
-            # Wait for next check (use minimum interval from all sessions)
+            # Wait for next check (use minimum interval from all sessions). Only
+            # the interval is read under the lock; sleeping while holding it
+            # would block add/remove_token_monitor for the whole interval.
             async with self._sessions_lock:
-                if self._sessions:
-                    min_interval = min(
+                interval = min(
+                    (
                         s.params.monitor_check_interval_seconds
                         for s in self._sessions.values()
                         if s.is_active
-                    )
-                    await asyncio.sleep(min_interval)
-                else:
-                    await asyncio.sleep(60.0)
+                    ),
+                    default=60.0,
+                )
+            await asyncio.sleep(interval)
 
         self.logger.info("Kelly monitor loop stopped")
 
@@ -528,10 +530,8 @@ class KellyMonitorDaemon:
             Total exposure in shares
         """
         # Get held shares from positions
-        positions = self.portfolio_monitor.get_positions_snapshot()
-        held_shares = 0
-        if token_id in positions:
-            held_shares = int(positions[token_id].total_shares)
+        position = self.portfolio_monitor.get_position(token_id)
+        held_shares = int(position.total_shares) if position is not None else 0
 
         # Get pending order shares
         orders = self.portfolio_monitor.get_orders_snapshot()
@@ -1,16 +1,21 @@
 """Market monitor for tracking order book and calculating micro-price."""
 
 import asyncio
+import heapq
 import json
 import logging
 import sqlite3
+import time
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from api.polymarket_client import PolymarketClient
 from models.market import MarketSnapshot
 
+_level_price = itemgetter(0)
+
 
 class MarketMonitor:
     """Monitors market conditions and calculates micro-price.
@@ -47,8 +52,9 @@ class MarketMonitor:
         self.db_path = Path(db_path)
         self.logger = logger or logging.getLogger(__name__)
 
-        # Cache for latest snapshot
-        self._last_snapshot: Optional[MarketSnapshot] = None
+        # Latest snapshot and its monotonic fetch time, replaced as one tuple so
+        # readers on other threads never see a snapshot paired with stale data
+        self._last_cached: Optional[tuple[MarketSnapshot, float]] = None
         self._monitor_task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -147,24 +153,28 @@ class MarketMonitor:
             # Fetch order book from API
             order_book = self.client.get_order_book(self.token_id)
 
-            # Extract and sort bids/asks correctly
+            # Extract bids/asks
             bids = order_book.bids or []
             asks = order_book.asks or []
 
             if not bids or not asks:
                 raise ValueError(f"Empty order book for token {self.token_id}")
 
-            # Sort order book correctly:
+            # Convert levels to (price, size) tuples once at the API boundary so
+            # ordering and serialization work on plain floats/ints
+            bid_book = self._parse_levels(bids)
+            ask_book = self._parse_levels(asks)
+
+            # Select top N levels without sorting the full book:
             # - Bids: highest to lowest (best bid = highest price)
             # - Asks: lowest to highest (best ask = lowest price)
-            bids_sorted = sorted(bids, key=lambda b: float(b.price), reverse=True)
-            asks_sorted = sorted(asks, key=lambda a: float(a.price))
+            top_n = max(depth_levels, 1)
+            top_bids = heapq.nlargest(top_n, bid_book, key=_level_price)
+            top_asks = heapq.nsmallest(top_n, ask_book, key=_level_price)
 
             # Best prices and depths
-            best_bid_price = float(bids_sorted[0].price)
-            best_bid_size = int(float(bids_sorted[0].size))
-            best_ask_price = float(asks_sorted[0].price)
-            best_ask_size = int(float(asks_sorted[0].size))
+            best_bid_price, best_bid_size = top_bids[0]
+            best_ask_price, best_ask_size = top_asks[0]
 
             # Calculate spread
             spread = best_ask_price - best_bid_price
@@ -177,9 +187,9 @@ class MarketMonitor:
             # Calculate threshold bands
             lower_band, upper_band = self.calculate_bands(micro_price)
 
-            # Extract top N levels (already sorted)
-            bid_levels = [(float(b.price), int(float(b.size))) for b in bids_sorted[:depth_levels]]
-            ask_levels = [(float(a.price), int(float(a.size))) for a in asks_sorted[:depth_levels]]
+            # Extract top N levels (already ordered)
+            bid_levels = top_bids[:depth_levels]
+            ask_levels = top_asks[:depth_levels]
 
             # Get our active orders (if any)
             our_orders = self._get_our_orders()
@@ -201,8 +211,8 @@ class MarketMonitor:
                 our_orders=our_orders,
             )
 
-            # Cache snapshot
-            self._last_snapshot = snapshot
+            # Cache snapshot for competitiveness checks
+            self._last_cached = (snapshot, time.monotonic())
 
             self.logger.debug(
                 f"Market snapshot: bid={best_bid_price}, ask={best_ask_price}, "
@@ -215,6 +225,11 @@ class MarketMonitor:
             self.logger.error(f"Failed to get market snapshot: {e}")
             raise
 
+    @staticmethod
+    def _parse_levels(levels: list[Any]) -> list[tuple[float, int]]:
+        """Convert raw order book levels to (price, size) tuples."""
+        return [(float(level.price), int(float(level.size))) for level in levels]
+
     def _serialize_levels(self, levels: list[tuple[float, int]]) -> str:
         """Serialize order book levels to JSON."""
         return json.dumps([{"price": price, "size": size} for price, size in levels])
@@ -303,6 +318,20 @@ class MarketMonitor:
             self.logger.warning(f"Failed to fetch our orders: {e}")
             return []
 
+    def _get_bands(self, snapshot: Optional[MarketSnapshot]) -> tuple[float, float]:
+        """Get (lower_band, upper_band) from a snapshot or the cached one."""
+        if snapshot is not None:
+            return snapshot.micro_price_lower_band, snapshot.micro_price_upper_band
+
+        cached = self._last_cached
+        if cached is None:
+            # No snapshot available, fetch fresh one
+            snapshot = self.get_market_snapshot()
+        else:
+            snapshot = cached[0]
+
+        return snapshot.micro_price_lower_band, snapshot.micro_price_upper_band
+
     def is_price_competitive(self, price: float, snapshot: Optional[MarketSnapshot] = None) -> bool:
         """Check if a price is within the micro-price threshold bands.
 
@@ -313,14 +342,23 @@ class MarketMonitor:
         Returns:
             True if price is within threshold bands
         """
-        if snapshot is None:
-            snapshot = self._last_snapshot
+        lower_band, upper_band = self._get_bands(snapshot)
+        return lower_band <= price <= upper_band
 
-        if snapshot is None:
-            # No snapshot available, fetch fresh one
-            snapshot = self.get_market_snapshot()
+    def are_prices_competitive(
+        self, prices: list[float], snapshot: Optional[MarketSnapshot] = None
+    ) -> list[bool]:
+        """Check many candidate prices against the micro-price threshold bands.
+
+        Args:
+            prices: Prices to check
+            snapshot: Optional snapshot to use (uses cached if not provided)
 
-        return snapshot.is_price_in_bounds(price)
+        Returns:
+            List of flags, True where the price is within threshold bands
+        """
+        lower_band, upper_band = self._get_bands(snapshot)
+        return [lower_band <= price <= upper_band for price in prices]
 
     def get_distance_from_fair_value(
         self, price: float, snapshot: Optional[MarketSnapshot] = None
@@ -335,7 +373,7 @@ class MarketMonitor:
             Distance from micro-price as fraction (e.g., 0.05 = 5% away)
         """
         if snapshot is None:
-            snapshot = self._last_snapshot
+            snapshot = self.get_last_snapshot()
 
         if snapshot is None:
             # No snapshot available, fetch fresh one
@@ -349,7 +387,26 @@ class MarketMonitor:
         Returns:
             Last snapshot or None if no snapshot cached
         """
-        return self._last_snapshot
+        cached = self._last_cached
+        return cached[0] if cached is not None else None
+
+    def get_micro_price(self, max_age: Optional[float] = None) -> Optional[float]:
+        """Get the micro-price from the last snapshot without fetching.
+
+        Args:
+            max_age: Seconds after which the cached price counts as stale
+                (default: no limit)
+
+        Returns:
+            Cached micro-price, or None if nothing is cached or it is older than max_age
+        """
+        cached = self._last_cached
+        if cached is None:
+            return None
+        snapshot, fetched_at = cached
+        if max_age is not None and time.monotonic() - fetched_at > max_age:
+            return None
+        return snapshot.micro_price
 
     async def start_monitoring(self) -> None:
         """Start background monitoring loop."""
@@ -371,10 +428,22 @@ class MarketMonitor:
                 pass
 
     async def _monitor_loop(self) -> None:
-        """Poll market data and persist snapshots."""
+        """Poll market data and persist snapshots.
+
+        Polls on a fixed cadence measured with a monotonic clock, so slow
+        fetches don't stretch the effective interval. If the loop falls more
+        than one interval behind, it resyncs instead of firing a burst of
+        catch-up polls.
+        """
+        next_tick = time.monotonic()
         while self._running:
             try:
                 self.fetch_and_store_snapshot(depth_levels=5)
             except Exception as e:
                 self.logger.warning(f"Market monitor poll failed: {e}")
-            await asyncio.sleep(self.poll_interval)
+
+            next_tick += self.poll_interval
+            now = time.monotonic()
+            if now - next_tick > self.poll_interval:
+                next_tick = now + self.poll_interval
+            await asyncio.sleep(max(0.0, next_tick - now))
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -13,6 +14,12 @@ from models.order import Order
 from models.order_request import OrderRequest
 from strategies.router import StrategyRouter
 
+# Final statuses recorded in the completed history
+_SUCCESS_STATES = frozenset({OrderStatus.COMPLETED, OrderStatus.PARTIALLY_FILLED})
+
+# Event published for a final status (anything else is reported as FAILED)
+_EVENT_FOR_STATUS = {OrderStatus.COMPLETED: OrderEvent.COMPLETED}
+
 
 class OrderDaemon:
     """Daemon for managing order queue and asynchronous execution.
@@ -39,6 +46,7 @@ class OrderDaemon:
         max_queue_size: int = 100,
         max_concurrent: int = 5,
         logger: Optional[logging.Logger] = None,
+        history_size: int = 10000,
     ):
         """Initialize order daemon.
 
@@ -50,6 +58,7 @@ class OrderDaemon:
             max_queue_size: Maximum queue size (default: 100)
             max_concurrent: Maximum concurrent order executions (default: 5)
             logger: Optional logger instance
+            history_size: Maximum completed/failed orders retained each (default: 10000)
         """
         self.client = client
         self.portfolio_monitor = portfolio_monitor
@@ -57,25 +66,30 @@ class OrderDaemon:
         self.db = db
         self.logger = logger or logging.getLogger(__name__)
 
-        # Order queue
-        self._queue: asyncio.Queue[OrderRequest] = asyncio.Queue(maxsize=max_queue_size)
+        # Order queue (None is the shutdown sentinel)
+        self._queue: asyncio.Queue[Optional[OrderRequest]] = asyncio.Queue(maxsize=max_queue_size)
 
-        # Concurrency control
+        # Concurrency control (one worker per concurrent execution slot)
         self._max_concurrent = max_concurrent
-        self._task_semaphore = asyncio.Semaphore(max_concurrent)
-        self._active_tasks: dict[str, asyncio.Task] = {}
+        self._in_flight = 0
         self._active_tokens: set[str] = set()
+        # Requests held back while their token is being traded, in arrival order
+        self._pending_by_token: dict[str, deque[OrderRequest]] = {}
 
         # Strategy router with new dependencies
         self._router = StrategyRouter(client, portfolio_monitor, event_bus, logger)
 
         # Daemon state
         self._running = False
-        self._worker_task: Optional[asyncio.Task] = None
+        self._worker_tasks: list[asyncio.Task] = []
 
-        # Completed orders tracking
-        self._completed_orders: list[Order] = []
-        self._failed_orders: list[Order] = []
+        # Completed orders tracking (bounded, oldest evicted first)
+        self._completed_orders: deque[Order] = deque(maxlen=history_size)
+        self._failed_orders: deque[Order] = deque(maxlen=history_size)
+        self._orders_by_id: dict[str, Order] = {}
+        # Running totals over retained history, kept in step with evictions
+        self._history_filled = 0
+        self._history_size = 0
 
     async def start(self) -> None:
         """Start the daemon.
@@ -94,19 +108,32 @@ class OrderDaemon:
 
         # Recover active orders from database
         if self.db:
-            active_orders = self.db.load_active_orders()
-            self.logger.info(f"Recovered {len(active_orders)} active orders from database")
+            active_count = sum(1 for _ in self.db.iter_active_orders())
+            self.logger.info(f"Recovered {active_count} active orders from database")
 
-            if active_orders:
+            if active_count:
                 self.logger.warning(
                     "Found active orders in database. Manual review recommended. "
                     "Automatic recovery not yet implemented."
                 )
 
+        # Drop shutdown sentinels a previous stop() left behind (workers busy at
+        # stop time exit without taking theirs), keeping any queued requests
+        leftover = []
+        while not self._queue.empty():
+            request = self._queue.get_nowait()
+            self._queue.task_done()
+            if request is not None:
+                leftover.append(request)
+        for request in leftover:
+            self._queue.put_nowait(request)
+
         self._running = True
 
-        # Start worker task
-        self._worker_task = asyncio.create_task(self._process_queue())
+        # Start worker tasks
+        self._worker_tasks = [
+            asyncio.create_task(self._process_queue()) for _ in range(self._max_concurrent)
+        ]
 
         self.logger.info(
             f"Order daemon started (max concurrent: {self._max_concurrent}, "
@@ -116,7 +143,7 @@ class OrderDaemon:
     async def stop(self) -> None:
         """Stop the daemon gracefully.
 
-        Waits for active tasks to complete before shutting down.
+        Waits for in-flight orders to complete before shutting down.
         """
         if not self._running:
             self.logger.warning("Daemon is not running")
@@ -125,26 +152,25 @@ class OrderDaemon:
         self.logger.info("Stopping order daemon...")
         self._running = False
 
-        # Wait for active tasks to complete (with timeout)
-        if self._active_tasks:
-            self.logger.info(f"Waiting for {len(self._active_tasks)} active tasks to complete...")
+        # Wake each worker so it exits without waiting for another order
+        for _ in self._worker_tasks:
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*self._active_tasks.values(), return_exceptions=True),
-                    timeout=30.0,
-                )
-            except asyncio.TimeoutError:
-                self.logger.warning("Timeout waiting for active tasks, cancelling...")
-                for task in self._active_tasks.values():
-                    task.cancel()
-
-        # Cancel worker task
-        if self._worker_task and not self._worker_task.done():
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                self.logger.debug("Worker task cancelled")
+                self._queue.put_nowait(None)
+            except asyncio.QueueFull:
+                # Remaining workers are cancelled below
+                break
+
+        # Let workers finish their in-flight orders (with timeout)
+        if self._in_flight:
+            self.logger.info(f"Waiting for {self._in_flight} active orders to complete...")
+        if self._worker_tasks:
+            _, pending = await asyncio.wait(self._worker_tasks, timeout=30.0)
+            if pending:
+                self.logger.warning("Timeout waiting for active orders, cancelling...")
+                for worker in pending:
+                    worker.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        self._worker_tasks = []
 
         # Stop event bus if present
         if self.event_bus:
@@ -190,54 +216,44 @@ class OrderDaemon:
             raise
 
     async def _process_queue(self) -> None:
-        """Process orders from the queue with concurrent execution.
+        """Process orders from the queue, one execution at a time.
 
-        This runs continuously until the daemon is stopped.
+        ``max_concurrent`` of these workers share the queue, so the worker
+        count bounds concurrency. This runs continuously until the daemon
+        is stopped.
         """
         self.logger.info("Worker started, processing queue...")
 
         while self._running:
             try:
-                # Wait for order with timeout
-                try:
-                    request = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    # No order available, continue loop
-                    continue
+                # Wait for next order (or shutdown sentinel)
+                request = await self._queue.get()
+                if request is None:
+                    self._queue.task_done()
+                    break
 
-                # Check token isolation
+                # Check token isolation; the worker trading this token picks
+                # the request up when its current execution finishes
                 if request.token_id in self._active_tokens:
-                    self.logger.warning(
-                        f"Token {request.token_id} already being traded, requeueing"
+                    self.logger.info(
+                        f"Token {request.token_id} already being traded, holding request"
                     )
-                    await self._queue.put(request)
-                    self._queue.task_done()
-                    await asyncio.sleep(1)
+                    # Stays unfinished for join() until the draining worker runs it
+                    self._pending_by_token.setdefault(request.token_id, deque()).append(request)
                     continue
 
-                # Wait for available slot
-                await self._task_semaphore.acquire()
-
-                # Mark token as active
+                # Mark token as active (no await since the check above, so
+                # no other worker can claim the token in between)
                 self._active_tokens.add(request.token_id)
 
-                # Emit QUEUED event
-                if self.event_bus:
-                    await self.event_bus.publish(
-                        OrderEventData(
-                            event=OrderEvent.QUEUED,
-                            order_id=f"pending-{request.token_id}",
-                            timestamp=datetime.now(),
-                            order_state=None,
-                            details={"token_id": request.token_id},
-                        )
-                    )
-
-                # Start execution task
-                task = asyncio.create_task(self._execute_with_tracking(request))
-                self._active_tasks[request.token_id] = task
-
-                self._queue.task_done()
+                # Execute in this worker, then drain requests held for the token;
+                # each request is marked done only once it has executed
+                while request is not None:
+                    try:
+                        await self._execute_with_tracking(request)
+                    finally:
+                        self._queue.task_done()
+                    request = self._next_pending(request.token_id)
 
             except asyncio.CancelledError:
                 self.logger.info("Worker task cancelled")
@@ -254,20 +270,33 @@ class OrderDaemon:
         Args:
             request: Order request to execute
         """
+        self._in_flight += 1
         try:
-            # Emit STARTED event
-            if self.event_bus:
-                await self.event_bus.publish(
-                    OrderEventData(
-                        event=OrderEvent.STARTED,
-                        order_id=request.token_id,
-                        timestamp=datetime.now(),
-                        order_state=None,
-                        details={
-                            "strategy_type": request.strategy_type.value,
-                            "token_id": request.token_id,
-                        },
-                    )
+            # Emit QUEUED and STARTED events in one hop
+            if self.event_bus is not None:
+                started_ts = datetime.now()
+                # Both events describe the same request, so they share one details dict
+                details = {
+                    "strategy_type": request.strategy_type.value,
+                    "token_id": request.token_id,
+                }
+                await self.event_bus.publish_many(
+                    [
+                        OrderEventData(
+                            event=OrderEvent.QUEUED,
+                            order_id=f"pending-{request.token_id}",
+                            timestamp=started_ts,
+                            order_state=None,
+                            details=details,
+                        ),
+                        OrderEventData(
+                            event=OrderEvent.STARTED,
+                            order_id=request.token_id,
+                            timestamp=started_ts,
+                            order_state=None,
+                            details=details,
+                        ),
+                    ]
                 )
 
             self.logger.info(
@@ -279,61 +308,107 @@ class OrderDaemon:
             result = await self._router.execute_order(request)
 
             # Track completion
-            if result.status.value in ["completed", "partially_filled"]:
-                self._completed_orders.append(result)
+            if result.status in _SUCCESS_STATES:
+                self._record_order(result, self._completed_orders)
                 self.logger.info(
                     f"Order completed: {result.order_id}, "
                     f"filled {result.filled_amount}/{result.total_size}"
                 )
             else:
-                self._failed_orders.append(result)
+                self._record_order(result, self._failed_orders)
                 self.logger.warning(
                     f"Order failed: {result.order_id}, status={result.status.value}"
                 )
 
             # Emit completion event
-            if self.event_bus:
-                event = (
-                    OrderEvent.COMPLETED
-                    if result.status == OrderStatus.COMPLETED
-                    else OrderEvent.FAILED
-                )
-                await self.event_bus.publish(
-                    OrderEventData(
-                        event=event,
-                        order_id=result.order_id,
-                        timestamp=datetime.now(),
-                        order_state=result,
-                        details={
-                            "filled_amount": result.filled_amount,
-                            "status": result.status.value,
-                            "strategy_type": request.strategy_type.value,
-                        },
-                    )
-                )
+            await self._emit(
+                _EVENT_FOR_STATUS.get(result.status, OrderEvent.FAILED),
+                result.order_id,
+                order_state=result,
+                filled_amount=result.filled_amount,
+                status=result.status.value,
+                strategy_type=request.strategy_type.value,
+            )
 
         except Exception as e:
             self.logger.error(f"Order execution failed: {e}", exc_info=True)
 
-            if self.event_bus:
-                await self.event_bus.publish(
-                    OrderEventData(
-                        event=OrderEvent.FAILED,
-                        order_id=request.token_id,
-                        timestamp=datetime.now(),
-                        order_state=None,
-                        details={
-                            "error": str(e),
-                            "strategy_type": request.strategy_type.value,
-                        },
-                    )
-                )
+            await self._emit(
+                OrderEvent.FAILED,
+                request.token_id,
+                error=str(e),
+                strategy_type=request.strategy_type.value,
+            )
 
         finally:
-            # Cleanup
-            self._task_semaphore.release()
-            self._active_tokens.discard(request.token_id)
-            self._active_tasks.pop(request.token_id, None)
+            # The worker releases the token once nothing is pending
+            self._in_flight -= 1
+
+    async def _emit(
+        self,
+        event: OrderEvent,
+        order_id: str,
+        order_state: Optional[Order] = None,
+        **details,
+    ) -> None:
+        """Publish an order event, doing nothing when no event bus is configured.
+
+        Args:
+            event: Event type
+            order_id: Order (or token) the event refers to
+            order_state: Optional order snapshot
+            **details: Event details
+        """
+        if self.event_bus is None:
+            return
+
+        await self.event_bus.publish(
+            OrderEventData(
+                event=event,
+                order_id=order_id,
+                timestamp=datetime.now(),
+                order_state=order_state,
+                details=details,
+            )
+        )
+
+    def _next_pending(self, token_id: str) -> Optional[OrderRequest]:
+        """Pop the next held request for a token, or release the token.
+
+        Args:
+            token_id: Token whose execution just finished
+
+        Returns:
+            Next request for the token, or None if the token is now free
+        """
+        pending = self._pending_by_token.get(token_id)
+        if not pending:
+            self._active_tokens.discard(token_id)
+            return None
+
+        request = pending.popleft()
+        if not pending:
+            del self._pending_by_token[token_id]
+        return request
+
+    def _record_order(self, order: Order, bucket: deque[Order]) -> None:
+        """Append order to a history bucket and keep the ID index in sync.
+
+        Args:
+            order: Finished order to record
+            bucket: Completed or failed history deque
+        """
+        if bucket.maxlen is not None and len(bucket) == bucket.maxlen:
+            evicted = bucket[0]
+            if self._orders_by_id.get(evicted.order_id) is evicted:
+                del self._orders_by_id[evicted.order_id]
+            self._history_filled -= evicted.filled_amount
+            self._history_size -= evicted.total_size
+
+        bucket.append(order)
+        self._orders_by_id[order.order_id] = order
+        self._history_filled += order.filled_amount
+        self._history_size += order.total_size
 
     def is_running(self) -> bool:
         """Check if daemon is running.
@@ -352,20 +427,31 @@ class OrderDaemon:
         return self._queue.qsize()
 
     def get_completed_orders(self) -> list[Order]:
-        """Get list of completed orders.
+        """Get completed orders.
 
         Returns:
             List of completed orders
         """
-        return self._completed_orders.copy()
+        return list(self._completed_orders)
 
     def get_failed_orders(self) -> list[Order]:
-        """Get list of failed orders.
+        """Get failed orders.
 
         Returns:
             List of failed orders
         """
-        return self._failed_orders.copy()
+        return list(self._failed_orders)
+
+    def get_fill_rate(self) -> float:
+        """Get the share of ordered size filled across retained history.
+
+        Returns:
+            Filled amount over total size for completed and failed orders
+            (0.0 if there is no history)
+        """
+        if self._history_size <= 0:
+            return 0.0
+        return self._history_filled / self._history_size
 
     def get_order_status(self, order_id: str) -> Optional[Order]:
         """Get order status by order ID.
@@ -376,27 +462,23 @@ class OrderDaemon:
         Returns:
             Order object if found, None otherwise
         """
-        # Search in completed orders
-        for order in self._completed_orders:
-            if order.order_id == order_id:
-                return order
-
-        # Search in failed orders
-        for order in self._failed_orders:
-            if order.order_id == order_id:
-                return order
-
-        return None
+        return self._orders_by_id.get(order_id)
 
     def clear_history(self) -> None:
         """Clear completed and failed order history."""
         self._completed_orders.clear()
         self._failed_orders.clear()
+        self._orders_by_id.clear()
+        self._history_filled = 0
+        self._history_size = 0
         self.logger.debug("Order history cleared")
 
     async def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
         """Wait for all queued orders to complete.
 
+        Requests held back behind a busy token count as queued until they
+        have executed.
+
         Args:
             timeout: Optional timeout in seconds
 
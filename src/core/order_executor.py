@@ -1,12 +1,15 @@
 """Order executor for single and iceberg order execution."""
 
+import asyncio
 import logging
 import time
+from datetime import datetime
 from typing import Optional
 
 from py_clob_client.clob_types import OrderType
 
 from api.polymarket_client import PolymarketClient
+from core.event_bus import EventBus, OrderEvent, OrderEventData
 from core.fill_tracker import FillTracker
 from models.enums import OrderStatus
 from models.order import Order
@@ -23,21 +26,29 @@ class OrderExecutor:
         logger: Optional[logging.Logger] = None,
         poll_interval: float = 2.0,
         timeout: float = 60.0,
+        min_poll_interval: float = 0.1,
+        event_bus: Optional[EventBus] = None,
     ):
         """Initialize order executor.
 
         Args:
             client: Polymarket API client
             logger: Optional logger instance
-            poll_interval: Seconds between status checks
+            poll_interval: Maximum seconds between status checks
             timeout: Maximum seconds to wait for fill
+            min_poll_interval: First delay between status checks; doubles up to
+                poll_interval while the fill is unchanged
+            event_bus: Optional event bus; fills are published as FILLED or
+                PARTIALLY_FILLED events
         """
         self.client = client
         self.logger = logger or logging.getLogger(__name__)
         self.poll_interval = poll_interval
         self.timeout = timeout
+        self.min_poll_interval = min(min_poll_interval, poll_interval)
+        self.event_bus = event_bus
 
-    def execute_single_order(
+    async def execute_single_order(
         self,
         order: Order,
         order_type: OrderType = OrderType.GTC,
@@ -73,7 +84,8 @@ class OrderExecutor:
 
         try:
             # Place order on exchange
-            response = self.client.place_order(
+            response = await asyncio.to_thread(
+                self.client.place_order,
                 token_id=order.token_id,
                 price=order.target_price,
                 size=float(order.total_size),
@@ -94,11 +106,12 @@ class OrderExecutor:
             )
 
             # Monitor order until filled or timeout
-            filled_amount = self._monitor_order(order, exchange_order_id)
+            filled_amount = await self._monitor_order(order, exchange_order_id)
 
             # Update order with fill
             if filled_amount > 0:
                 order.record_fill(filled_amount)
+                await self._publish_fill(order, filled_amount)
 
             # Final status
             if order.status == OrderStatus.COMPLETED:
@@ -145,7 +158,37 @@ class OrderExecutor:
 
             raise
 
-    def _monitor_order(self, order: Order, exchange_order_id: str) -> int:
+    async def _publish_fill(self, order: Order, amount: int) -> None:
+        """Publish a fill event, doing nothing when no event bus is configured.
+
+        Args:
+            order: Order after the fill was recorded
+            amount: Shares filled by this fill
+        """
+        if self.event_bus is None:
+            return
+
+        event = (
+            OrderEvent.FILLED
+            if order.filled_amount >= order.total_size
+            else OrderEvent.PARTIALLY_FILLED
+        )
+        await self.event_bus.publish(
+            OrderEventData(
+                event=event,
+                order_id=order.order_id,
+                timestamp=datetime.now(),
+                order_state=order,
+                details={
+                    "amount": amount,
+                    "price": order.target_price,
+                    "filled_amount": order.filled_amount,
+                    "total_size": order.total_size,
+                },
+            )
+        )
+
+    async def _monitor_order(self, order: Order, exchange_order_id: str) -> int:
         """Monitor order status until filled or timeout.
 
         Args:
@@ -155,7 +198,7 @@ class OrderExecutor:
         Returns:
             Amount filled
         """
-        return self._monitor_until_filled(
+        return await self._monitor_until_filled(
             exchange_order_id,
             order.total_size,
             context="Order",
@@ -172,19 +215,25 @@ class OrderExecutor:
         Returns:
             Filled amount as integer
         """
-        if isinstance(status_response, dict):
-            # Try common field names
-            size_matched = status_response.get("size_matched", 0)
-            if size_matched:
-                return int(float(size_matched))
+        # Common case: a dict with a non-zero "size_matched"; "filled" is the fallback
+        try:
+            value = status_response["size_matched"]
+        except (KeyError, TypeError, IndexError):
+            value = None
 
-            filled = status_response.get("filled", 0)
-            if filled:
-                return int(float(filled))
+        if not value:
+            try:
+                value = status_response["filled"]
+            except (KeyError, TypeError, IndexError):
+                return 0
+            if not value:
+                return 0
 
-        return 0
+        if type(value) is int:
+            return value
+        return int(float(value))
 
-    def _monitor_until_filled(
+    async def _monitor_until_filled(
         self,
         exchange_order_id: str,
         target_size: int,
@@ -194,51 +243,79 @@ class OrderExecutor:
         log_level: int,
     ) -> int:
         """Monitor status until filled or timeout."""
-        start_time = time.time()
+        # Bind loop-invariant lookups once; the loop runs for every poll
+        get_status = self.client.get_order_status
+        extract = self._extract_filled_amount
+        log = self.logger.log
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        to_thread = asyncio.to_thread
+        poll_interval = self.poll_interval
+        min_poll_interval = self.min_poll_interval
+        timeout = self.timeout
+
+        start_time = monotonic()
         last_log_time = start_time
+        delay = min_poll_interval
+        last_filled = 0
+        last_status: Optional[dict] = None
+        last_status_time = start_time
 
-        self.logger.log(
+        log(
             log_level,
-            f"Monitoring {context.lower()} {exchange_order_id} (timeout in {self.timeout}s)",
+            f"Monitoring {context.lower()} {exchange_order_id} (timeout in {timeout}s)",
         )
 
         while True:
-            elapsed = time.time() - start_time
+            elapsed = monotonic() - start_time
 
             # Check timeout
-            if elapsed >= self.timeout:
-                self.logger.warning(f"{context} monitoring timeout after {self.timeout}s")
+            if elapsed >= timeout:
+                self.logger.warning(f"{context} monitoring timeout after {timeout}s")
                 break
 
             try:
-                status_response = self.client.get_order_status(exchange_order_id)
-                filled_amount = self._extract_filled_amount(status_response)
+                status_response = await to_thread(get_status, exchange_order_id)
+                last_status = status_response
+                last_status_time = monotonic()
+                filled_amount = extract(status_response)
 
-                if log_progress and time.time() - last_log_time >= 10:
+                if log_progress and last_status_time - last_log_time >= 10:
                     self.logger.info(f"{context} status: {filled_amount}/{target_size} filled")
-                    last_log_time = time.time()
+                    last_log_time = last_status_time
 
                 if filled_amount >= target_size:
-                    self.logger.log(log_level, f"{context} fully filled: {filled_amount} shares")
+                    log(log_level, f"{context} fully filled: {filled_amount} shares")
                     return filled_amount
 
                 if filled_amount > 0:
-                    self.logger.log(
-                        log_level, f"{context} partial fill: {filled_amount}/{target_size}"
-                    )
+                    log(log_level, f"{context} partial fill: {filled_amount}/{target_size}")
+
+                # Poll quickly again after progress, back off while nothing changes
+                if filled_amount != last_filled:
+                    last_filled = filled_amount
+                    delay = min_poll_interval
+                    await sleep(delay)
+                    continue
 
             except Exception as e:
                 self.logger.warning(f"Error checking {context.lower()} status: {e}")
 
-            time.sleep(self.poll_interval)
+            await sleep(delay)
+            delay = min(delay * 2, poll_interval)
+
+        # The last poll is recent enough to stand in for a final check
+        if last_status is not None and monotonic() - last_status_time < poll_interval:
+            return extract(last_status)
 
         try:
-            status_response = self.client.get_order_status(exchange_order_id)
-            return self._extract_filled_amount(status_response)
+            status_response = await to_thread(get_status, exchange_order_id)
+            return extract(status_response)
         except Exception as e:
             self.logger.error(f"Failed to get final {context.lower()} status: {e}")
             return 0
-    def execute_iceberg_order(
+
+    async def execute_iceberg_order(
         self,
         order: Order,
         order_type: OrderType = OrderType.GTC,
@@ -278,6 +355,8 @@ class OrderExecutor:
 
         try:
             tranche_number = 0
+            # Monotonic time the next tranche may be placed (after the inter-tranche delay)
+            resume_at = 0.0
 
             while not tracker.is_complete():
                 tranche_number += 1
@@ -292,6 +371,11 @@ class OrderExecutor:
                 if tranche_size == 0:
                     break
 
+                # Sleep only for the part of the delay not spent preparing the tranche
+                wait = resume_at - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
                 self.logger.info(
                     f"Executing tranche {tranche_number}: {tranche_size} shares @ ${order.target_price}"
                 )
@@ -311,7 +395,8 @@ class OrderExecutor:
 
                 # Place tranche order
                 try:
-                    response = self.client.place_order(
+                    response = await asyncio.to_thread(
+                        self.client.place_order,
                         token_id=order.token_id,
                         price=order.target_price,
                         size=float(tranche_size),
@@ -322,7 +407,7 @@ class OrderExecutor:
                     exchange_order_id = self.client.extract_order_id(response)
 
                     # Monitor tranche until filled or timeout
-                    filled_amount = self._monitor_tranche(exchange_order_id, tranche_size)
+                    filled_amount = await self._monitor_tranche(exchange_order_id, tranche_size)
 
                     # Record fill in tracker
                     tracker.record_tranche_fill(
@@ -335,6 +420,7 @@ class OrderExecutor:
                     # Update order
                     if filled_amount > 0:
                         order.record_fill(filled_amount)
+                        await self._publish_fill(order, filled_amount)
 
                     log_order_event(
                         self.logger,
@@ -365,7 +451,7 @@ class OrderExecutor:
                 if not tracker.is_complete():
                     delay = strategy.calculate_inter_tranche_delay()
                     self.logger.info(f"Waiting {delay:.2f}s before next tranche...")
-                    time.sleep(delay)
+                    resume_at = time.monotonic() + delay
 
             # Final status update
             if tracker.is_complete():
@@ -423,7 +509,7 @@ class OrderExecutor:
 
             raise
 
-    def _monitor_tranche(self, exchange_order_id: str, tranche_size: int) -> int:
+    async def _monitor_tranche(self, exchange_order_id: str, tranche_size: int) -> int:
         """Monitor a single tranche until filled or timeout.
 
         Args:
@@ -434,7 +520,7 @@ class OrderExecutor:
         Returns:
             Amount filled
         """
-        return self._monitor_until_filled(
+        return await self._monitor_until_filled(
             exchange_order_id,
             tranche_size,
             context="Tranche",
@@ -1,14 +1,57 @@
 """SQLite persistence for order state and history."""
 
+import atexit
 import json
 import logging
+import queue
 import sqlite3
+import threading
+from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from models.order import Order
+from models.order import Order, StrategyParams
+
+# Compact JSON encoder bound once for event details
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Distinct strategy_params serializations remembered before the cache is reset
+_PARAMS_JSON_CACHE_SIZE = 256
+
+# Seconds to wait for a pooled reader before opening a temporary one
+_READER_WAIT_SECONDS = 0.1
+
+# Rows fetched per reader checkout by the streaming order iterators
+_READ_CHUNK_SIZE = 256
+
+# Write statements kept as constants so the connection's statement cache hits
+_SQL_UPSERT_ORDER = """
+    INSERT OR REPLACE INTO orders (
+        order_id, token_id, market_id, side, strategy_type,
+        total_size, filled_amount, remaining_amount,
+        target_price, max_price, min_price, status,
+        created_at, updated_at, adjustment_count, undercut_count,
+        strategy_params
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_FILL = """
+    INSERT INTO fills (order_id, amount, price, timestamp)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_INSERT_EVENT = """
+    INSERT INTO events (order_id, event_type, timestamp, details)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+class _ReaderConnection(sqlite3.Connection):
+    """Pooled read-only connection tagged with the pragma version applied to it."""
+
+    pragma_version = 0
 
 
 class OrderDatabase:
@@ -16,17 +59,29 @@ class OrderDatabase:
 
     Features:
     - WAL mode for better concurrency
+    - One persistent writer connection plus a pool of read-only connections,
+      so reads never wait behind a write transaction or each other
+    - Batched writes in a single transaction
     - Full order lifecycle tracking
     - Fill history
     - Event audit trail
     """
 
-    def __init__(self, db_path: str = "data/orders.db", logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        db_path: str = "data/orders.db",
+        logger: Optional[logging.Logger] = None,
+        read_connections: int = 4,
+        synchronous: str = "NORMAL",
+    ):
         """Initialize database.
 
         Args:
             db_path: Path to SQLite database file
             logger: Optional logger instance
+            read_connections: Number of pooled read-only connections (default: 4)
+            synchronous: SQLite synchronous level applied at open; "NORMAL" is
+                durable under WAL except on power loss, "FULL" fsyncs every commit
         """
         self.db_path = Path(db_path)
         self.logger = logger or logging.getLogger(__name__)
@@ -34,14 +89,157 @@ class OrderDatabase:
         # Create data directory if needed
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Single writer connection reused by every write; sqlite3 connections
+        # are not safe for concurrent use, so access is serialized. Transactions
+        # are managed explicitly (autocommit mode).
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        # Pool of read-only connections, opened once the schema exists. Under
+        # WAL they read the last committed state while the writer holds a
+        # transaction, and concurrent queries each check out their own.
+        self._read_size = max(1, read_connections)
+        self._read_pool: Optional[queue.Queue[Optional[_ReaderConnection]]] = None
+        self._busy_timeout = 5000
+        # Bumped by configure(); readers re-apply pragmas at checkout when behind
+        self._pragma_version = 0
+        atexit.register(self.close)
+
+        # strategy_params JSON keyed by field values, so it stays valid if the
+        # params object is mutated and is shared by orders with equal params
+        self._params_json_cache: dict[tuple, str] = {}
+
+        self.configure(synchronous=synchronous)
         self._init_db()
+        self._read_pool = queue.Queue()
+        for _ in range(self._read_size):
+            self._read_pool.put(self._open_reader())
+
+    def close(self):
+        """Close the database connections. Safe to call more than once.
+
+        Idle readers are closed immediately; readers in use are closed when
+        they are returned.
+        """
+        pool, self._read_pool = self._read_pool, None
+        if pool is not None:
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not None:
+                    conn.close()
+            # Wake any query waiting for a reader
+            pool.put(None)
+
+        with self._lock:
+            if self._conn is None:
+                return
+            # Refresh planner statistics for the next session
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+
+    def optimize(self):
+        """Refresh query planner statistics where SQLite judges them stale."""
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA optimize")
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """Checkpoint the WAL into the database file.
+
+        Args:
+            mode: SQLite checkpoint mode: PASSIVE, FULL, RESTART or TRUNCATE
+
+        Returns:
+            (busy, log_frames, checkpointed_frames) as reported by SQLite; busy
+            is 1 when readers or writers prevented a complete checkpoint
+
+        Raises:
+            ValueError: If mode is not a valid checkpoint mode
+        """
+        mode = mode.upper()
+        if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.ProgrammingError("Database is closed")
+            busy, log, checkpointed = self._conn.execute(
+                f"PRAGMA wal_checkpoint({mode})"
+            ).fetchone()
+        return busy, log, checkpointed
+
+    def configure(
+        self,
+        wal: bool = True,
+        synchronous: str = "NORMAL",
+        busy_timeout: int = 5000,
+    ):
+        """Apply connection pragmas.
+
+        The writer is reconfigured immediately; pooled readers pick up the
+        new settings the next time they are checked out.
+
+        Args:
+            wal: Use write-ahead logging (default: True)
+            synchronous: SQLite synchronous level, e.g. "NORMAL" or "FULL"
+            busy_timeout: Milliseconds to wait on a locked database (default: 5000)
+
+        Raises:
+            ValueError: If synchronous is not a valid SQLite level
+        """
+        synchronous = synchronous.upper()
+        if synchronous not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
+
+        self._busy_timeout = int(busy_timeout)
+        with self._lock:
+            if wal:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._conn.execute("PRAGMA wal_autocheckpoint=1000")
+            self._apply_connection_pragmas(self._conn)
+        self._pragma_version += 1
+
+    def _apply_connection_pragmas(self, conn: sqlite3.Connection):
+        """Apply the per-connection timeout and cache pragmas.
+
+        Args:
+            conn: Connection to configure
+        """
+        conn.execute(f"PRAGMA busy_timeout={self._busy_timeout}")
+        # 64 MB page cache, in-memory temp tables, 256 MB memory-mapped reads
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+    def _open_reader(self) -> _ReaderConnection:
+        """Open a read-only connection for the reader pool.
+
+        Returns:
+            _ReaderConnection: Read-only connection
+        """
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            factory=_ReaderConnection,
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_connection_pragmas(conn)
+        conn.pragma_version = self._pragma_version
+        return conn
 
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
-            # Enable WAL mode for better concurrency
-            conn.execute("PRAGMA journal_mode=WAL")
-
             # Orders table
             conn.execute(
                 """
@@ -67,10 +265,22 @@ class OrderDatabase:
             """
             )
 
-            # Indexes for common queries
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_token ON orders(token_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON orders(status)")
+            # Indexes for common queries; the composite indexes serve both the
+            # filter and the created_at ordering of active/token lookups
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_status_created ON orders(status, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_token_created ON orders(token_id, created_at DESC)"
+            )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_created ON orders(created_at)")
+            # Superseded by the composite indexes above
+            conn.execute("DROP INDEX IF EXISTS idx_token")
+            conn.execute("DROP INDEX IF EXISTS idx_status")
+
+            # Fills and events reference orders.order_id without a FOREIGN KEY:
+            # events (e.g. pending-<token> QUEUED) can be recorded before or
+            # without an order row, so enforcing the reference would reject them.
 
             # Fills table
             conn.execute(
@@ -80,8 +290,7 @@ class OrderDatabase:
                     order_id TEXT NOT NULL,
                     amount INTEGER NOT NULL,
                     price REAL NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    FOREIGN KEY (order_id) REFERENCES orders(order_id)
+                    timestamp TEXT NOT NULL
                 )
             """
             )
@@ -95,33 +304,122 @@ class OrderDatabase:
                     order_id TEXT NOT NULL,
                     event_type TEXT NOT NULL,
                     timestamp TEXT NOT NULL,
-                    details TEXT,
-                    FOREIGN KEY (order_id) REFERENCES orders(order_id)
+                    details TEXT
                 )
             """
             )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_event_order ON events(order_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_event_type ON events(event_type)")
 
+            # Gather statistics for new indexes (cheap no-op when already current)
+            conn.execute("PRAGMA optimize=0x10002")
+
         self.logger.info(f"Database initialized at {self.db_path}")
 
     @contextmanager
-    def _get_connection(self):
-        """Get database connection with auto-commit/rollback.
+    def _get_connection(self, write: bool = True):
+        """Get a shared database connection with auto-commit/rollback.
+
+        Args:
+            write: Use the writer connection inside a BEGIN IMMEDIATE transaction
+                (default: True); otherwise check out a pooled read-only connection,
+                falling back to a temporary one if the pool stays exhausted
 
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        if not write:
+            pool = self._read_pool
+            if pool is None:
+                raise sqlite3.ProgrammingError("Database is closed")
+            try:
+                conn = pool.get(timeout=_READER_WAIT_SECONDS)
+            except queue.Empty:
+                # Every reader is checked out (possibly by this thread, e.g. a
+                # nested query); don't block on them, use a one-off reader
+                self.logger.debug("Reader pool exhausted, opening a temporary reader")
+                conn = self._open_reader()
+                try:
+                    yield conn
+                finally:
+                    conn.close()
+                return
+            if conn is None:
+                # Closed while waiting; pass the wake-up on to other waiters
+                pool.put(None)
+                raise sqlite3.ProgrammingError("Database is closed")
+            try:
+                version = self._pragma_version
+                if conn.pragma_version != version:
+                    self._apply_connection_pragmas(conn)
+                    conn.pragma_version = version
+                yield conn
+            finally:
+                if self._read_pool is pool:
+                    pool.put(conn)
+                else:
+                    conn.close()
+            return
+
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                raise sqlite3.ProgrammingError("Database is closed")
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _params_json(self, params: StrategyParams) -> str:
+        """Serialize strategy params, reusing earlier output for equal values.
+
+        Args:
+            params: Strategy parameters to serialize
+
+        Returns:
+            JSON string of the parameters
+        """
+        key = tuple(params.__dict__.values())
+        data = self._params_json_cache.get(key)
+        if data is None:
+            if len(self._params_json_cache) >= _PARAMS_JSON_CACHE_SIZE:
+                self._params_json_cache.clear()
+            data = self._params_json_cache[key] = params.model_dump_json()
+        return data
+
+    def _order_row(self, order: Order, strategy_type: str) -> tuple:
+        """Build the orders table row for an order.
+
+        Args:
+            order: Order to serialize
+            strategy_type: Strategy type name
+
+        Returns:
+            Parameter tuple for the orders upsert
+        """
+        return (
+            order.order_id,
+            order.token_id,
+            order.market_id,
+            order.side.value,
+            strategy_type,
+            order.total_size,
+            order.filled_amount,
+            order.remaining_amount,
+            order.target_price,
+            order.max_price,
+            order.min_price,
+            order.status.value,
+            order.created_at.isoformat(),
+            order.updated_at.isoformat(),
+            order.adjustment_count,
+            order.undercut_count,
+            self._params_json(order.strategy_params) if order.strategy_params else None,
+        )
 
     def save_order(self, order: Order, strategy_type: str = "unknown"):
         """Save or update order.
@@ -130,41 +428,7 @@ class OrderDatabase:
             order: Order to save
             strategy_type: Strategy type name
         """
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO orders (
-                    order_id, token_id, market_id, side, strategy_type,
-                    total_size, filled_amount, remaining_amount,
-                    target_price, max_price, min_price, status,
-                    created_at, updated_at, adjustment_count, undercut_count,
-                    strategy_params
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    order.order_id,
-                    order.token_id,
-                    order.market_id,
-                    order.side.value,
-                    strategy_type,
-                    order.total_size,
-                    order.filled_amount,
-                    order.remaining_amount,
-                    order.target_price,
-                    order.max_price,
-                    order.min_price,
-                    order.status.value,
-                    order.created_at.isoformat(),
-                    order.updated_at.isoformat(),
-                    order.adjustment_count,
-                    order.undercut_count,
-                    (
-                        json.dumps(order.strategy_params.model_dump())
-                        if order.strategy_params
-                        else None
-                    ),
-                ),
-            )
+        self.write_batch(orders=[(order, strategy_type)])
 
     def record_fill(self, order_id: str, amount: int, price: float):
         """Record a fill.
@@ -174,14 +438,7 @@ class OrderDatabase:
             amount: Fill amount
             price: Fill price
         """
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO fills (order_id, amount, price, timestamp)
-                VALUES (?, ?, ?, ?)
-            """,
-                (order_id, amount, price, datetime.now().isoformat()),
-            )
+        self.write_batch(fills=[(order_id, amount, price, datetime.now())])
 
     def record_event(self, order_id: str, event_type: str, details: dict):
         """Record an event.
@@ -191,14 +448,114 @@ class OrderDatabase:
             event_type: Event type name
             details: Event details dictionary
         """
+        self.write_batch(events=[(order_id, event_type, details, datetime.now())])
+
+    def write_batch(
+        self,
+        orders: Optional[list[tuple[Order, str]]] = None,
+        fills: Optional[list[tuple[str, int, float, datetime]]] = None,
+        events: Optional[list[tuple[str, str, dict, datetime]]] = None,
+    ):
+        """Write orders, fills and events in a single transaction.
+
+        Args:
+            orders: (order, strategy_type) pairs to save or update
+            fills: (order_id, amount, price, timestamp) fills to record
+            events: (order_id, event_type, details, timestamp) events to record
+        """
+        if not (orders or fills or events):
+            return
+
+        # Rows published together share one datetime object; format each once.
+        # Keyed by identity, which is stable while the batch holds the objects.
+        stamps: dict[int, str] = {}
+
+        def iso(timestamp: datetime) -> str:
+            text = stamps.get(id(timestamp))
+            if text is None:
+                text = stamps[id(timestamp)] = timestamp.isoformat()
+            return text
+
+        # Serialize rows before taking the connection lock
+        order_rows = [
+            self._order_row(order, strategy_type) for order, strategy_type in orders or ()
+        ]
+        fill_rows = [
+            (order_id, amount, price, iso(timestamp))
+            for order_id, amount, price, timestamp in fills or ()
+        ]
+        event_rows = [
+            (order_id, event_type, iso(timestamp), _dumps(details))
+            for order_id, event_type, details, timestamp in events or ()
+        ]
+
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO events (order_id, event_type, timestamp, details)
-                VALUES (?, ?, ?, ?)
-            """,
-                (order_id, event_type, datetime.now().isoformat(), json.dumps(details)),
-            )
+            if order_rows:
+                conn.executemany(_SQL_UPSERT_ORDER, order_rows)
+            if fill_rows:
+                conn.executemany(_SQL_INSERT_FILL, fill_rows)
+            if event_rows:
+                conn.executemany(_SQL_INSERT_EVENT, event_rows)
+
+    def _iter_orders(
+        self,
+        conditions: list[str],
+        params: tuple,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Stream orders by creation time, checking out a reader per chunk.
+
+        Pages with a (created_at, order_id) keyset, so no pooled reader is held
+        while the caller consumes rows and writes between chunks don't cause
+        rows to be skipped or repeated.
+
+        Args:
+            conditions: SQL conditions ANDed into the WHERE clause
+            params: Parameters for the conditions
+            descending: Newest first instead of oldest first
+            limit: Maximum number of orders to yield (default: no limit)
+
+        Yields:
+            Order dictionaries
+        """
+        direction, after = ("DESC", "<") if descending else ("ASC", ">")
+        order_by = f"ORDER BY created_at {direction}, order_id {direction} LIMIT ?"
+        first_where = " AND ".join(conditions) or "1"
+        next_where = " AND ".join([*conditions, f"(created_at, order_id) {after} (?, ?)"])
+
+        remaining = limit
+        last_key: Optional[tuple[str, str]] = None
+        while remaining is None or remaining > 0:
+            size = _READ_CHUNK_SIZE if remaining is None else min(_READ_CHUNK_SIZE, remaining)
+            with self._get_connection(write=False) as conn:
+                if last_key is None:
+                    rows = conn.execute(
+                        f"SELECT * FROM orders WHERE {first_where} {order_by}", (*params, size)
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        f"SELECT * FROM orders WHERE {next_where} {order_by}",
+                        (*params, *last_key, size),
+                    ).fetchall()
+
+            for row in rows:
+                yield dict(row)
+            if len(rows) < size:
+                return
+            last_key = (rows[-1]["created_at"], rows[-1]["order_id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def iter_active_orders(self) -> Iterator[dict]:
+        """Stream active orders without materializing the full result.
+
+        Rows are fetched in chunks; no reader is held between chunks.
+
+        Yields:
+            Order dictionaries, oldest first
+        """
+        return self._iter_orders(["status IN ('queued', 'active', 'partially_filled')"], ())
 
     def load_active_orders(self) -> list[dict]:
         """Load active orders on startup.
@@ -206,15 +563,25 @@ class OrderDatabase:
         Returns:
             List of order dictionaries
         """
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM orders
-                WHERE status IN ('queued', 'active', 'partially_filled')
-                ORDER BY created_at
-            """
-            ).fetchall()
-            return [dict(row) for row in rows]
+        return list(self.iter_active_orders())
+
+    def iter_order_history(
+        self, token_id: Optional[str] = None, limit: int = 100
+    ) -> Iterator[dict]:
+        """Stream order history without materializing the full result.
+
+        Rows are fetched in chunks; no reader is held between chunks.
+
+        Args:
+            token_id: Optional token filter
+            limit: Maximum number of orders to return
+
+        Yields:
+            Order dictionaries, newest first
+        """
+        if token_id:
+            return self._iter_orders(["token_id = ?"], (token_id,), descending=True, limit=limit)
+        return self._iter_orders([], (), descending=True, limit=limit)
 
     def get_order_history(self, token_id: Optional[str] = None, limit: int = 100) -> list[dict]:
         """Query order history.
@@ -226,27 +593,7 @@ class OrderDatabase:
         Returns:
             List of order dictionaries
         """
-        with self._get_connection() as conn:
-            if token_id:
-                rows = conn.execute(
-                    """
-                    SELECT * FROM orders
-                    WHERE token_id = ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """,
-                    (token_id, limit),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """
-                    SELECT * FROM orders
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """,
-                    (limit,),
-                ).fetchall()
-            return [dict(row) for row in rows]
+        return list(self.iter_order_history(token_id, limit))
 
     def get_fills(self, order_id: str) -> list[dict]:
         """Get fills for an order.
@@ -257,7 +604,7 @@ class OrderDatabase:
         Returns:
             List of fill dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM fills
@@ -277,7 +624,7 @@ class OrderDatabase:
         Returns:
             List of event dictionaries
         """
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM events
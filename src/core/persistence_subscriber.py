@@ -1,5 +1,6 @@
 """Event subscriber for persisting order data to database."""
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -12,46 +13,196 @@ class PersistenceSubscriber:
 
     Features:
     - Saves order state on every event
+    - Coalesces bursts of events into one transaction once started
+    - Bounded backlog that drops the oldest events when the writer falls behind
     - Records event audit trail
     - Records fills separately
+    - Periodic WAL checkpoints to keep the log small
     - Graceful error handling
     """
 
-    def __init__(self, db: OrderDatabase, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        db: OrderDatabase,
+        logger: Optional[logging.Logger] = None,
+        batch_size: int = 128,
+        flush_interval: float = 0.02,
+        checkpoint_every: int = 100,
+        max_queue_size: int = 10_000,
+    ):
         """Initialize persistence subscriber.
 
         Args:
             db: Order database instance
             logger: Optional logger instance
+            batch_size: Maximum events written per transaction (default: 128)
+            flush_interval: Seconds to wait for more events before writing (default: 0.02)
+            checkpoint_every: Batches written between passive WAL checkpoints;
+                0 disables them (default: 100)
+            max_queue_size: Events buffered before the oldest are dropped
+                (default: 10000)
         """
         self.db = db
         self.logger = logger or logging.getLogger(__name__)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.checkpoint_every = checkpoint_every
+
+        self._queue: asyncio.Queue[OrderEventData] = asyncio.Queue(maxsize=max_queue_size)
+        self._dropped = 0
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start batching events in a background flusher."""
+        if self._flusher_task is not None:
+            return
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flusher and write any events still queued."""
+        if self._flusher_task is None:
+            return
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        self._flusher_task = None
+
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._write(batch)
 
     async def handle_event(self, event_data: OrderEventData):
         """Handle order event by persisting.
 
+        Events are queued for the flusher when started, otherwise written
+        immediately.
+
         Args:
             event_data: Event data to persist
         """
+        if self._flusher_task is None:
+            await self._write([event_data])
+            return
+
+        if self._queue.full():
+            # Writer is behind: keep the newest state, drop the oldest event
+            self._queue.get_nowait()
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                self.logger.warning(
+                    f"Persistence queue full, dropped {self._dropped} oldest events so far"
+                )
+        self._queue.put_nowait(event_data)
+
+    async def _flush_loop(self):
+        """Drain queued events into batches of up to batch_size."""
+        loop = asyncio.get_running_loop()
+        flushes = 0
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            try:
+                while len(batch) < self.batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Stopping: don't drop the events already taken off the queue
+                await self._write(batch)
+                raise
+
+            await self._write(batch)
+
+            flushes += 1
+            if self.checkpoint_every and flushes % self.checkpoint_every == 0:
+                await self._checkpoint()
+
+    async def _checkpoint(self):
+        """Run a passive WAL checkpoint and log how far it got."""
         try:
-            # Only save order state if order exists
+            busy, log, checkpointed = await asyncio.to_thread(self.db.checkpoint)
+        except Exception as e:
+            self.logger.error(f"WAL checkpoint failed: {e}")
+            return
+
+        if busy or checkpointed < log:
+            self.logger.warning(
+                f"WAL checkpoint incomplete (busy={busy}, log={log}, "
+                f"checkpointed={checkpointed})"
+            )
+        else:
+            self.logger.debug(f"WAL checkpoint: {checkpointed}/{log} frames")
+
+    async def _write(self, batch: list[OrderEventData]):
+        """Persist a batch of events in one transaction.
+
+        If the transaction fails, the events are retried one at a time so
+        only the ones that can't be written are dropped.
+
+        Args:
+            batch: Events to persist, in publish order
+        """
+        try:
+            await asyncio.to_thread(self.db.write_batch, **self._batch_rows(batch))
+            self.logger.debug(f"Persisted {len(batch)} events")
+
+        except Exception as e:
+            if len(batch) == 1:
+                event_data = batch[0]
+                self.logger.error(
+                    f"Failed to persist {event_data.event.value} event "
+                    f"for {event_data.order_id}: {e}"
+                )
+                return
+
+            # The transaction rolled back, so retrying can't duplicate rows
+            self.logger.warning(f"Batch of {len(batch)} events failed ({e}), retrying singly")
+            for event_data in batch:
+                await self._write([event_data])
+
+    @staticmethod
+    def _batch_rows(batch: list[OrderEventData]) -> dict[str, list]:
+        """Build write_batch rows for a batch of events.
+
+        Args:
+            batch: Events to persist, in publish order
+
+        Returns:
+            orders, fills and events keyword arguments for write_batch
+        """
+        # Only the latest state of each order needs saving
+        orders = {}
+        fills = []
+        events = []
+        for event_data in batch:
             if event_data.order_state:
-                self.db.save_order(
+                orders[event_data.order_state.order_id] = (
                     event_data.order_state,
-                    strategy_type=event_data.details.get("strategy_type", "unknown"),
+                    event_data.details.get("strategy_type", "unknown"),
                 )
 
-            # Record event
-            self.db.record_event(event_data.order_id, event_data.event.value, event_data.details)
-
-            # Record fills
             if event_data.event in [OrderEvent.FILLED, OrderEvent.PARTIALLY_FILLED]:
                 amount = event_data.details.get("amount", 0)
                 price = event_data.details.get("price", 0)
                 if amount > 0:
-                    self.db.record_fill(event_data.order_id, amount, price)
+                    fills.append((event_data.order_id, amount, price, event_data.timestamp))
 
-            self.logger.debug(f"Persisted {event_data.event.value} for {event_data.order_id}")
+            events.append(
+                (
+                    event_data.order_id,
+                    event_data.event.value,
+                    event_data.details,
+                    event_data.timestamp,
+                )
+            )
 
-        except Exception as e:
-            self.logger.error(f"Failed to persist event: {e}")
+        return {"orders": list(orders.values()), "fills": fills, "events": events}
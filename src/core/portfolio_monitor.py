@@ -3,15 +3,40 @@
 import asyncio
 import logging
 from datetime import datetime
-from threading import RLock
-from typing import Optional
+from itertools import islice
+from threading import Lock
+from typing import Optional, Union
 
 import httpx
+from pydantic import BaseModel, Field, TypeAdapter
 
 from api.polymarket_client import PolymarketClient
+from core.event_bus import OrderEventData
+from models.enums import OrderSide
 from models.market_metadata import MarketMetadata, TokenInfo
 from models.position import Position
 
+# Maximum concurrent market metadata requests
+_MAX_METADATA_REQUESTS = 5
+
+
+class _PositionPayload(BaseModel):
+    """Position entry as returned by the Data API; unknown fields are ignored."""
+
+    token_id: Optional[Union[str, int]] = Field(default=None, alias="asset")
+    market_id: Optional[str] = Field(default=None, alias="conditionId")
+    title: Optional[str] = None
+    outcome: Optional[str] = None
+    size: Optional[float] = None
+    avg_price: Optional[float] = Field(default=None, alias="avgPrice")
+    current_price: Optional[float] = Field(default=None, alias="curPrice")
+    cash_pnl: Optional[float] = Field(default=None, alias="cashPnl")
+    redeemable: Optional[bool] = None
+
+
+# Validator for the positions response, built once
+_POSITIONS_ADAPTER = TypeAdapter(list[_PositionPayload])
+
 
 class PortfolioMonitor:
     """Background daemon that polls Polymarket API to maintain portfolio cache.
@@ -22,7 +47,13 @@ class PortfolioMonitor:
     - Current positions calculated from trades
     - Market metadata (token_id -> question mapping) with TTL caching
 
-    All data access is thread-safe using RLock for synchronization.
+    Caches are copy-on-write: updates publish a new dict instead of mutating
+    the current one, so snapshot reads are a lock-free reference read. A Lock
+    serializes the writers.
+
+    Positions can also be kept current from fill events via apply_fill, in
+    which case the Data API only needs polling every positions_refresh_interval
+    seconds to reconcile drift.
 
     Example:
         async with PortfolioMonitor(client, poll_interval=10.0) as monitor:
@@ -36,6 +67,8 @@ class PortfolioMonitor:
         client: PolymarketClient,
         poll_interval: float = 10.0,
         logger: Optional[logging.Logger] = None,
+        max_metadata_entries: int = 2048,
+        positions_refresh_interval: Optional[float] = None,
     ):
         """Initialize portfolio monitor.
 
@@ -43,20 +76,39 @@ class PortfolioMonitor:
             client: Polymarket API client
             poll_interval: Polling interval in seconds (default: 10.0)
             logger: Optional logger instance
+            max_metadata_entries: Token metadata entries kept before the least
+                recently fetched are evicted (default: 2048)
+            positions_refresh_interval: Seconds between Data API position
+                fetches; None fetches on every poll (default: None)
         """
         self.client = client
         self.poll_interval = poll_interval
+        self.max_metadata_entries = max_metadata_entries
+        self.positions_refresh_interval = positions_refresh_interval
         self.logger = logger or logging.getLogger(__name__)
 
-        # Thread-safe cache with RLock
-        self._cache_lock = RLock()
+        # Copy-on-write caches; writers replace whole dicts under the lock
+        self._cache_lock = Lock()
         self._orders: dict[str, dict] = {}
         self._positions: dict[str, Position] = {}
         self._market_metadata: dict[str, MarketMetadata] = {}
 
+        # Reverse index from order asset_id to condition_id, rebuilt with orders
+        self._asset_to_condition: dict[str, Optional[str]] = {}
+
         # Timestamps for cache freshness tracking
         self._last_orders_update: Optional[datetime] = None
         self._last_positions_update: Optional[datetime] = None
+        self._last_positions_fetch: Optional[float] = None
+
+        # Shared HTTP client for Data API calls (created on first use)
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # Caps concurrent market metadata requests to respect rate limits
+        self._metadata_semaphore = asyncio.Semaphore(_MAX_METADATA_REQUESTS)
+
+        # In-flight metadata fetches by condition_id, shared by concurrent callers
+        self._metadata_fetches: dict[str, asyncio.Task] = {}
 
         # Daemon state
         self._running = False
@@ -99,6 +151,15 @@ class PortfolioMonitor:
             except asyncio.CancelledError:
                 self.logger.debug("Monitoring task cancelled")
 
+        # Abandon metadata fetches still in flight
+        for task in list(self._metadata_fetches.values()):
+            task.cancel()
+
+        # Close pooled HTTP connections
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
         self.logger.info("Portfolio monitor stopped")
 
     async def _monitor_loop(self) -> None:
@@ -111,13 +172,14 @@ class PortfolioMonitor:
 
         while self._running:
             try:
-                # Update orders
-                await self._update_orders()
-
-                # Update positions
-                await self._update_positions()
-
-                # Refresh stale metadata (non-blocking, best effort)
+                # Update orders and positions concurrently (each handles its own errors)
+                if self._positions_refresh_due():
+                    await asyncio.gather(self._update_orders(), self._update_positions())
+                else:
+                    await self._update_orders()
+
+                # Refresh stale metadata (non-blocking, best effort); runs after the
+                # updates since it looks up condition IDs in the fresh caches
                 await self._refresh_stale_metadata()
 
             except Exception as e:
@@ -129,6 +191,67 @@ class PortfolioMonitor:
 
         self.logger.info("Monitor loop stopped")
 
+    def _positions_refresh_due(self) -> bool:
+        """Check whether positions should be fetched from the Data API this cycle.
+
+        Returns:
+            True if no refresh interval is set or it has elapsed
+        """
+        now = asyncio.get_running_loop().time()
+        last = self._last_positions_fetch
+        if (
+            self.positions_refresh_interval is None
+            or last is None
+            or now - last >= self.positions_refresh_interval
+        ):
+            self._last_positions_fetch = now
+            return True
+        return False
+
+    async def apply_fill(self, event_data: OrderEventData) -> None:
+        """Apply a fill event to the cached positions.
+
+        Intended as an event bus subscriber for FILLED and PARTIALLY_FILLED
+        events, so positions track our own trades between Data API refreshes.
+
+        Args:
+            event_data: Fill event with the order state and fill details
+        """
+        order = event_data.order_state
+        amount = event_data.details.get("amount", 0)
+        if order is None or amount <= 0:
+            return
+        price = event_data.details.get("price") or order.target_price
+
+        with self._cache_lock:
+            position = self._positions.get(order.token_id)
+            if position is None:
+                if order.side != OrderSide.BUY:
+                    # Selling shares we don't track; the next refresh reconciles
+                    return
+                position = Position(
+                    token_id=order.token_id,
+                    market_id=order.market_id,
+                    outcome="Unknown",
+                )
+            else:
+                # Published positions are shared with readers; update a copy
+                position = position.model_copy()
+
+            if order.side == OrderSide.BUY:
+                position.add_buy(amount, float(price))
+            else:
+                position.add_sell(amount)
+
+            new_positions = self._positions.copy()
+            if position.is_empty():
+                new_positions.pop(order.token_id, None)
+            else:
+                new_positions[order.token_id] = position
+            self._positions = new_positions
+
+        self.logger.debug(f"Applied {order.side.value} fill of {amount} to {order.token_id[:8]}")
+
     async def _update_orders(self) -> None:
         """Fetch all open orders and update cache.
 
@@ -139,9 +262,14 @@ class PortfolioMonitor:
             # Call synchronous API in thread pool
             orders = await asyncio.to_thread(self.client.get_orders)
 
-            # Update cache atomically
+            # Build outside the lock, then publish with a single swap
+            new_orders = {o["id"]: o for o in orders}
+            asset_to_condition = {
+                o["asset_id"]: o.get("market") for o in orders if o.get("asset_id")
+            }
             with self._cache_lock:
-                self._orders = {o["id"]: o for o in orders}
+                self._orders = new_orders
+                self._asset_to_condition = asset_to_condition
                 self._last_orders_update = datetime.now()
 
             self.logger.info(f"Updated {len(orders)} orders")
@@ -180,78 +308,52 @@ class PortfolioMonitor:
             }
 
             self.logger.debug(f"Fetching positions for wallet: {wallet_address}")
-            response = await asyncio.to_thread(lambda: httpx.get(url, params=params, timeout=10))
+            response = await self._get_http().get(url, params=params)
             response.raise_for_status()
-            raw_data = response.json()
-
-            # Debug: Log the response structure
-            self.logger.info(f"API Response type: {type(raw_data)}")
-            if isinstance(raw_data, dict):
-                self.logger.info(f"Response keys: {list(raw_data.keys())}")
-                # If data is wrapped in a dict, extract the positions array
-                data = raw_data.get("data", raw_data.get("positions", raw_data))
+            content = response.content
+            if content.lstrip()[:1] == b"[":
+                # Decode and validate the JSON bytes in one schema-driven pass
+                entries = _POSITIONS_ADAPTER.validate_json(content)
             else:
-                data = raw_data
-            self.logger.info(f"Positions count in response: {len(data) if data else 0}")
+                # If data is wrapped in a dict, extract the positions array
+                raw_data = response.json()
+                self.logger.info(f"Response keys: {list(raw_data.keys())}")
+                entries = _POSITIONS_ADAPTER.validate_python(
+                    raw_data.get("data", raw_data.get("positions", []))
+                )
+            self.logger.info(f"Positions count in response: {len(entries)}")
 
-            if not data:
+            if not entries:
                 self.logger.info("No positions found for wallet")
                 with self._cache_lock:
                     self._positions = {}
                     self._last_positions_update = datetime.now()
                 return
 
-            # Parse positions from API response
+            # Build positions, skipping missing-asset, zero-size and
+            # resolved/redeemable entries
             positions: dict[str, Position] = {}
+            skipped = 0
 
-            for position_data in data:
-                # Extract position details - using correct field names from API
-                token_id = position_data.get("asset")  # API uses 'asset' not 'asset_id'
-                if not token_id:
-                    self.logger.debug(
-                        f"Skipping position without asset: {list(position_data.keys())}"
-                    )
-                    continue
-
-                # Get position size
-                size = float(position_data.get("size", 0))
-                if size <= 0:
-                    self.logger.debug(f"Skipping position with zero/negative size: {size}")
+            for entry in entries:
+                if not entry.token_id or entry.redeemable or (entry.size or 0.0) <= 0:
+                    skipped += 1
                     continue
 
-                # Skip resolved/redeemable positions
-                is_redeemable = position_data.get("redeemable", False)
-                if is_redeemable:
-                    self.logger.debug(
-                        f"Skipping resolved position: {position_data.get('title', 'Unknown')[:50]}"
-                    )
-                    continue
-
-                # Parse other fields with correct API field names
-                market_id = position_data.get("conditionId")  # API uses 'conditionId'
-                outcome = position_data.get("outcome", "Unknown")
-                market_question = position_data.get("title", "Unknown")  # API uses 'title'
-
-                # Price information
-                avg_price = float(position_data.get("avgPrice", 0))  # API uses 'avgPrice'
-                current_price = float(position_data.get("curPrice", 0))  # API uses 'curPrice'
-
-                # P&L information
-                cash_pnl = float(position_data.get("cashPnl", 0))  # API provides 'cashPnl'
-
-                # Create position object
-                pos = Position(
-                    token_id=str(token_id),
-                    market_id=market_id,
-                    question=market_question,
-                    outcome=outcome,
-                    total_shares=size,
-                    avg_entry_price=avg_price,
-                    current_price=current_price,
-                    unrealized_pnl=cash_pnl,  # Use API's calculated P&L
+                token_id = str(entry.token_id)
+                positions[token_id] = Position(
+                    token_id=token_id,
+                    market_id=entry.market_id,
+                    question=entry.title or "Unknown",
+                    outcome=entry.outcome or "Unknown",
+                    total_shares=entry.size,
+                    avg_entry_price=entry.avg_price or 0.0,
+                    current_price=entry.current_price or 0.0,
+                    unrealized_pnl=entry.cash_pnl or 0.0,  # Use API's calculated P&L
                 )
 
-                positions[str(token_id)] = pos
+            if skipped:
+                self.logger.debug(f"Skipped {skipped} empty, zero-size or resolved positions")
 
             # Update cache atomically
             with self._cache_lock:
@@ -264,17 +366,28 @@ class PortfolioMonitor:
             self.logger.warning(f"Failed to update positions: {e}")
             # Keep stale cache on error
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, creating it if needed.
+
+        Returns:
+            Keep-alive HTTP client reused across poll cycles
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+        return self._http
+
     async def _refresh_stale_metadata(self) -> None:
         """Refresh market metadata that's older than TTL.
 
         Checks for stale metadata and refreshes up to 5 entries per cycle
-        to avoid rate limits. This is best-effort and won't block if it fails.
+        concurrently to avoid rate limits. This is best-effort and won't block
+        if it fails.
         """
         try:
-            with self._cache_lock:
-                stale_tokens = [
-                    tid for tid, meta in self._market_metadata.items() if meta.is_stale()
-                ]
+            stale_tokens = [tid for tid, meta in self._market_metadata.items() if meta.is_stale()]
 
             if not stale_tokens:
                 return
@@ -283,11 +396,14 @@ class PortfolioMonitor:
             refresh_count = min(5, len(stale_tokens))
             self.logger.debug(f"Refreshing {refresh_count} stale metadata entries")
 
-            for token_id in stale_tokens[:refresh_count]:
-                try:
-                    await self.get_market_question(token_id)
-                except Exception as e:
-                    self.logger.warning(f"Failed to refresh metadata for {token_id[:8]}: {e}")
+            batch = stale_tokens[:refresh_count]
+            results = await asyncio.gather(
+                *(self.get_market_question(token_id) for token_id in batch),
+                return_exceptions=True,
+            )
+            for token_id, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self.logger.warning(f"Failed to refresh metadata for {token_id[:8]}: {result}")
 
         except Exception as e:
             self.logger.warning(f"Failed to refresh stale metadata: {e}")
@@ -296,7 +412,9 @@ class PortfolioMonitor:
         """Get human-readable market question for a token ID.
 
         Lazy loads market metadata from API if not cached or stale.
-        Uses order data to find the condition_id for API lookup.
+        Uses order data to find the condition_id for API lookup. Metadata
+        past its soft TTL is served from cache while one background fetch
+        refreshes it, and concurrent misses for a market share one fetch.
 
         Args:
             token_id: Token ID to lookup
@@ -304,101 +422,174 @@ class PortfolioMonitor:
         Returns:
             Market question string or error message
         """
-        # Check cache first
-        with self._cache_lock:
-            if token_id in self._market_metadata:
-                metadata = self._market_metadata[token_id]
-                if not metadata.is_stale():
-                    return metadata.question
+        # Check cache first (lock-free read of the published dict)
+        metadata = self._market_metadata.get(token_id)
+        if metadata is not None and not metadata.is_stale():
+            if metadata.is_expiring():
+                self._fetch_market(metadata.condition_id)
+            return metadata.question
 
         # Cache miss or stale - need to fetch
         # Strategy: Extract condition_id from order data
-        condition_id = None
-        with self._cache_lock:
-            for order in self._orders.values():
-                if order.get("asset_id") == token_id:
-                    condition_id = order.get("market")
-                    break
+        condition_id = self._asset_to_condition.get(token_id)
 
-            # Also check positions if not found in orders
-            if not condition_id and token_id in self._positions:
-                condition_id = self._positions[token_id].market_id
+        # Also check positions if not found in orders
+        if not condition_id:
+            position = self._positions.get(token_id)
+            if position is not None:
+                condition_id = position.market_id
 
         if not condition_id:
             return f"Unknown Market ({token_id[:8]}...)"
 
         # Fetch market metadata from API
         try:
-            market = await asyncio.to_thread(self.client.client.get_market, condition_id)
+            # Shield so one caller's cancellation doesn't abort the shared fetch
+            metadata = await asyncio.shield(self._fetch_market(condition_id))
+            return metadata.question
 
-            # Parse market data
-            question = market.get("question", "Unknown")
-            outcomes = market.get("outcomes", [])
-            tokens_data = market.get("tokens", [])
-
-            # Build token info list
-            tokens = []
-            for i, token_data in enumerate(tokens_data):
-                token_info = TokenInfo(
-                    token_id=token_data.get("token_id", ""),
-                    outcome=outcomes[i] if i < len(outcomes) else "Unknown",
-                )
-                tokens.append(token_info)
-
-            # Create metadata object
-            metadata = MarketMetadata(
-                condition_id=condition_id,
-                question=question,
-                tokens=tokens,
-                end_date=market.get("end_date_iso"),
-            )
+        except Exception as e:
+            self.logger.error(f"Failed to fetch market metadata for {token_id[:8]}: {e}")
+            return f"Error loading market ({token_id[:8]}...)"
 
-            # Cache metadata for all tokens in this market
-            with self._cache_lock:
-                for token in tokens:
-                    if token.token_id:
-                        self._market_metadata[token.token_id] = metadata
+    def _fetch_market(self, condition_id: str) -> asyncio.Task:
+        """Get the in-flight metadata fetch for a market, starting one if needed.
 
-                # Also update position outcome if we have this position
-                if token_id in self._positions:
-                    outcome = metadata.get_token_outcome(token_id)
-                    if outcome:
-                        self._positions[token_id].outcome = outcome
-                        self._positions[token_id].question = question
+        Args:
+            condition_id: Market condition ID
 
-            self.logger.debug(f"Cached metadata for market: {question[:50]}...")
-            return question
+        Returns:
+            Task resolving to the market's MarketMetadata
+        """
+        task = self._metadata_fetches.get(condition_id)
+        if task is None:
+            task = asyncio.create_task(self._load_market_metadata(condition_id))
+            self._metadata_fetches[condition_id] = task
+            task.add_done_callback(lambda done: self._finish_market_fetch(condition_id, done))
+        return task
 
-        except Exception as e:
-            self.logger.error(f"Failed to fetch market metadata for {token_id[:8]}: {e}")
-            return f"Error loading market ({token_id[:8]}...)"
+    def _finish_market_fetch(self, condition_id: str, task: asyncio.Task) -> None:
+        """Forget a completed metadata fetch.
+
+        Args:
+            condition_id: Market condition ID
+            task: Completed fetch task
+        """
+        self._metadata_fetches.pop(condition_id, None)
+        # Mark background failures as retrieved; awaiting callers log them
+        if not task.cancelled():
+            task.exception()
+
+    async def _load_market_metadata(self, condition_id: str) -> MarketMetadata:
+        """Fetch market metadata from the API and publish it to the cache.
+
+        Args:
+            condition_id: Market condition ID
+
+        Returns:
+            Fetched MarketMetadata
+        """
+        async with self._metadata_semaphore:
+            market = await asyncio.to_thread(self.client.client.get_market, condition_id)
+
+        # Parse market data
+        question = market.get("question", "Unknown")
+        outcomes = market.get("outcomes", [])
+        tokens_data = market.get("tokens", [])
+
+        # Build token info list
+        tokens = []
+        for i, token_data in enumerate(tokens_data):
+            token_info = TokenInfo(
+                token_id=token_data.get("token_id", ""),
+                outcome=outcomes[i] if i < len(outcomes) else "Unknown",
+            )
+            tokens.append(token_info)
+
+        # Create metadata object
+        metadata = MarketMetadata(
+            condition_id=condition_id,
+            question=question,
+            tokens=tokens,
+            end_date=market.get("end_date_iso"),
+        )
+
+        # Cache metadata for all tokens in this market (copy-then-swap so
+        # published snapshots are never mutated)
+        with self._cache_lock:
+            new_metadata = self._market_metadata.copy()
+            for token in tokens:
+                if token.token_id:
+                    # Re-insert so dict order runs least to most recently fetched
+                    new_metadata.pop(token.token_id, None)
+                    new_metadata[token.token_id] = metadata
+
+            # Bound memory in long runs by evicting the oldest entries
+            excess = len(new_metadata) - self.max_metadata_entries
+            if excess > 0:
+                for evicted in list(islice(new_metadata, excess)):
+                    del new_metadata[evicted]
+            self._market_metadata = new_metadata
+
+            # Also update outcomes of positions held in this market, swapping
+            # in updated copies since readers may hold the published ones
+            new_positions = None
+            for token in tokens:
+                position = self._positions.get(token.token_id)
+                if position is not None:
+                    if new_positions is None:
+                        new_positions = self._positions.copy()
+                    new_positions[token.token_id] = position.model_copy(
+                        update={"outcome": token.outcome, "question": question}
+                    )
+            if new_positions is not None:
+                self._positions = new_positions
+
+        self.logger.debug(f"Cached metadata for market: {question[:50]}...")
+        return metadata
 
     def get_orders_snapshot(self) -> dict[str, dict]:
         """Get thread-safe snapshot of current orders.
 
+        The returned dict is shared and must be treated as read-only.
+
         Returns:
             Dictionary mapping order_id to order data
         """
-        with self._cache_lock:
-            return self._orders.copy()
+        return self._orders
 
     def get_positions_snapshot(self) -> dict[str, Position]:
         """Get thread-safe snapshot of current positions.
 
+        The returned dict is shared and must be treated as read-only.
+
         Returns:
             Dictionary mapping token_id to Position objects
         """
-        with self._cache_lock:
-            return self._positions.copy()
+        return self._positions
+
+    def get_position(self, token_id: str) -> Optional[Position]:
+        """Get the cached position for a single token.
+
+        The returned Position is shared and must be treated as read-only.
+
+        Args:
+            token_id: Token ID to look up
+
+        Returns:
+            Position for the token, or None if none is held
+        """
+        return self._positions.get(token_id)
 
     def get_metadata_snapshot(self) -> dict[str, MarketMetadata]:
         """Get thread-safe snapshot of cached market metadata.
 
+        The returned dict is shared and must be treated as read-only.
+
         Returns:
             Dictionary mapping token_id to MarketMetadata objects
         """
-        with self._cache_lock:
-            return self._market_metadata.copy()
+        return self._market_metadata
 
     def get_last_update_time(self) -> tuple[Optional[datetime], Optional[datetime]]:
         """Get timestamps of last cache updates.
@@ -418,11 +609,11 @@ class PortfolioMonitor:
         Returns:
             True if data is stale or not yet populated
         """
-        with self._cache_lock:
-            if not self._last_orders_update:
-                return True
-            age = (datetime.now() - self._last_orders_update).total_seconds()
-            return age > max_age_seconds
+        last_update = self._last_orders_update
+        if not last_update:
+            return True
+        age = (datetime.now() - last_update).total_seconds()
+        return age > max_age_seconds
 
     def is_running(self) -> bool:
         """Check if daemon is running.
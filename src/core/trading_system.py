@@ -16,6 +16,10 @@ from core.persistence import OrderDatabase
 from core.persistence_subscriber import PersistenceSubscriber
 from core.portfolio_monitor import PortfolioMonitor
 
+# Readers kept pooled regardless of max_concurrent_orders, so nested and
+# streaming reads don't run the pool dry when only one order runs at a time
+_MIN_READ_CONNECTIONS = 4
+
 
 class TradingSystem:
     """Main trading system that integrates all components.
@@ -60,13 +64,22 @@ class TradingSystem:
         # Initialize components
         self.client = PolymarketClient(self.config, self.logger)
         self.event_bus = EventBus(self.logger)
-        self.db = OrderDatabase(self.config.db_path, self.logger)
-        self.portfolio_monitor = PortfolioMonitor(self.client, self.logger)
+        # One writer plus a read-only connection per concurrent order slot, with a floor
+        self.db = OrderDatabase(
+            self.config.db_path,
+            self.logger,
+            read_connections=max(_MIN_READ_CONNECTIONS, self.config.max_concurrent_orders),
+            synchronous=self.config.db_synchronous,
+        )
+        # Our own fills update positions between Data API polls; the polls still
+        # run every cycle to pick up fills from other sources and price changes
+        self.portfolio_monitor = PortfolioMonitor(self.client, logger=self.logger)
+        self.event_bus.subscribe(OrderEvent.FILLED, self.portfolio_monitor.apply_fill)
+        self.event_bus.subscribe(OrderEvent.PARTIALLY_FILLED, self.portfolio_monitor.apply_fill)
 
         # Subscribe persistence to all events
-        persistence_sub = PersistenceSubscriber(self.db, self.logger)
-        for event in OrderEvent:
-            self.event_bus.subscribe(event, persistence_sub.handle_event)
+        self.persistence = PersistenceSubscriber(self.db, self.logger)
+        self.event_bus.subscribe_all(self.persistence.handle_event)
 
         # Create order daemon
         self.daemon = OrderDaemon(
@@ -96,6 +109,7 @@ class TradingSystem:
         self.logger.info("Starting trading system...")
 
         # Start components in order
+        await self.persistence.start()
         await self.event_bus.start()
         await self.portfolio_monitor.start()
         await self.daemon.start()
@@ -125,6 +139,7 @@ class TradingSystem:
         await self.daemon.stop()
         await self.portfolio_monitor.stop()
         await self.event_bus.stop()
+        await self.persistence.stop()
 
         self.logger.info("Trading system stopped")
 
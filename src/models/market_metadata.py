@@ -1,9 +1,10 @@
 """Market metadata models for caching market information."""
 
+import time
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class TokenInfo(BaseModel):
@@ -28,6 +29,11 @@ class MarketMetadata(BaseModel):
     # TTL management
     cached_at: datetime = Field(default_factory=datetime.now)
     ttl_seconds: int = 3600  # 1 hour
+    soft_ttl_seconds: Optional[int] = None  # Defaults to half the TTL
+
+    # token_id -> position in tokens; verified on every hit so it survives
+    # model_copy(update={"tokens": ...}) and in-place edits of the list
+    _token_index: dict[str, int] = PrivateAttr(default_factory=dict)
 
     def is_stale(self) -> bool:
         """Check if cached data needs refresh.
@@ -35,8 +41,21 @@ class MarketMetadata(BaseModel):
         Returns:
             True if cache age exceeds TTL
         """
-        age = (datetime.now() - self.cached_at).total_seconds()
-        return age > self.ttl_seconds
+        return time.time() > self.cached_at.timestamp() + self.ttl_seconds
+
+    def is_expiring(self) -> bool:
+        """Check if cached data is past its soft TTL.
+
+        Expiring data is still usable but should be refreshed in the
+        background before it goes stale.
+
+        Returns:
+            True if cache age exceeds the soft TTL
+        """
+        soft_ttl = self.soft_ttl_seconds
+        if soft_ttl is None:
+            soft_ttl = self.ttl_seconds // 2
+        return time.time() > self.cached_at.timestamp() + soft_ttl
 
     def get_token_outcome(self, token_id: str) -> Optional[str]:
         """Get outcome for a specific token ID.
@@ -47,7 +66,33 @@ class MarketMetadata(BaseModel):
         Returns:
             Outcome string ("YES" or "NO") or None if not found
         """
-        for token in self.tokens:
-            if token.token_id == token_id:
-                return token.outcome
-        return None
+        position = self._token_index.get(token_id)
+        if position is None or not self._token_at(position, token_id):
+            self._token_index = self._build_token_index()
+            position = self._token_index.get(token_id)
+            if position is None:
+                return None
+        return self.tokens[position].outcome
+
+    def _token_at(self, position: int, token_id: str) -> bool:
+        """Check whether the indexed position still holds the token.
+
+        Args:
+            position: Index position recorded for the token
+            token_id: Token ID expected at that position
+
+        Returns:
+            True if tokens[position] is the token
+        """
+        return position < len(self.tokens) and self.tokens[position].token_id == token_id
+
+    def _build_token_index(self) -> dict[str, int]:
+        """Build the token ID to position index from the current tokens.
+
+        Returns:
+            Dictionary mapping token_id to its first position in tokens
+        """
+        index: dict[str, int] = {}
+        for position, token in enumerate(self.tokens):
+            index.setdefault(token.token_id, position)
+        return index
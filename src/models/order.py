@@ -117,7 +117,13 @@ class Order(BaseModel):
         self.updated_at = datetime.now()
 
     def record_fill(self, amount: int) -> None:
-        """Record a fill and update amounts."""
+        """Record a fill and update amounts.
+
+        Zero or negative amounts are ignored, leaving the order untouched.
+        """
+        if amount <= 0:
+            return
+
         self.filled_amount += amount
         self.remaining_amount = self.total_size - self.filled_amount
         self.updated_at = datetime.now()
@@ -1,6 +1,7 @@
 """Iceberg order strategy - splits large orders into smaller tranches."""
 
 import random
+from typing import Optional
 
 from models.order import StrategyParams
 
@@ -8,13 +9,16 @@ from models.order import StrategyParams
 class IcebergStrategy:
     """Implements iceberg order splitting with randomization."""
 
-    def __init__(self, params: StrategyParams):
+    def __init__(self, params: StrategyParams, rng: Optional[random.Random] = None):
         """Initialize iceberg strategy.
 
         Args:
             params: Strategy parameters for tranche sizing
+            rng: Optional random generator for reproducible schedules
+                (default: the shared ``random`` module generator)
         """
         self.params = params
+        self._uniform = (rng or random).uniform
 
     def calculate_next_tranche_size(
         self,
@@ -42,7 +46,7 @@ class IcebergStrategy:
         randomization = self.params.tranche_randomization
         if randomization > 0:
             # Random factor between (1 - randomization) and (1 + randomization)
-            random_factor = 1.0 + random.uniform(-randomization, randomization)
+            random_factor = 1.0 + self._uniform(-randomization, randomization)
             tranche_size = int(base_size * random_factor)
         else:
             tranche_size = base_size
@@ -65,15 +69,28 @@ class IcebergStrategy:
         Returns:
             List of tranche sizes that sum to total_size
         """
+        # Same sizing as calculate_next_tranche_size, with parameters bound
+        # once for the whole schedule instead of looked up per tranche
+        params = self.params
+        min_size = params.min_tranche_size
+        max_size = params.max_tranche_size
+        randomization = params.tranche_randomization
+        uniform = self._uniform
+
         tranches = []
         remaining = total_size
-        is_first = True
+        base_size = params.initial_tranche_size
 
         while remaining > 0:
-            tranche_size = self.calculate_next_tranche_size(remaining, is_first)
+            if randomization > 0:
+                tranche_size = int(base_size * (1.0 + uniform(-randomization, randomization)))
+            else:
+                tranche_size = base_size
+            tranche_size = min(max_size, max(min_size, tranche_size), remaining)
+
             tranches.append(tranche_size)
             remaining -= tranche_size
-            is_first = False
+            base_size = min_size
 
         return tranches
 
@@ -84,4 +101,4 @@ class IcebergStrategy:
             Delay in seconds (1-3s randomized)
         """
         # Random delay between 1 and 3 seconds
-        return random.uniform(1.0, 3.0)
+        return self._uniform(1.0, 3.0)
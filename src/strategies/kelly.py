@@ -3,6 +3,7 @@
 import asyncio
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from api.polymarket_client import PolymarketClient
@@ -13,6 +14,40 @@ from models.order import Order
 from models.order_request import KellyParams
 from strategies.micro_price import MicroPriceStrategy
 
+# Micro-price moves smaller than this don't warrant re-sizing
+_RECALC_PRICE_EPSILON = 1e-4
+
+# Prices and probabilities are rounded to this many decimals before the cached
+# Kelly lookup, so a micro-price drifting within 1e-4 reuses the same entry
+_KELLY_KEY_DIGITS = 4
+
+
+@lru_cache(maxsize=4096)
+def _kelly_fraction(win_probability: float, current_price: float, is_buy: bool) -> float:
+    """Kelly fraction for one side of a binary market.
+
+    Pure in its inputs; callers round them to _KELLY_KEY_DIGITS so
+    recalculation ticks at a near-unchanged price are served from the cache.
+    """
+    # Odds: payout per dollar risked. Buying at p wins (1 - p) for p risked;
+    # selling at p wins p for (1 - p) risked.
+    win, risk = (1 - current_price, current_price) if is_buy else (current_price, 1 - current_price)
+    # Nothing at risk or nothing to win (price at 0 or 1): no bet
+    if risk <= 0 or win <= 0:
+        return 0.0
+    odds = win / risk
+
+    # Kelly formula
+    # f* = (odds * win_prob - loss_prob) / odds
+    # f* = (b*p - q) / b
+    loss_probability = 1 - win_probability
+    kelly_fraction = (odds * win_probability - loss_probability) / odds
+
+    # Clamp to [0, 1] - never bet negative or more than 100%
+    kelly_fraction = max(0.0, min(1.0, kelly_fraction))
+
+    return kelly_fraction
+
 
 class KellyStrategy:
     """Execute orders using Kelly criterion for position sizing.
@@ -66,6 +101,12 @@ class KellyStrategy:
         # Track current exchange order ID for cancellation
         self._current_exchange_order_id: Optional[str] = None
 
+        # Price, pending size and held position at the last sizing, to skip
+        # no-op recalculations
+        self._last_recalc_price: Optional[float] = None
+        self._last_recalc_remaining: Optional[int] = None
+        self._last_recalc_position: Optional[int] = None
+
     def calculate_kelly_fraction(
         self,
         win_probability: float,
@@ -81,6 +122,8 @@ class KellyStrategy:
         Kelly formula: f* = (b*p - q) / b
         where b = odds, p = win prob, q = 1 - p
 
+        Inputs are rounded to 4 decimals and the result is memoized.
+
         Args:
             win_probability: Probability of winning (0-1)
             current_price: Current market price
@@ -89,31 +132,11 @@ class KellyStrategy:
         Returns:
             Kelly fraction (fraction of bankroll to bet)
         """
-        # Calculate odds based on side
-        if side == OrderSide.BUY:
-            # Buying at price p, pays out 1 if win
-            # Odds: how much you win per dollar risked
-            # Win: (1 - p), Risk: p, Odds: (1 - p) / p
-            if current_price == 0:
-                return 0.0
-            odds = (1 - current_price) / current_price
-        else:
-            # Selling at price p
-            # Win: p, Risk: (1 - p), Odds: p / (1 - p)
-            if current_price == 1:
-                return 0.0
-            odds = current_price / (1 - current_price)
-
-        # Kelly formula
-        # f* = (odds * win_prob - loss_prob) / odds
-        # f* = (b*p - q) / b
-        loss_probability = 1 - win_probability
-        kelly_fraction = (odds * win_probability - loss_probability) / odds
-
-        # Clamp to [0, 1] - never bet negative or more than 100%
-        kelly_fraction = max(0.0, min(1.0, kelly_fraction))
-
-        return kelly_fraction
+        return _kelly_fraction(
+            round(win_probability, _KELLY_KEY_DIGITS),
+            round(current_price, _KELLY_KEY_DIGITS),
+            side == OrderSide.BUY,
+        )
 
     def calculate_position_size(
         self,
@@ -183,9 +206,9 @@ class KellyStrategy:
             return 0
 
         try:
-            positions = self.portfolio_monitor.get_positions_snapshot()
-            if token_id in positions:
-                return int(positions[token_id].total_shares)
+            position = self.portfolio_monitor.get_position(token_id)
+            if position is not None:
+                return int(position.total_shares)
         except Exception as e:
             self.logger.warning(f"Failed to get current position: {e}")
 
@@ -217,7 +240,7 @@ class KellyStrategy:
 
         try:
             # Get initial market snapshot
-            snapshot = self.monitor.get_market_snapshot()
+            snapshot = await asyncio.to_thread(self.monitor.get_market_snapshot)
             current_price = snapshot.micro_price
 
             # Get existing position
@@ -241,6 +264,9 @@ class KellyStrategy:
             # This ensures Kelly sizing is accurate (size calculated for price X, order placed at price X)
             order.min_price = current_price
             order.max_price = current_price
+            self._last_recalc_price = current_price
+            self._last_recalc_remaining = incremental_size
+            self._last_recalc_position = existing_position
 
             self.logger.info(
                 f"Calculated incremental position: {incremental_size} shares "
@@ -302,13 +328,26 @@ class KellyStrategy:
             order: Current order
             params: Kelly parameters
         """
-        # Get current market price
-        snapshot = self.monitor.get_market_snapshot()
-        current_price = snapshot.micro_price
+        # Get current market price. The micro-price execution keeps the
+        # monitor's snapshot fresh, so only fetch the book if it has gone stale.
+        current_price = self.monitor.get_micro_price(max_age=params.recalculate_interval)
+        if current_price is None:
+            snapshot = await asyncio.to_thread(self.monitor.get_market_snapshot)
+            current_price = snapshot.micro_price
 
         # Get existing position
         existing_position = await self._get_current_position(order.token_id)
 
+        # Nothing to redo if the price is flat and neither this order nor the
+        # held position changed since the last sizing
+        if (
+            self._last_recalc_price is not None
+            and abs(current_price - self._last_recalc_price) < _RECALC_PRICE_EPSILON
+            and order.remaining_amount == self._last_recalc_remaining
+            and existing_position == self._last_recalc_position
+        ):
+            return
+
         # Calculate new incremental size (don't count pending order yet)
         new_incremental_size = self.calculate_position_size(
             params, current_price, order.side, existing_position, 0
@@ -330,7 +369,9 @@ class KellyStrategy:
             # Cancel current order if we have one
             if self._current_exchange_order_id:
                 try:
-                    await self.client.cancel_order(self._current_exchange_order_id)
+                    await asyncio.to_thread(
+                        self.client.cancel_order, self._current_exchange_order_id
+                    )
                     self.logger.info(f"Cancelled order {self._current_exchange_order_id}")
 
                     # Emit cancelled event
@@ -383,7 +424,14 @@ class KellyStrategy:
                 self.logger.info("Optimal position reached, stopping Kelly execution")
                 order.update_status(OrderStatus.COMPLETED)
 
+        self._last_recalc_price = current_price
+        self._last_recalc_remaining = order.remaining_amount
+        self._last_recalc_position = existing_position
+
     def reset(self) -> None:
         """Reset strategy state for new execution."""
         self.micro_price_strategy.reset()
         self._current_exchange_order_id = None
+        self._last_recalc_price = None
+        self._last_recalc_remaining = None
+        self._last_recalc_position = None
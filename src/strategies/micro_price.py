@@ -140,7 +140,7 @@ class MicroPriceStrategy:
             Initial price to use
         """
         # Get current market snapshot
-        snapshot = self.monitor.get_market_snapshot()
+        snapshot = await asyncio.to_thread(self.monitor.get_market_snapshot)
 
         # Start at micro-price
         initial_price = snapshot.micro_price
@@ -180,7 +180,8 @@ class MicroPriceStrategy:
             Exception: If placement fails
         """
         # Place order via client
-        response = self.client.place_order(
+        response = await asyncio.to_thread(
+            self.client.place_order,
             token_id=order.token_id,
             side=order.side,
             price=price,
@@ -224,7 +225,7 @@ class MicroPriceStrategy:
             True if order should be replaced
         """
         # Get fresh market snapshot
-        snapshot = self.monitor.get_market_snapshot()
+        snapshot = await asyncio.to_thread(self.monitor.get_market_snapshot)
 
         # Calculate distance from micro-price
         distance = snapshot.distance_from_micro_price(current_price)
@@ -334,7 +335,7 @@ class MicroPriceStrategy:
             # Cancel current order
             if self._active_order_id:
                 self.logger.info(f"Canceling order {self._active_order_id}")
-                self.client.cancel_order(self._active_order_id)
+                await asyncio.to_thread(self.client.cancel_order, self._active_order_id)
                 order.record_adjustment()
 
             # Get new price
@@ -376,7 +377,9 @@ class MicroPriceStrategy:
 
         try:
             # Fetch order status from exchange
-            order_status = self.client.get_order_status(self._active_order_id)
+            order_status = await asyncio.to_thread(
+                self.client.get_order_status, self._active_order_id
+            )
 
             # Check for fills
             filled = order_status.get("filled_amount", 0)
@@ -1,8 +1,11 @@
 """Strategy router for directing orders to appropriate execution strategy."""
 
+import itertools
 import logging
-import uuid
-from typing import Optional
+import secrets
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
 
 from api.polymarket_client import PolymarketClient
 from core.market_monitor import MarketMonitor
@@ -36,6 +39,22 @@ class StrategyRouter:
         self.event_bus = event_bus
         self.logger = logger or logging.getLogger(__name__)
 
+        # Random per-router prefix plus a counter keeps IDs unique without
+        # drawing fresh randomness for every order
+        self._id_prefix = secrets.token_hex(3)
+        self._id_counter = itertools.count()
+
+        # Market monitors shared by concurrent orders, keyed by (token_id, band_width_bps)
+        self._monitors: dict[tuple[str, int], MarketMonitor] = {}
+        self._monitor_refcount: dict[tuple[str, int], int] = {}
+
+        # Strategy handlers, built once instead of branching per order
+        self._dispatch: dict[StrategyType, Callable[[OrderRequest], Awaitable[Order]]] = {
+            StrategyType.ICEBERG: self._execute_iceberg,
+            StrategyType.MICRO_PRICE: self._execute_micro_price,
+            StrategyType.KELLY: self._execute_kelly,
+        }
+
     def create_order_from_request(self, request: OrderRequest) -> Order:
         """Create Order object from OrderRequest.
 
@@ -46,7 +65,7 @@ class StrategyRouter:
             Order object ready for execution
         """
         # Generate order ID if not provided
-        order_id = f"{request.strategy_type.value}-{uuid.uuid4().hex[:8]}"
+        order_id = f"{request.strategy_type.value}-{self._id_prefix}{next(self._id_counter):06x}"
 
         # Determine target price (use mid-point of min/max as default)
         target_price = (request.min_price + request.max_price) / 2
@@ -85,24 +104,18 @@ class StrategyRouter:
         Raises:
             ValueError: If strategy type is unknown or not implemented
         """
-        self.logger.info(
-            f"Routing {request.strategy_type.value} order: "
-            f"{request.side.value} {request.total_size or 'dynamic'} "
-            f"@ {request.min_price}-{request.max_price}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Routing {request.strategy_type.value} order: "
+                f"{request.side.value} {request.total_size or 'dynamic'} "
+                f"@ {request.min_price}-{request.max_price}"
+            )
 
         # Route to appropriate strategy
-        if request.strategy_type == StrategyType.ICEBERG:
-            return await self._execute_iceberg(request)
-
-        elif request.strategy_type == StrategyType.MICRO_PRICE:
-            return await self._execute_micro_price(request)
-
-        elif request.strategy_type == StrategyType.KELLY:
-            return await self._execute_kelly(request)
-
-        else:
+        handler = self._dispatch.get(request.strategy_type)
+        if handler is None:
             raise ValueError(f"Unknown strategy type: {request.strategy_type}")
+        return await handler(request)
 
     async def _execute_iceberg(self, request: OrderRequest) -> Order:
         """Execute iceberg strategy.
@@ -118,17 +131,16 @@ class StrategyRouter:
         # Create order
         order = self.create_order_from_request(request)
 
-        # For now, use synchronous executor (will convert to async later)
-        # This is a placeholder - in full implementation we'd use async
-        executor = OrderExecutor(self.client, self.logger)
+        executor = OrderExecutor(self.client, self.logger, event_bus=self.event_bus)
 
         try:
             # Execute using iceberg strategy
-            result = executor.execute_iceberg_order(order)
-            self.logger.info(
-                f"Iceberg order {order.order_id} completed: "
-                f"{result.status.value}, filled {result.filled_amount}/{result.total_size}"
-            )
+            result = await executor.execute_iceberg_order(order)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Iceberg order {order.order_id} completed: "
+                    f"{result.status.value}, filled {result.filled_amount}/{result.total_size}"
+                )
             return result
 
         except Exception as e:
@@ -144,28 +156,31 @@ class StrategyRouter:
 
         Returns:
             Executed order
+
+        Raises:
+            ValueError: If micro_price_params is missing
         """
+        # Check parameters before allocating the order or a monitor
+        params = request.micro_price_params
+        if params is None:
+            raise ValueError("micro_price_params required for MICRO_PRICE strategy")
+
         # Create order
         order = self.create_order_from_request(request)
 
-        # Create market monitor
-        monitor = MarketMonitor(
-            self.client,
-            request.token_id,
-            band_width_bps=request.micro_price_params.threshold_bps,
-            logger=self.logger,
-        )
-
-        # Create micro-price strategy with event bus
-        strategy = MicroPriceStrategy(self.client, monitor, self.event_bus, self.logger)
-
         try:
-            # Execute using micro-price strategy
-            result = await strategy.execute(order, request.micro_price_params)
-            self.logger.info(
-                f"Micro-price order {order.order_id} completed: "
-                f"{result.status.value}, filled {result.filled_amount}/{result.total_size}"
-            )
+            # Share the market monitor with other orders on this token
+            async with self._market_monitor(request.token_id, params.threshold_bps) as monitor:
+                # Create micro-price strategy with event bus
+                strategy = MicroPriceStrategy(self.client, monitor, self.event_bus, self.logger)
+
+                # Execute using micro-price strategy
+                result = await strategy.execute(order, params)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Micro-price order {order.order_id} completed: "
+                    f"{result.status.value}, filled {result.filled_amount}/{result.total_size}"
+                )
             return result
 
         except Exception as e:
@@ -181,33 +196,70 @@ class StrategyRouter:
 
         Returns:
             Executed order
+
+        Raises:
+            ValueError: If kelly_params is missing
         """
+        # Check parameters before allocating the order or a monitor
+        params = request.kelly_params
+        if params is None:
+            raise ValueError("kelly_params required for KELLY strategy")
+        band_width_bps = params.micro_price_params.threshold_bps
+
         # Create order (total_size will be calculated by Kelly strategy)
         order = self.create_order_from_request(request)
 
-        # Create market monitor
-        monitor = MarketMonitor(
-            self.client,
-            request.token_id,
-            band_width_bps=request.kelly_params.micro_price_params.threshold_bps,
-            logger=self.logger,
-        )
-
-        # Create Kelly strategy with portfolio monitor and event bus
-        strategy = KellyStrategy(
-            self.client, monitor, self.portfolio_monitor, self.event_bus, self.logger
-        )
-
         try:
-            # Execute using Kelly criterion strategy
-            result = await strategy.execute(order, request.kelly_params)
-            self.logger.info(
-                f"Kelly order {order.order_id} completed: "
-                f"{result.status.value}, filled {result.filled_amount}/{result.total_size}"
-            )
+            # Share the market monitor with other orders on this token
+            async with self._market_monitor(request.token_id, band_width_bps) as monitor:
+                # Create Kelly strategy with portfolio monitor and event bus
+                strategy = KellyStrategy(
+                    self.client, monitor, self.portfolio_monitor, self.event_bus, self.logger
+                )
+
+                # Execute using Kelly criterion strategy
+                result = await strategy.execute(order, params)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Kelly order {order.order_id} completed: "
+                    f"{result.status.value}, filled {result.filled_amount}/{result.total_size}"
+                )
             return result
 
         except Exception as e:
             self.logger.error(f"Kelly execution failed: {e}")
             order.update_status(OrderStatus.FAILED)
             raise
+
+    @asynccontextmanager
+    async def _market_monitor(
+        self, token_id: str, band_width_bps: int
+    ) -> AsyncIterator[MarketMonitor]:
+        """Borrow the shared market monitor for a token, creating it if needed.
+
+        The monitor is released when the last order using it finishes.
+
+        Args:
+            token_id: Token to monitor
+            band_width_bps: Width of micro-price bands in basis points
+
+        Yields:
+            MarketMonitor shared with other orders on the same key
+        """
+        key = (token_id, band_width_bps)
+        monitor = self._monitors.get(key)
+        if monitor is None:
+            monitor = MarketMonitor(
+                self.client, token_id, band_width_bps=band_width_bps, logger=self.logger
+            )
+            self._monitors[key] = monitor
+        self._monitor_refcount[key] = self._monitor_refcount.get(key, 0) + 1
+
+        try:
+            yield monitor
+        finally:
+            self._monitor_refcount[key] -= 1
+            if self._monitor_refcount[key] == 0:
+                del self._monitor_refcount[key]
+                del self._monitors[key]
+                await monitor.stop_monitoring()
@@ -4,22 +4,91 @@ Polymarket API Parser
 Fetches market data and displays it in a readable format
 """
 
+import asyncio
 import json
-
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated fetches reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+
+@dataclass(slots=True, frozen=True)
+class TokenLookupEntry:
+    """Token IDs and identifiers for one sub-market."""
+
+    id: Optional[str]
+    token_yes: str
+    token_no: str
+    condition_id: Optional[str]
+    slug: Optional[str]
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict for JSON export."""
+        return asdict(self)
 
 
 def fetch_market_data(url: str) -> dict:
     """Fetch market data from API"""
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        # Decode the raw bytes directly; skips building the response text first
+        return json.loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching data: {e}")
         return None
 
 
+async def fetch_market_data_async(client: httpx.AsyncClient, url: str) -> Optional[dict]:
+    """Fetch market data from API without blocking the event loop"""
+    try:
+        response = await client.get(url, timeout=10)
+        response.raise_for_status()
+        return json.loads(response.content)
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"Error fetching data: {e}")
+        return None
+
+
+async def fetch_many_market_data(
+    urls: list[str], client: Optional[httpx.AsyncClient] = None
+) -> list[Optional[dict]]:
+    """Fetch several markets concurrently over one pooled client.
+
+    Args:
+        urls: Gamma API market URLs
+        client: Client to reuse across calls; a pooled one is opened for
+            this call if not given
+
+    Returns:
+        Market data (or None on error) for each URL, in input order
+    """
+    if client is not None:
+        return await asyncio.gather(*(fetch_market_data_async(client, url) for url in urls))
+
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    async with httpx.AsyncClient(limits=limits) as client:
+        return await asyncio.gather(*(fetch_market_data_async(client, url) for url in urls))
+
+
+def fetch_many_market_data_sync(
+    urls: list[str], client: Optional[httpx.AsyncClient] = None
+) -> list[Optional[dict]]:
+    """Blocking wrapper around fetch_many_market_data for the CLI"""
+    return asyncio.run(fetch_many_market_data(urls, client))
+
+
 def parse_token_ids(token_ids_str: str) -> list[str]:
     """Parse clobTokenIds from JSON string"""
     try:
@@ -28,8 +97,34 @@ def parse_token_ids(token_ids_str: str) -> list[str]:
         return []
 
 
+@lru_cache(maxsize=1024)
+def _token_pair(token_ids_str: str) -> Optional[tuple[str, str]]:
+    """Parse the YES/NO token IDs from a clobTokenIds string.
+
+    Cached by string, so the display, lookup and markdown passes over the
+    same markets parse each one once.
+
+    Args:
+        token_ids_str: JSON array string from the clobTokenIds field
+
+    Returns:
+        (yes_token, no_token), or None if fewer than two IDs are present
+    """
+    token_ids = parse_token_ids(token_ids_str)
+    if len(token_ids) < 2:
+        return None
+    return token_ids[0], token_ids[1]
+
+
+@lru_cache(maxsize=256)
+def _outcome_labels(outcomes_str: str) -> tuple[str, ...]:
+    """Parse an outcomes JSON string; cached since most markets share ["Yes", "No"]"""
+    return tuple(json.loads(outcomes_str))
+
+
+@lru_cache(maxsize=2048)
 def format_price(price: str) -> str:
-    """Format price for display"""
+    """Format price for display (cached; market payloads repeat the same strings)"""
     try:
         return f"{float(price):.3f}"
     except (ValueError, TypeError):
@@ -56,69 +151,84 @@ def display_sub_markets(markets: list[dict]):
     print("-" * 80)
 
     for i, market in enumerate(markets, 1):
-        print(f"\n[{i}] {market.get('groupItemTitle', 'N/A')}")
-        print(f"    Question: {market.get('question', 'N/A')}")
-        print(f"    Market ID: {market.get('id')}")
-        print(f"    Condition ID: {market.get('conditionId')}")
-        print(f"    Status: {'Closed' if market.get('closed') else 'Active'}")
+        # Collect the block and print it once per market
+        get = market.get
+        status = "Closed" if get("closed") else "Active"
+        out = [
+            f"\n[{i}] {get('groupItemTitle', 'N/A')}",
+            f"    Question: {get('question', 'N/A')}",
+            f"    Market ID: {get('id')}",
+            f"    Condition ID: {get('conditionId')}",
+            f"    Status: {status}",
+        ]
+        append = out.append
 
         # Outcomes and prices
         try:
-            outcomes = json.loads(market.get("outcomes", "[]"))
-            prices = json.loads(market.get("outcomePrices", "[]"))
-            print(f"    Outcomes: {', '.join(outcomes)}")
-            print(f"    Prices: {', '.join([format_price(p) for p in prices])}")
+            outcomes = _outcome_labels(get("outcomes", "[]"))
+            prices = json.loads(get("outcomePrices", "[]"))
+            append(f"    Outcomes: {', '.join(outcomes)}")
+            append(f"    Prices: {', '.join([format_price(p) for p in prices])}")
         except json.JSONDecodeError:
             pass
 
         # Token IDs
-        token_ids = parse_token_ids(market.get("clobTokenIds", "[]"))
-        if token_ids:
-            print("    Token IDs:")
-            print(f"      Yes: {token_ids[0]}")
-            print(f"      No:  {token_ids[1]}")
+        token_pair = _token_pair(get("clobTokenIds", "[]"))
+        if token_pair:
+            append("    Token IDs:")
+            append(f"      Yes: {token_pair[0]}")
+            append(f"      No:  {token_pair[1]}")
 
         # Trading info
-        print(f"    Volume: ${float(market.get('volume', 0)):,.2f}")
-        print(f"    Last Trade Price: {format_price(market.get('lastTradePrice', '0'))}")
+        append(f"    Volume: ${float(get('volume', 0)):,.2f}")
+        append(f"    Last Trade Price: {format_price(get('lastTradePrice', '0'))}")
 
-        if market.get("bestBid"):
-            print(f"    Best Bid: {format_price(market.get('bestBid'))}")
-        if market.get("bestAsk"):
-            print(f"    Best Ask: {format_price(market.get('bestAsk'))}")
+        best_bid = get("bestBid")
+        if best_bid:
+            append(f"    Best Bid: {format_price(best_bid)}")
+        best_ask = get("bestAsk")
+        if best_ask:
+            append(f"    Best Ask: {format_price(best_ask)}")
 
         # Price changes
-        if market.get("oneDayPriceChange"):
-            print(f"    24h Change: {float(market.get('oneDayPriceChange', 0)) * 100:+.2f}%")
+        day_change = get("oneDayPriceChange")
+        if day_change:
+            append(f"    24h Change: {float(day_change) * 100:+.2f}%")
+
+        print("\n".join(out))
 
 
-def create_token_lookup(markets: list[dict]) -> dict[str, dict]:
+def create_token_lookup(markets: list[dict]) -> dict[str, TokenLookupEntry]:
     """Create a lookup table for easy access"""
     lookup = {}
+    token_pair_of = _token_pair
     for market in markets:
+        # Skip unnamed markets before paying for the token ID parse
         name = market.get("groupItemTitle")
-        token_ids = parse_token_ids(market.get("clobTokenIds", "[]"))
-        if name and token_ids:
-            lookup[name] = {
-                "id": market.get("id"),
-                "token_yes": token_ids[0],
-                "token_no": token_ids[1],
-                "condition_id": market.get("conditionId"),
-                "slug": market.get("slug"),
-            }
+        if not name:
+            continue
+        token_pair = token_pair_of(market.get("clobTokenIds", "[]"))
+        if token_pair:
+            lookup[name] = TokenLookupEntry(
+                id=market.get("id"),
+                token_yes=token_pair[0],
+                token_no=token_pair[1],
+                condition_id=market.get("conditionId"),
+                slug=market.get("slug"),
+            )
     return lookup
 
 
-def display_token_lookup(lookup: dict[str, dict]):
+def display_token_lookup(lookup: dict[str, TokenLookupEntry]):
     """Display token lookup table"""
     print("\n" + "=" * 80)
     print("TOKEN LOOKUP TABLE")
     print("=" * 80)
     for name, info in lookup.items():
         print(f"\n{name}:")
-        print(f"  Market ID: {info['id']}")
-        print(f"  Token Yes: {info['token_yes']}")
-        print(f"  Token No:  {info['token_no']}")
+        print(f"  Market ID: {info.id}")
+        print(f"  Token Yes: {info.token_yes}")
+        print(f"  Token No:  {info.token_no}")
 
 
 def format_market_as_markdown(data: dict, markets: list[dict]) -> str:
@@ -131,8 +241,6 @@ def format_market_as_markdown(data: dict, markets: list[dict]) -> str:
     Returns:
         Markdown formatted string
     """
-    from datetime import datetime
-
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     lines = []
@@ -152,51 +260,39 @@ def format_market_as_markdown(data: dict, markets: list[dict]) -> str:
     )
 
     # Table rows
+    append = lines.append
     for market in markets:
-        name = market.get("groupItemTitle", "N/A")
-        question = market.get("question", "N/A")
+        get = market.get
+        name = get("groupItemTitle", "N/A")
+        question = get("question", "N/A")
         question = question[:50] + "..." if len(question) > 50 else question
 
-        best_bid = format_price(market.get("bestBid", "0"))
-        best_ask = format_price(market.get("bestAsk", "0"))
-        last_price = format_price(market.get("lastTradePrice", "0"))
-
-        price_change = float(market.get("oneDayPriceChange", 0)) * 100
+        price_change = float(get("oneDayPriceChange", 0)) * 100
         change_str = f"{price_change:+.2f}%" if price_change != 0 else "0.00%"
 
-        volume = f"${float(market.get('volume', 0)):,.0f}"
-
-        lines.append(
-            f"| {name} | {question} | {best_bid} | {best_ask} | {last_price} | {change_str} | {volume} |"
+        append(
+            f"| {name} | {question} | {format_price(get('bestBid', '0'))} "
+            f"| {format_price(get('bestAsk', '0'))} | {format_price(get('lastTradePrice', '0'))} "
+            f"| {change_str} | ${float(get('volume', 0)):,.0f} |"
         )
 
     # Add Token ID reference section with full IDs
-    lines.append("\n### Token IDs (Copy from here)\n")
+    append("\n### Token IDs (Copy from here)\n")
 
     for market in markets:
-        name = market.get("groupItemTitle", "N/A")
-        token_ids = parse_token_ids(market.get("clobTokenIds", "[]"))
-
-        if token_ids and len(token_ids) >= 2:
-            lines.append("<details>")
-            lines.append(f"<summary><strong>{name}</strong></summary>")
-            lines.append("")
-            lines.append("**YES Token:**")
-            lines.append("```")
-            lines.append(token_ids[0])
-            lines.append("```")
-            lines.append("")
-            lines.append("**NO Token:**")
-            lines.append("```")
-            lines.append(token_ids[1])
-            lines.append("```")
-            lines.append("")
-            lines.append(f"Market ID: `{market.get('id')}`")
-            lines.append("")
-            lines.append("</details>")
-            lines.append("")
-
-    lines.append("\n---\n")
+        token_pair = _token_pair(market.get("clobTokenIds", "[]"))
+
+        if token_pair:
+            # Each block is a single template rather than one append per line
+            name = market.get("groupItemTitle", "N/A")
+            append(
+                f"<details>\n<summary><strong>{name}</strong></summary>\n\n"
+                f"**YES Token:**\n```\n{token_pair[0]}\n```\n\n"
+                f"**NO Token:**\n```\n{token_pair[1]}\n```\n\n"
+                f"Market ID: `{market.get('id')}`\n\n</details>\n"
+            )
+
+    append("\n---\n")
     return "\n".join(lines)
 
 
@@ -207,43 +303,32 @@ def prepend_to_markdown_file(content: str, filename: str = "market_data.md"):
         content: Markdown content to prepend
         filename: Output filename
     """
-    from pathlib import Path
-
     filepath = Path(filename)
+    tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
 
-    # Read existing content if file exists
-    existing_content = ""
-    if filepath.exists():
-        existing_content = filepath.read_text()
-
-    # Write new content at top, followed by existing content
-    with open(filepath, "w") as f:
-        f.write(content)
-        if existing_content:
-            f.write(existing_content)
+    try:
+        # Write new content at top of a temp file
+        with open(tmp_path, "w") as f:
+            f.write(content)
+
+        # Stream existing content after it in 1 MiB chunks, then swap the
+        # temp file in atomically so a crash never leaves a partial file
+        with open(tmp_path, "ab") as dst:
+            if filepath.exists():
+                with open(filepath, "rb") as src:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     print(f"✅ Data prepended to: {filename}")
 
 
-def main():
-    # Get URL from user
-    print("Polymarket API Parser")
-    print("-" * 80)
-    url = input("Enter API URL (or press Enter for example): ").strip()
-
-    # Default to example URL if none provided
-    if not url:
-        url = "https://gamma-api.polymarket.com/markets/27824"
-        print(f"Using example: {url}")
-
-    print(f"\nFetching data from: {url}\n")
-
-    # Fetch and parse data
-    data = fetch_market_data(url)
-    if not data:
-        return
-
-    # Display data
+def display_market(data: dict):
+    """Display one market and offer its export options"""
     display_market_summary(data)
 
     markets = data.get("markets", [])
@@ -267,7 +352,10 @@ def main():
         if choice in ["1", "3"]:
             filename = f"market_{data.get('id')}_tokens.json"
             with open(filename, "w") as f:
-                json.dump(lookup, f, indent=2)
+                # One write of the encoded document instead of one per token
+                f.write(
+                    json.dumps({name: info.to_dict() for name, info in lookup.items()}, indent=2)
+                )
             print(f"✅ JSON exported to: {filename}")
 
         if choice in ["2", "3"]:
@@ -280,5 +368,29 @@ def main():
         print("No sub-markets found")
 
 
+def main():
+    # Get URL(s) from user
+    print("Polymarket API Parser")
+    print("-" * 80)
+    urls = input("Enter API URL(s), space-separated (or press Enter for example): ").split()
+
+    # Default to example URL if none provided
+    if not urls:
+        urls = ["https://gamma-api.polymarket.com/markets/27824"]
+        print(f"Using example: {urls[0]}")
+
+    print(f"\nFetching data from: {', '.join(urls)}\n")
+
+    # Fetch and parse data; several markets are fetched concurrently
+    if len(urls) == 1:
+        results = [fetch_market_data(urls[0])]
+    else:
+        results = fetch_many_market_data_sync(urls)
+
+    for data in results:
+        if data:
+            display_market(data)
+
+
 if __name__ == "__main__":
     main()
@@ -20,6 +20,19 @@ import argparse
 
 from utils.kelly_functions import calculate_edge, calculate_kelly_fraction
 
+# Kelly fractions shown in the recommended bet sizes table
+_KELLY_STRATEGIES: tuple[tuple[str, float], ...] = (
+    ("Full Kelly", 1.0),
+    ("Half Kelly (1/2)", 0.5),
+    ("Quarter Kelly (1/4)", 0.25),
+    ("Tenth Kelly (1/10)", 0.1),
+)
+
+
+def normalize_prob(p: float) -> float:
+    """Convert a percentage (values above 1) to a decimal probability."""
+    return p / 100 if p > 1 else p
+
 
 def format_percentage(value: float) -> str:
     """Format a decimal as percentage."""
@@ -88,14 +101,7 @@ def display_kelly_analysis(
     print("-" * 80)
 
     # Calculate for different Kelly fractions
-    kelly_fractions = [
-        ("Full Kelly", 1.0),
-        ("Half Kelly (1/2)", 0.5),
-        ("Quarter Kelly (1/4)", 0.25),
-        ("Tenth Kelly (1/10)", 0.1),
-    ]
-
-    for name, fraction in kelly_fractions:
+    for name, fraction in _KELLY_STRATEGIES:
         adjusted_kelly = kelly_full * fraction
         bet_amount = bankroll * adjusted_kelly
         num_shares = int(bet_amount / market_price) if market_price > 0 else 0
@@ -234,10 +240,6 @@ Notes:
 
     args = parser.parse_args()
 
-    # Convert percentages to decimals if needed
-    def normalize_prob(p: float) -> float:
-        return p / 100 if p > 1 else p
-
     true_prob = normalize_prob(args.true_prob)
     edge_bound = normalize_prob(args.edge_upper_bound)
 
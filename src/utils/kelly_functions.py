@@ -4,6 +4,14 @@ These functions provide the mathematical foundation for Kelly criterion betting
 and can be imported directly for programmatic use in trading strategies.
 """
 
+# Fractional Kelly strategies reported by calculate_fractional_kelly_sizes
+_FRACTIONAL_STRATEGIES: tuple[tuple[str, float], ...] = (
+    ("full", 1.0),
+    ("half", 0.5),
+    ("quarter", 0.25),
+    ("tenth", 0.1),
+)
+
 
 def calculate_edge(true_probability: float, market_price: float, side: str = "BUY") -> float:
     """Calculate expected value (edge) of the bet.
@@ -67,16 +75,26 @@ def calculate_kelly_fraction(
     Returns:
         Kelly fraction (0-1)
     """
-    # Calculate current edge
-    edge = calculate_edge(true_probability, market_price, side) / 100  # Convert to decimal
+    # Normalize side once; every branch below depends on it
+    is_buy = side.upper() == "BUY"
+
+    # Calculate current edge as a decimal (same formulas as calculate_edge)
+    # For BUY: edge = true_prob - market_price
+    # For SELL: edge = market_price - (1 - true_prob) = market_price + true_prob - 1
+    if is_buy:
+        edge = true_probability - market_price
+    else:
+        edge = market_price - (1 - true_probability)
+
+    # No edge means Kelly is non-positive and would be clamped to 0 anyway
+    if edge <= 0:
+        return 0.0
 
     # Apply edge upper bound if needed
     adjusted_probability = true_probability
     if edge > edge_upper_bound:
         # Cap the edge and derive the adjusted probability
-        # For BUY: edge = true_prob - market_price
-        # For SELL: edge = market_price - (1 - true_prob) = market_price + true_prob - 1
-        if side.upper() == "BUY":
+        if is_buy:
             adjusted_probability = market_price + edge_upper_bound
         else:  # SELL
             adjusted_probability = 1 - market_price + edge_upper_bound
@@ -85,7 +103,7 @@ def calculate_kelly_fraction(
         adjusted_probability = max(0.0, min(1.0, adjusted_probability))
 
     # Calculate odds based on side
-    if side.upper() == "BUY":
+    if is_buy:
         # Buying at price p, pays out 1 if win
         # Odds: how much you win per dollar risked
         # Win: (1 - p), Risk: p, Odds: (1 - p) / p
@@ -129,8 +147,13 @@ def calculate_position_size(
         edge_upper_bound: Maximum edge to use in calculation (default: 0.05 = 5%)
 
     Returns:
-        Tuple of (position_dollars, position_shares)
+        Tuple of (position_dollars, position_shares); (0.0, 0) when the price
+        or bankroll is not positive
     """
+    # Nothing to size without a positive price and bankroll
+    if market_price <= 0 or bankroll <= 0:
+        return 0.0, 0
+
     # Calculate Kelly fraction
     kelly = calculate_kelly_fraction(true_probability, market_price, side, edge_upper_bound)
 
@@ -142,10 +165,7 @@ def calculate_position_size(
 
     # Calculate position size in shares
     # For prediction markets: shares = dollars / price
-    if market_price == 0:
-        position_shares = 0
-    else:
-        position_shares = int(position_dollars / market_price)
+    position_shares = int(position_dollars / market_price)
 
     return position_dollars, position_shares
 
@@ -173,27 +193,21 @@ def calculate_fractional_kelly_sizes(
         - "quarter": Quarter Kelly (0.25x)
         - "tenth": Tenth Kelly (0.1x)
     """
-    strategies = {
-        "full": 1.0,
-        "half": 0.5,
-        "quarter": 0.25,
-        "tenth": 0.1,
-    }
+    # Full Kelly once; every strategy is a multiple of it
+    kelly = calculate_kelly_fraction(true_probability, market_price, side, edge_upper_bound)
+
+    # Same sizing guard as calculate_position_size
+    can_size = market_price > 0 and bankroll > 0
 
     results = {}
-    for name, multiplier in strategies.items():
-        dollars, shares = calculate_position_size(
-            true_probability,
-            market_price,
-            side,
-            bankroll,
-            kelly_fraction_multiplier=multiplier,
-            edge_upper_bound=edge_upper_bound,
-        )
-
-        # Calculate the actual Kelly fraction used
-        kelly = calculate_kelly_fraction(true_probability, market_price, side, edge_upper_bound)
+    for name, multiplier in _FRACTIONAL_STRATEGIES:
+        # Same sizing as calculate_position_size
         effective_kelly = kelly * multiplier
+        if can_size:
+            dollars = bankroll * effective_kelly
+            shares = int(dollars / market_price)
+        else:
+            dollars, shares = 0.0, 0
 
         results[name] = (effective_kelly, dollars, shares)
 
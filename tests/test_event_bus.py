@@ -0,0 +1,91 @@
+"""Tests for event bus."""
+
+import asyncio
+from datetime import datetime
+
+from core.event_bus import EventBus, OrderEvent, OrderEventData
+
+
+def _event(event: OrderEvent, order_id: str = "order-1") -> OrderEventData:
+    return OrderEventData(
+        event=event,
+        order_id=order_id,
+        timestamp=datetime.now(),
+        order_state=None,
+        details={},
+    )
+
+
+def test_publish_many_dispatches_in_order():
+    """Test publish_many delivers every event in the given order."""
+
+    async def run_test():
+        bus = EventBus()
+        received = []
+
+        async def callback(event_data):
+            received.append(event_data.event)
+
+        bus.subscribe(OrderEvent.QUEUED, callback)
+        bus.subscribe(OrderEvent.STARTED, callback)
+
+        await bus.start()
+        await bus.publish_many([_event(OrderEvent.QUEUED), _event(OrderEvent.STARTED)])
+        await asyncio.wait_for(bus._event_queue.join(), timeout=1.0)
+        await bus.stop()
+
+        assert received == [OrderEvent.QUEUED, OrderEvent.STARTED]
+
+    asyncio.run(run_test())
+
+
+def test_publish_many_drops_overflow():
+    """Test publish_many drops events that do not fit in the queue."""
+
+    async def run_test():
+        bus = EventBus()
+        bus._event_queue = asyncio.Queue(maxsize=1)
+
+        await bus.publish_many([_event(OrderEvent.QUEUED), _event(OrderEvent.STARTED)])
+
+        assert bus._event_queue.qsize() == 1
+        assert bus._event_queue.get_nowait().event == OrderEvent.QUEUED
+
+    asyncio.run(run_test())
+
+
+def test_order_event_data_is_slotted():
+    """Test event objects carry no per-instance __dict__."""
+    event_data = _event(OrderEvent.QUEUED)
+
+    assert not hasattr(event_data, "__dict__")
+
+
+def test_subscribe_all_receives_every_event_once():
+    """Test a wildcard subscriber gets each event once, after per-event subscribers."""
+
+    async def run_test():
+        bus = EventBus()
+        received = []
+
+        async def on_filled(event_data):
+            received.append(("filled", event_data.event))
+
+        async def on_any(event_data):
+            received.append(("any", event_data.event))
+
+        bus.subscribe(OrderEvent.FILLED, on_filled)
+        bus.subscribe_all(on_any)
+
+        await bus.start()
+        await bus.publish_many([_event(OrderEvent.QUEUED), _event(OrderEvent.FILLED)])
+        await asyncio.wait_for(bus._event_queue.join(), timeout=1.0)
+        await bus.stop()
+
+        assert received == [
+            ("any", OrderEvent.QUEUED),
+            ("filled", OrderEvent.FILLED),
+            ("any", OrderEvent.FILLED),
+        ]
+
+    asyncio.run(run_test())
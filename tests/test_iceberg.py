@@ -216,6 +216,28 @@ def test_calculate_all_tranches_small_order():
     assert tranches[0] == 150
 
 
+def test_calculate_all_tranches_matches_per_tranche_sizing():
+    """Test the precomputed schedule matches sizing tranches one at a time."""
+    params = StrategyParams(
+        initial_tranche_size=80,
+        min_tranche_size=10,
+        max_tranche_size=50,
+        tranche_randomization=0.3,
+    )
+    strategy = IcebergStrategy(params)
+
+    random.seed(7)
+    expected = []
+    remaining = 2000
+    while remaining > 0:
+        size = strategy.calculate_next_tranche_size(remaining, is_first_tranche=not expected)
+        expected.append(size)
+        remaining -= size
+
+    random.seed(7)
+    assert strategy.calculate_all_tranches(2000) == expected
+
+
 def test_inter_tranche_delay():
     """Test inter-tranche delay is within expected range."""
     params = StrategyParams()
@@ -238,3 +260,13 @@ def test_inter_tranche_delay_varies():
 
     # Should have multiple different delays
     assert len(set(delays)) > 1
+
+
+def test_seeded_rng_is_reproducible():
+    """Test that strategies with equally seeded generators agree."""
+    params = StrategyParams(tranche_randomization=0.5)
+    first = IcebergStrategy(params, rng=random.Random(3))
+    second = IcebergStrategy(params, rng=random.Random(3))
+
+    assert first.calculate_all_tranches(1000) == second.calculate_all_tranches(1000)
+    assert first.calculate_inter_tranche_delay() == second.calculate_inter_tranche_delay()
@@ -7,7 +7,7 @@ from models.enums import OrderSide, OrderStatus
 from models.market import MarketSnapshot
 from models.order import Order
 from models.order_request import KellyParams
-from strategies.kelly import KellyStrategy
+from strategies.kelly import KellyStrategy, _kelly_fraction
 
 
 def test_kelly_strategy_initialization():
@@ -84,6 +84,16 @@ def test_calculate_kelly_fraction_one_price_sell():
     assert kelly_fraction == 0.0
 
 
+def test_calculate_kelly_fraction_nothing_to_win():
+    """Test Kelly fraction is zero when a fill at the price can't pay out."""
+    client = Mock()
+    monitor = Mock()
+    strategy = KellyStrategy(client, monitor)
+
+    assert strategy.calculate_kelly_fraction(0.6, 1.0, OrderSide.BUY) == 0.0
+    assert strategy.calculate_kelly_fraction(0.6, 0.0, OrderSide.SELL) == 0.0
+
+
 def test_calculate_kelly_fraction_negative_clamped():
     """Test Kelly fraction is clamped to 0 when negative."""
     client = Mock()
@@ -98,6 +108,22 @@ def test_calculate_kelly_fraction_negative_clamped():
     assert kelly_fraction >= 0.0
 
 
+def test_calculate_kelly_fraction_cached_per_side():
+    """Test repeated Kelly fractions are served from the cache, keyed by side."""
+    strategy = KellyStrategy(Mock(), Mock())
+    _kelly_fraction.cache_clear()
+
+    buy = strategy.calculate_kelly_fraction(0.6, 0.4, OrderSide.BUY)
+    assert strategy.calculate_kelly_fraction(0.6, 0.4, OrderSide.BUY) == buy
+    sell = strategy.calculate_kelly_fraction(0.6, 0.4, OrderSide.SELL)
+    # Sub-1e-4 drift in the micro-price reuses the rounded entry
+    assert strategy.calculate_kelly_fraction(0.6, 0.400003, OrderSide.BUY) == buy
+
+    info = _kelly_fraction.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+    assert sell != buy
+
+
 def test_calculate_position_size():
     """Test position size calculation."""
     client = Mock()
@@ -253,6 +279,7 @@ def test_recalculate_position_size():
         micro_price_lower_band=0.29,
     )
     monitor.get_market_snapshot.return_value = snapshot
+    monitor.get_micro_price.return_value = None
 
     # Recalculate
     asyncio.run(strategy._recalculate_position_size(order, params))
@@ -299,6 +326,7 @@ def test_recalculate_position_size_small_change():
         micro_price_lower_band=0.40,
     )
     monitor.get_market_snapshot.return_value = snapshot
+    monitor.get_micro_price.return_value = None
 
     # Recalculate
     asyncio.run(strategy._recalculate_position_size(order, params))
@@ -306,3 +334,76 @@ def test_recalculate_position_size_small_change():
     # With less than 10% change, size might not change much
     # Just verify it ran without error
     assert order.total_size >= 0
+
+
+def test_recalculate_position_size_uses_cached_micro_price():
+    """Test recalculation reads a fresh cached micro-price instead of refetching."""
+    client = Mock()
+    monitor = Mock()
+    monitor.get_micro_price.return_value = 0.30
+    strategy = KellyStrategy(client, monitor)
+
+    order = Order(
+        order_id="order-1",
+        market_id="market-1",
+        token_id="token-123",
+        side=OrderSide.BUY,
+        total_size=1000,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+    )
+    params = KellyParams(
+        win_probability=0.6, kelly_fraction=0.5, max_position_size=5000, bankroll=10000
+    )
+
+    asyncio.run(strategy._recalculate_position_size(order, params))
+
+    monitor.get_micro_price.assert_called_once_with(max_age=params.recalculate_interval)
+    monitor.get_market_snapshot.assert_not_called()
+    assert order.min_price == order.max_price == 0.30
+
+
+def test_recalculate_position_size_skips_unchanged_price():
+    """Test recalculation is skipped while price, pending size and position are unchanged."""
+    monitor = Mock()
+    monitor.get_micro_price.return_value = 0.40
+    portfolio_monitor = Mock()
+    portfolio_monitor.get_position.return_value = None
+    strategy = KellyStrategy(Mock(), monitor, portfolio_monitor=portfolio_monitor)
+    strategy.calculate_position_size = Mock(wraps=strategy.calculate_position_size)
+
+    order = Order(
+        order_id="order-1",
+        market_id="market-1",
+        token_id="token-123",
+        side=OrderSide.BUY,
+        total_size=1000,
+        target_price=0.40,
+        max_price=0.40,
+        min_price=0.40,
+    )
+    params = KellyParams(
+        win_probability=0.6, kelly_fraction=0.5, max_position_size=5000, bankroll=10000
+    )
+
+    asyncio.run(strategy._recalculate_position_size(order, params))
+    asyncio.run(strategy._recalculate_position_size(order, params))
+    assert strategy.calculate_position_size.call_count == 1
+
+    # A fill changes the pending size, so the next tick re-sizes
+    order.record_fill(100)
+    asyncio.run(strategy._recalculate_position_size(order, params))
+    assert strategy.calculate_position_size.call_count == 2
+
+    # Shares bought elsewhere change the held position, so the next tick re-sizes
+    portfolio_monitor.get_position.return_value = Mock(total_shares=500)
+    asyncio.run(strategy._recalculate_position_size(order, params))
+    assert strategy.calculate_position_size.call_count == 3
+    asyncio.run(strategy._recalculate_position_size(order, params))
+    assert strategy.calculate_position_size.call_count == 3
+
+    # Reset clears the cached sizing
+    strategy.reset()
+    asyncio.run(strategy._recalculate_position_size(order, params))
+    assert strategy.calculate_position_size.call_count == 4
@@ -0,0 +1,79 @@
+"""Tests for Kelly criterion utility functions."""
+
+import pytest
+
+from utils.kelly_functions import (
+    calculate_edge,
+    calculate_fractional_kelly_sizes,
+    calculate_kelly_fraction,
+    calculate_position_size,
+)
+
+
+def test_calculate_edge_buy_and_sell():
+    """Test edge is expressed in percent for both sides."""
+    assert calculate_edge(0.60, 0.45, "BUY") == pytest.approx(15.0)
+    assert calculate_edge(0.60, 0.45, "SELL") == pytest.approx(5.0)
+
+
+def test_kelly_fraction_caps_edge():
+    """Test edges above the bound size as if the edge were the bound."""
+    capped = calculate_kelly_fraction(0.90, 0.40, "BUY", edge_upper_bound=0.05)
+    at_bound = calculate_kelly_fraction(0.45, 0.40, "BUY", edge_upper_bound=0.05)
+
+    assert capped == pytest.approx(at_bound)
+    assert capped == pytest.approx((0.6 / 0.4 * 0.45 - 0.55) / (0.6 / 0.4))
+
+
+def test_kelly_fraction_side_is_case_insensitive():
+    """Test lowercase sides behave like their uppercase forms."""
+    assert calculate_kelly_fraction(0.6, 0.55, "sell") == calculate_kelly_fraction(
+        0.6, 0.55, "SELL"
+    )
+    assert calculate_kelly_fraction(0.6, 0.55, "buy") == calculate_kelly_fraction(0.6, 0.55, "BUY")
+
+
+def test_kelly_fraction_no_edge_is_zero():
+    """Test a negative edge never sizes a bet."""
+    assert calculate_kelly_fraction(0.30, 0.50, "BUY") == 0.0
+
+
+def test_position_size_zero_price():
+    """Test a zero price yields no shares."""
+    assert calculate_position_size(0.5, 0.0, "BUY", 1000.0) == (0.0, 0)
+
+
+def test_fractional_kelly_sizes_match_position_size():
+    """Test each fractional strategy matches sizing that fraction directly."""
+    sizes = calculate_fractional_kelly_sizes(0.60, 0.45, "BUY", 1000.0)
+    full = calculate_kelly_fraction(0.60, 0.45, "BUY")
+
+    for name, multiplier in (("full", 1.0), ("half", 0.5), ("quarter", 0.25), ("tenth", 0.1)):
+        fraction, dollars, shares = sizes[name]
+        assert fraction == full * multiplier
+        assert (dollars, shares) == calculate_position_size(
+            0.60, 0.45, "BUY", 1000.0, kelly_fraction_multiplier=multiplier
+        )
+
+
+def test_kelly_fraction_no_edge_at_price_bounds():
+    """Test certain-loss prices return zero instead of dividing by zero."""
+    assert calculate_kelly_fraction(0.5, 1.0, "BUY") == 0.0
+    assert calculate_kelly_fraction(0.5, 0.0, "SELL") == 0.0
+    assert calculate_kelly_fraction(0.2, 0.8, "SELL") == 0.0
+
+
+def test_normalize_prob_accepts_percentages():
+    """Test CLI probabilities may be given as decimals or percentages."""
+    from utils.kelly_calculator import normalize_prob
+
+    assert normalize_prob(0.55) == 0.55
+    assert normalize_prob(55) == 0.55
+    assert normalize_prob(1) == 1
+
+
+def test_position_size_requires_positive_price_and_bankroll():
+    """Test non-positive prices or bankrolls size to nothing."""
+    assert calculate_position_size(0.6, -0.1, "BUY", 1000.0) == (0.0, 0)
+    assert calculate_position_size(0.6, 0.45, "BUY", -500.0) == (0.0, 0)
+    assert calculate_fractional_kelly_sizes(0.6, 0.45, "BUY", 0.0)["full"][1:] == (0.0, 0)
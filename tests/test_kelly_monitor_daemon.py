@@ -0,0 +1,26 @@
+"""Tests for KellyMonitorDaemon."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from core.kelly_monitor_daemon import KellyMonitorDaemon
+
+
+def test_monitor_loop_sleeps_without_sessions_lock():
+    """Test the monitor loop releases the sessions lock before sleeping."""
+
+    async def run_test():
+        daemon = KellyMonitorDaemon(Mock(), Mock(), Mock())
+        daemon._running = True
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append((delay, daemon._sessions_lock.locked()))
+            daemon._running = False
+
+        with patch("core.kelly_monitor_daemon.asyncio.sleep", fake_sleep):
+            await daemon._monitor_loop()
+
+        assert sleeps == [(60.0, False)]
+
+    asyncio.run(run_test())
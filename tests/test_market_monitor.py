@@ -1,7 +1,10 @@
 """Tests for market monitor."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -9,6 +12,12 @@ from core.market_monitor import MarketMonitor
 from models.market import MarketSnapshot
 
 
+@pytest.fixture(autouse=True)
+def _snapshot_db_in_tmp(tmp_path, monkeypatch):
+    """Run each test from tmp_path so the default snapshot DB path lands there."""
+    monkeypatch.chdir(tmp_path)
+
+
 def _make_level(price: str, size: str) -> SimpleNamespace:
     return SimpleNamespace(price=price, size=size)
 
@@ -29,7 +38,7 @@ def test_market_monitor_initialization():
     assert monitor.client == client
     assert monitor.token_id == token_id
     assert monitor.band_width_bps == 50  # default
-    assert monitor._last_snapshot is None
+    assert monitor.get_last_snapshot() is None
 
 
 def test_market_monitor_custom_band_width():
@@ -346,6 +355,54 @@ def test_get_last_snapshot():
     assert cached.micro_price == snapshot.micro_price
 
 
+def test_get_micro_price_cached_and_stale():
+    """Test the cached micro-price is returned until it exceeds max_age."""
+    client = Mock()
+    monitor = MarketMonitor(client, "token-123")
+
+    assert monitor.get_micro_price() is None
+
+    client.get_order_book.return_value = _make_order_book(
+        bids=[{"price": "0.44", "size": "1000"}],
+        asks=[{"price": "0.46", "size": "800"}],
+    )
+    client.get_orders.return_value = []
+    snapshot = monitor.get_market_snapshot()
+
+    assert monitor.get_micro_price() == snapshot.micro_price
+    assert monitor.get_micro_price(max_age=60) == snapshot.micro_price
+
+    cached_snapshot, fetched_at = monitor._last_cached
+    monitor._last_cached = (cached_snapshot, fetched_at - 120)
+    assert monitor.get_micro_price(max_age=60) is None
+    assert monitor.get_micro_price() == snapshot.micro_price
+
+
+def test_concurrent_snapshots_keep_cached_state_consistent():
+    """Test parallel fetches leave bands and micro-price from a single snapshot."""
+    books = [
+        _make_order_book(
+            bids=[{"price": f"0.{40 + i}", "size": "1000"}],
+            asks=[{"price": f"0.{50 + i}", "size": "800"}],
+        )
+        for i in range(8)
+    ]
+    client = Mock()
+    client.get_order_book.side_effect = lambda token_id: books[threading.get_ident() % 8]
+    client.get_orders.return_value = []
+    monitor = MarketMonitor(client, "token-123")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: monitor.get_market_snapshot(), range(64)))
+
+    snapshot = monitor.get_last_snapshot()
+    assert monitor.get_micro_price() == snapshot.micro_price
+    assert monitor._get_bands(None) == (
+        snapshot.micro_price_lower_band,
+        snapshot.micro_price_upper_band,
+    )
+
+
 def test_fetch_and_store_snapshot_persists_levels(tmp_path):
     """Test snapshots are persisted with top-of-book levels."""
     client = Mock()
@@ -386,3 +443,75 @@ def test_monitor_default_interval():
     client = Mock()
     monitor = MarketMonitor(client, "token-123")
     assert monitor.poll_interval == 10.0
+
+
+def test_get_market_snapshot_unsorted_book():
+    """Test snapshot orders unsorted book levels and truncates to depth."""
+    client = Mock()
+    monitor = MarketMonitor(client, "token-123")
+
+    client.get_order_book.return_value = _make_order_book(
+        bids=[
+            {"price": "0.42", "size": "300"},
+            {"price": "0.44", "size": "1000"},
+            {"price": "0.43", "size": "500"},
+        ],
+        asks=[
+            {"price": "0.48", "size": "400"},
+            {"price": "0.46", "size": "800"},
+            {"price": "0.47", "size": "600"},
+        ],
+    )
+    client.get_orders.return_value = []
+
+    snapshot = monitor.get_market_snapshot(depth_levels=2)
+
+    assert snapshot.best_bid == 0.44
+    assert snapshot.best_ask == 0.46
+    assert snapshot.bids == [(0.44, 1000), (0.43, 500)]
+    assert snapshot.asks == [(0.46, 800), (0.47, 600)]
+
+
+def test_monitor_loop_keeps_fixed_cadence():
+    """Test monitor loop sleeps only for the remainder of the interval."""
+    client = Mock()
+    monitor = MarketMonitor(client, "token-123", poll_interval=1.0)
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) >= 2:
+            monitor._running = False
+
+    clock = iter([100.0, 100.4, 101.2])
+    monitor.fetch_and_store_snapshot = Mock()
+    monitor._running = True
+
+    fake_time = SimpleNamespace(monotonic=lambda: next(clock))
+    with (
+        patch("core.market_monitor.time", fake_time),
+        patch("core.market_monitor.asyncio.sleep", fake_sleep),
+    ):
+        asyncio.run(monitor._monitor_loop())
+
+    assert sleeps[0] == pytest.approx(0.6)
+    assert sleeps[1] == pytest.approx(0.8)
+
+
+def test_is_price_competitive_uses_cached_bands():
+    """Test competitiveness checks use bands cached from the last snapshot."""
+    client = Mock()
+    monitor = MarketMonitor(client, "token-123", band_width_bps=100)
+
+    client.get_order_book.return_value = _make_order_book(
+        bids=[{"price": "0.44", "size": "1000"}],
+        asks=[{"price": "0.46", "size": "1000"}],
+    )
+    client.get_orders.return_value = []
+
+    # First check fetches a snapshot, later checks reuse it
+    assert monitor.is_price_competitive(0.45)
+    assert not monitor.is_price_competitive(0.47)
+    assert client.get_order_book.call_count == 1
+
+    assert monitor.are_prices_competitive([0.44, 0.45, 0.454]) == [False, True, True]
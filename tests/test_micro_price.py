@@ -444,3 +444,33 @@ def test_replace_order_failure():
 
     # Should return None on failure
     assert new_price is None
+
+
+def test_place_order_runs_client_call_off_event_loop():
+    """Test the blocking client call runs in a worker thread."""
+    import threading
+
+    client = Mock()
+    call_threads = []
+
+    def place_order(**kwargs):
+        call_threads.append(threading.current_thread())
+        return "exchange-order-123"
+
+    client.place_order.side_effect = place_order
+    client.extract_order_id.return_value = "exchange-order-123"
+    strategy = MicroPriceStrategy(client, Mock())
+
+    order = Order(
+        order_id="order-1",
+        token_id="token-123",
+        side=OrderSide.BUY,
+        total_size=100,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+    )
+
+    asyncio.run(strategy._place_order(order, 0.45))
+
+    assert call_threads and call_threads[0] is not threading.main_thread()
@@ -4,6 +4,7 @@ import pytest
 
 from models.enums import OrderSide, OrderStatus, Urgency
 from models.market import MarketConditions, MarketSnapshot
+from models.market_metadata import MarketMetadata, TokenInfo
 from models.order import Order, StrategyParams
 
 
@@ -109,6 +110,27 @@ def test_order_record_fill():
     assert order.status == OrderStatus.COMPLETED
 
 
+def test_order_record_fill_ignores_empty_fill():
+    """Test zero-size fills leave the order unchanged."""
+    order = Order(
+        order_id="test-1",
+        token_id="t1",
+        side=OrderSide.BUY,
+        total_size=1000,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+    )
+    updated_at = order.updated_at
+
+    order.record_fill(0)
+
+    assert order.filled_amount == 0
+    assert order.remaining_amount == 1000
+    assert order.status == OrderStatus.QUEUED
+    assert order.updated_at == updated_at
+
+
 def test_order_record_adjustment():
     """Test recording price adjustments."""
     order = Order(
@@ -283,3 +305,93 @@ def test_market_snapshot_with_order_book():
     assert len(snapshot.asks) == 3
     assert snapshot.bids[0] == (0.44, 1000)
     assert snapshot.asks[0] == (0.46, 800)
+
+
+def test_market_metadata_get_token_outcome():
+    """Test token outcome lookup through the cached index."""
+    metadata = MarketMetadata(
+        condition_id="c1",
+        question="Will it rain?",
+        tokens=[
+            TokenInfo(token_id="t-yes", outcome="Yes"),
+            TokenInfo(token_id="t-no", outcome="No"),
+        ],
+    )
+
+    assert metadata.get_token_outcome("t-yes") == "Yes"
+    assert metadata.get_token_outcome("t-no") == "No"
+    assert metadata.get_token_outcome("t-other") is None
+    assert "_token_index" not in metadata.model_dump()
+
+
+def test_market_metadata_token_outcome_follows_token_changes():
+    """Test token outcome lookup after model_copy and in-place token edits."""
+    metadata = MarketMetadata(
+        condition_id="c1",
+        question="Will it rain?",
+        tokens=[
+            TokenInfo(token_id="t-yes", outcome="Yes"),
+            TokenInfo(token_id="t-no", outcome="No"),
+        ],
+    )
+    assert metadata.get_token_outcome("t-yes") == "Yes"
+
+    copy = metadata.model_copy(update={"tokens": [TokenInfo(token_id="t-new", outcome="Yes")]})
+    assert copy.get_token_outcome("t-new") == "Yes"
+    assert copy.get_token_outcome("t-yes") is None
+    assert metadata.get_token_outcome("t-yes") == "Yes"
+
+    metadata.tokens.append(TokenInfo(token_id="t-late", outcome="No"))
+    assert metadata.get_token_outcome("t-late") == "No"
+
+    metadata.tokens[0] = TokenInfo(token_id="t-swapped", outcome="No")
+    assert metadata.get_token_outcome("t-yes") is None
+    assert metadata.get_token_outcome("t-swapped") == "No"
+
+
+def test_market_metadata_staleness_thresholds():
+    """Test soft and hard TTL checks against cached_at."""
+    from datetime import datetime, timedelta
+
+    def metadata_aged(seconds):
+        return MarketMetadata(
+            condition_id="c1",
+            question="Will it rain?",
+            tokens=[],
+            cached_at=datetime.now() - timedelta(seconds=seconds),
+            ttl_seconds=100,
+        )
+
+    fresh = metadata_aged(10)
+    assert not fresh.is_expiring()
+    assert not fresh.is_stale()
+
+    expiring = metadata_aged(60)
+    assert expiring.is_expiring()
+    assert not expiring.is_stale()
+
+    stale = metadata_aged(150)
+    assert stale.is_expiring()
+    assert stale.is_stale()
+
+
+def test_market_metadata_staleness_follows_restamped_cached_at():
+    """Test re-stamping cached_at after a staleness check moves the deadlines."""
+    from datetime import datetime, timedelta
+
+    metadata = MarketMetadata(
+        condition_id="c1",
+        question="Will it rain?",
+        tokens=[],
+        cached_at=datetime.now() - timedelta(seconds=150),
+        ttl_seconds=100,
+    )
+    assert metadata.is_stale()
+
+    refreshed = metadata.model_copy(update={"cached_at": datetime.now()})
+    assert not refreshed.is_stale()
+    assert not refreshed.is_expiring()
+
+    metadata.cached_at = datetime.now()
+    assert not metadata.is_stale()
+    assert not metadata.is_expiring()
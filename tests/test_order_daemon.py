@@ -41,7 +41,7 @@ def test_start_daemon():
         await daemon.start()
 
         assert daemon.is_running()
-        assert daemon._worker_task is not None
+        assert len(daemon._worker_tasks) == daemon._max_concurrent
 
         # Clean up
         await daemon.stop()
@@ -388,3 +388,478 @@ def test_process_queue_failed_order():
         await daemon.stop()
 
     asyncio.run(run_test())
+
+
+def test_get_order_status_after_processing():
+    """Test looking up a processed order by ID."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client)
+
+        completed_order = Order(
+            order_id="order-1",
+            market_id="market-1",
+            token_id="token-1",
+            side=OrderSide.BUY,
+            total_size=1000,
+            target_price=0.45,
+            max_price=0.50,
+            min_price=0.40,
+        )
+        completed_order.record_fill(1000)
+        daemon._router.execute_order = AsyncMock(return_value=completed_order)
+
+        await daemon.start()
+
+        request = OrderRequest(
+            market_id="market-123",
+            token_id="token-456",
+            side=OrderSide.BUY,
+            strategy_type=StrategyType.ICEBERG,
+            total_size=1000,
+            max_price=0.60,
+            min_price=0.40,
+            iceberg_params=StrategyParams(),
+        )
+        await daemon.submit_order(request)
+        await asyncio.sleep(0.5)
+
+        assert daemon.get_order_status("order-1") is completed_order
+        assert daemon.get_order_status("missing") is None
+
+        daemon.clear_history()
+        assert daemon.get_order_status("order-1") is None
+
+        await daemon.stop()
+
+    asyncio.run(run_test())
+
+
+def test_history_is_bounded():
+    """Test history evicts oldest orders and their ID index entries."""
+    client = Mock()
+    daemon = OrderDaemon(client, history_size=2)
+
+    orders = [
+        Order(
+            order_id=f"order-{i}",
+            token_id="token-1",
+            side=OrderSide.BUY,
+            total_size=100,
+            target_price=0.45,
+            max_price=0.50,
+            min_price=0.40,
+        )
+        for i in range(3)
+    ]
+    for order in orders:
+        daemon._record_order(order, daemon._completed_orders)
+
+    completed = daemon.get_completed_orders()
+    assert [o.order_id for o in completed] == ["order-1", "order-2"]
+    assert daemon.get_order_status("order-0") is None
+    assert daemon.get_order_status("order-2") is orders[2]
+
+
+def test_stop_wakes_idle_worker():
+    """Test stop() wakes idle workers so they exit on their own."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client)
+
+        await daemon.start()
+        await asyncio.sleep(0)
+        workers = list(daemon._worker_tasks)
+
+        await daemon.stop()
+
+        assert all(worker.done() for worker in workers)
+        assert not any(worker.cancelled() for worker in workers)
+
+    asyncio.run(run_test())
+
+
+def test_workers_execute_distinct_tokens_concurrently():
+    """Test orders for different tokens run in parallel up to max_concurrent."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client, max_concurrent=2)
+
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def execute(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            order = Order(
+                order_id=f"order-{request.token_id}",
+                market_id="market-1",
+                token_id=request.token_id,
+                side=OrderSide.BUY,
+                total_size=100,
+                target_price=0.45,
+                max_price=0.50,
+                min_price=0.40,
+            )
+            order.update_status(OrderStatus.COMPLETED)
+            return order
+
+        daemon._router.execute_order = execute
+
+        await daemon.start()
+        for token in ("a", "b", "c"):
+            await daemon.submit_order(
+                OrderRequest(
+                    market_id="market-1",
+                    token_id=token,
+                    side=OrderSide.BUY,
+                    strategy_type=StrategyType.ICEBERG,
+                    total_size=100,
+                    max_price=0.60,
+                    min_price=0.40,
+                    iceberg_params=StrategyParams(),
+                )
+            )
+
+        await asyncio.sleep(0.05)
+        assert peak == 2
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert len(daemon.get_completed_orders()) == 3
+
+        await daemon.stop()
+
+    asyncio.run(run_test())
+
+
+def test_same_token_orders_run_back_to_back():
+    """Test a held request for a busy token runs as soon as the token frees up."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client, max_concurrent=2)
+
+        executed = []
+
+        async def execute(request):
+            executed.append(request.total_size)
+            await asyncio.sleep(0.01)
+            order = Order(
+                order_id=f"order-{len(executed)}",
+                market_id="market-1",
+                token_id=request.token_id,
+                side=OrderSide.BUY,
+                total_size=request.total_size,
+                target_price=0.45,
+                max_price=0.50,
+                min_price=0.40,
+            )
+            order.update_status(OrderStatus.COMPLETED)
+            return order
+
+        daemon._router.execute_order = execute
+
+        await daemon.start()
+        for size in (100, 200, 300):
+            await daemon.submit_order(
+                OrderRequest(
+                    market_id="market-1",
+                    token_id="token-1",
+                    side=OrderSide.BUY,
+                    strategy_type=StrategyType.ICEBERG,
+                    total_size=size,
+                    max_price=0.60,
+                    min_price=0.40,
+                    iceberg_params=StrategyParams(),
+                )
+            )
+
+        await asyncio.sleep(0.2)
+
+        assert executed == [100, 200, 300]
+        assert len(daemon.get_completed_orders()) == 3
+        assert daemon._active_tokens == set()
+        assert daemon._pending_by_token == {}
+
+        await daemon.stop()
+
+    asyncio.run(run_test())
+
+
+def test_wait_for_completion_covers_held_requests():
+    """Test wait_for_completion returns only after held same-token requests run."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client, max_concurrent=2)
+
+        executed = []
+
+        async def execute(request):
+            await asyncio.sleep(0.05)
+            executed.append(request.total_size)
+            order = Order(
+                order_id=f"order-{request.total_size}",
+                market_id="market-1",
+                token_id=request.token_id,
+                side=OrderSide.BUY,
+                total_size=request.total_size,
+                target_price=0.45,
+                max_price=0.50,
+                min_price=0.40,
+            )
+            order.update_status(OrderStatus.COMPLETED)
+            return order
+
+        daemon._router.execute_order = execute
+
+        await daemon.start()
+        for size in (100, 200):
+            await daemon.submit_order(
+                OrderRequest(
+                    market_id="market-1",
+                    token_id="token-1",
+                    side=OrderSide.BUY,
+                    strategy_type=StrategyType.ICEBERG,
+                    total_size=size,
+                    max_price=0.60,
+                    min_price=0.40,
+                    iceberg_params=StrategyParams(),
+                )
+            )
+
+        assert await daemon.wait_for_completion(timeout=2.0) is True
+        assert executed == [100, 200]
+
+        await daemon.stop()
+
+    asyncio.run(run_test())
+
+
+def test_restart_after_stop_executes_new_orders():
+    """Test sentinels left by stop() don't stop the workers of the next start()."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client, max_concurrent=2)
+
+        executed = []
+
+        async def execute(request):
+            await asyncio.sleep(0.05)
+            executed.append(request.total_size)
+            order = Order(
+                order_id=f"order-{request.total_size}",
+                market_id="market-1",
+                token_id=request.token_id,
+                side=OrderSide.BUY,
+                total_size=request.total_size,
+                target_price=0.45,
+                max_price=0.50,
+                min_price=0.40,
+            )
+            order.update_status(OrderStatus.COMPLETED)
+            return order
+
+        daemon._router.execute_order = execute
+
+        def make_request(size, token_id="token-1"):
+            return OrderRequest(
+                market_id="market-1",
+                token_id=token_id,
+                side=OrderSide.BUY,
+                strategy_type=StrategyType.ICEBERG,
+                total_size=size,
+                max_price=0.60,
+                min_price=0.40,
+                iceberg_params=StrategyParams(),
+            )
+
+        # Stop while both workers are busy, so they exit without taking their sentinels
+        await daemon.start()
+        await daemon.submit_order(make_request(100))
+        await daemon.submit_order(make_request(150, token_id="token-2"))
+        await asyncio.sleep(0.01)
+        await daemon.stop()
+
+        await daemon.start()
+        await daemon.submit_order(make_request(200))
+
+        assert await daemon.wait_for_completion(timeout=2.0) is True
+        assert sorted(executed) == [100, 150, 200]
+        assert executed[-1] == 200
+
+        await daemon.stop()
+
+    asyncio.run(run_test())
+
+
+def test_stop_waits_for_in_flight_order():
+    """Test stop() lets a running execution finish instead of cancelling it."""
+
+    async def run_test():
+        client = Mock()
+        daemon = OrderDaemon(client, max_concurrent=1)
+
+        async def execute(request):
+            await asyncio.sleep(0.05)
+            order = Order(
+                order_id="order-1",
+                market_id="market-1",
+                token_id=request.token_id,
+                side=OrderSide.BUY,
+                total_size=100,
+                target_price=0.45,
+                max_price=0.50,
+                min_price=0.40,
+            )
+            order.update_status(OrderStatus.COMPLETED)
+            return order
+
+        daemon._router.execute_order = execute
+
+        await daemon.start()
+        await daemon.submit_order(
+            OrderRequest(
+                market_id="market-1",
+                token_id="token-1",
+                side=OrderSide.BUY,
+                strategy_type=StrategyType.ICEBERG,
+                total_size=100,
+                max_price=0.60,
+                min_price=0.40,
+                iceberg_params=StrategyParams(),
+            )
+        )
+        await asyncio.sleep(0.01)
+        assert daemon._in_flight == 1
+
+        await daemon.stop()
+
+        assert daemon._in_flight == 0
+        assert len(daemon.get_completed_orders()) == 1
+
+    asyncio.run(run_test())
+
+
+def test_history_getters_return_independent_lists():
+    """Test history getters return lists callers can modify without affecting history."""
+    client = Mock()
+    daemon = OrderDaemon(client)
+
+    order = Order(
+        order_id="order-1",
+        market_id="market-1",
+        token_id="token-1",
+        side=OrderSide.BUY,
+        total_size=1000,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+    )
+    daemon._record_order(order, daemon._completed_orders)
+
+    completed = daemon.get_completed_orders()
+    assert isinstance(completed, list)
+    completed.append(order)
+    assert len(daemon.get_completed_orders()) == 1
+    assert daemon.get_failed_orders() == []
+
+
+def test_event_bus_receives_lifecycle_events():
+    """Test QUEUED/STARTED and the completion event reach the event bus."""
+
+    async def run_test():
+        client = Mock()
+        event_bus = Mock()
+        event_bus.start = AsyncMock()
+        event_bus.stop = AsyncMock()
+        event_bus.publish = AsyncMock()
+        event_bus.publish_many = AsyncMock()
+        daemon = OrderDaemon(client, event_bus=event_bus)
+
+        completed_order = Order(
+            order_id="order-1",
+            market_id="market-1",
+            token_id="token-1",
+            side=OrderSide.BUY,
+            total_size=100,
+            target_price=0.45,
+            max_price=0.50,
+            min_price=0.40,
+        )
+        completed_order.update_status(OrderStatus.COMPLETED)
+        daemon._router.execute_order = AsyncMock(return_value=completed_order)
+
+        await daemon.start()
+        await daemon.submit_order(
+            OrderRequest(
+                market_id="market-1",
+                token_id="token-1",
+                side=OrderSide.BUY,
+                strategy_type=StrategyType.ICEBERG,
+                total_size=100,
+                max_price=0.60,
+                min_price=0.40,
+                iceberg_params=StrategyParams(),
+            )
+        )
+        await asyncio.sleep(0.05)
+        await daemon.stop()
+
+        (started_events,), _ = event_bus.publish_many.call_args
+        assert [e.event.value for e in started_events] == ["queued", "started"]
+
+        (completion,), _ = event_bus.publish.call_args
+        assert completion.event.value == "completed"
+        assert completion.order_state is completed_order
+        assert completion.details == {
+            "filled_amount": 0,
+            "status": "completed",
+            "strategy_type": "iceberg",
+        }
+
+    asyncio.run(run_test())
+
+
+def test_fill_rate_tracks_retained_history():
+    """Test fill rate follows recorded orders, evictions and clears."""
+    client = Mock()
+    daemon = OrderDaemon(client, history_size=2)
+
+    def make_order(order_id, filled):
+        order = Order(
+            order_id=order_id,
+            market_id="market-1",
+            token_id="token-1",
+            side=OrderSide.BUY,
+            total_size=100,
+            target_price=0.45,
+            max_price=0.50,
+            min_price=0.40,
+        )
+        if filled:
+            order.record_fill(filled)
+        return order
+
+    assert daemon.get_fill_rate() == 0.0
+
+    daemon._record_order(make_order("order-1", 100), daemon._completed_orders)
+    daemon._record_order(make_order("order-2", 0), daemon._failed_orders)
+    assert daemon.get_fill_rate() == 0.5
+
+    # Evicts order-1 from the completed bucket
+    daemon._record_order(make_order("order-3", 50), daemon._completed_orders)
+    daemon._record_order(make_order("order-4", 50), daemon._completed_orders)
+    assert daemon.get_fill_rate() == 100 / 300
+
+    daemon.clear_history()
+    assert daemon.get_fill_rate() == 0.0
@@ -60,3 +60,224 @@ def test_extract_filled_amount_handles_zero():
 
     response = {"size_matched": "0"}
     assert executor._extract_filled_amount(response) == 0
+
+
+def test_monitor_until_filled_returns_on_fill():
+    """Test monitoring polls asynchronously until the target size fills."""
+    import asyncio
+    from unittest.mock import Mock
+
+    client = Mock()
+    client.get_order_status.side_effect = [{"size_matched": "40"}, {"size_matched": "100"}]
+    executor = OrderExecutor(client=client, logger=Mock(), poll_interval=0.0, timeout=5.0)
+
+    filled = asyncio.run(
+        executor._monitor_until_filled(
+            "exchange-1", 100, context="Order", log_progress=False, log_level=10
+        )
+    )
+
+    assert filled == 100
+    assert client.get_order_status.call_count == 2
+
+
+def test_monitor_until_filled_does_not_block_event_loop():
+    """Test concurrent monitors share the event loop while waiting."""
+    import asyncio
+    from unittest.mock import Mock
+
+    client = Mock()
+    client.get_order_status.return_value = {"size_matched": "0"}
+    executor = OrderExecutor(client=client, logger=Mock(), poll_interval=0.05, timeout=0.2)
+
+    async def run_test():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(
+            *(
+                executor._monitor_until_filled(
+                    f"exchange-{i}", 100, context="Order", log_progress=False, log_level=10
+                )
+                for i in range(4)
+            )
+        )
+        return loop.time() - start
+
+    assert asyncio.run(run_test()) < 0.6
+
+
+def test_monitor_until_filled_backs_off_and_resets_on_fill():
+    """Test poll delay doubles while unchanged and resets after a partial fill."""
+    import asyncio
+    from unittest.mock import Mock, patch
+
+    client = Mock()
+    client.get_order_status.side_effect = [
+        {"size_matched": "0"},
+        {"size_matched": "0"},
+        {"size_matched": "0"},
+        {"size_matched": "30"},
+        {"size_matched": "30"},
+        {"size_matched": "100"},
+    ]
+    executor = OrderExecutor(client=client, logger=Mock(), poll_interval=0.3, timeout=60.0)
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    with patch("core.order_executor.asyncio.sleep", side_effect=fake_sleep):
+        filled = asyncio.run(
+            executor._monitor_until_filled(
+                "exchange-1", 100, context="Order", log_progress=False, log_level=10
+            )
+        )
+
+    assert filled == 100
+    assert delays == [0.1, 0.2, 0.3, 0.1, 0.1]
+
+
+def test_monitor_until_filled_reuses_recent_status_on_timeout():
+    """Test timeout skips the final status call when the last poll is fresh."""
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, Mock, patch
+
+    client = Mock()
+    client.get_order_status.return_value = {"size_matched": "20"}
+    executor = OrderExecutor(client=client, logger=Mock(), poll_interval=2.0, timeout=1.0)
+
+    # start, first elapsed check, status received, timed-out check, freshness check
+    clock = iter([0.0, 0.0, 0.5, 1.2, 1.3])
+    fake_time = SimpleNamespace(monotonic=lambda: next(clock))
+
+    with (
+        patch("core.order_executor.time", fake_time),
+        patch("core.order_executor.asyncio.sleep", new=AsyncMock()),
+    ):
+        filled = asyncio.run(
+            executor._monitor_until_filled(
+                "exchange-1", 100, context="Order", log_progress=False, log_level=10
+            )
+        )
+
+    assert filled == 20
+    assert client.get_order_status.call_count == 1
+
+
+def test_extract_filled_amount_fallbacks():
+    """Test integer, fallback and non-dict responses."""
+    from unittest.mock import Mock
+
+    executor = OrderExecutor(client=Mock(), logger=Mock())
+
+    assert executor._extract_filled_amount({"size_matched": 75}) == 75
+    assert executor._extract_filled_amount({"size_matched": "0", "filled": "30"}) == 0
+    assert executor._extract_filled_amount({"size_matched": 0, "filled": "30"}) == 30
+    assert executor._extract_filled_amount({"size_matched": None}) == 0
+    assert executor._extract_filled_amount("not-a-dict") == 0
+    assert executor._extract_filled_amount(None) == 0
+
+
+def test_iceberg_waits_between_tranches():
+    """Test iceberg execution waits out the inter-tranche delay before the next tranche."""
+    import asyncio
+    from unittest.mock import Mock, patch
+
+    from models.enums import OrderSide, OrderStatus
+    from models.order import Order, StrategyParams
+
+    client = Mock()
+    client.place_order.return_value = {"orderID": "exchange-1"}
+    client.extract_order_id.return_value = "exchange-1"
+    client.get_order_status.return_value = {"size_matched": "50"}
+    executor = OrderExecutor(client=client, logger=Mock(), poll_interval=0.0)
+
+    order = Order(
+        order_id="order-1",
+        market_id="market-1",
+        token_id="token-1",
+        side=OrderSide.BUY,
+        total_size=100,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+        strategy_params=StrategyParams(
+            initial_tranche_size=50,
+            min_tranche_size=50,
+            max_tranche_size=50,
+            tranche_randomization=0.0,
+        ),
+    )
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    with (
+        patch("strategies.iceberg.random.uniform", return_value=2.0),
+        patch("core.order_executor.asyncio.sleep", side_effect=fake_sleep),
+    ):
+        result = asyncio.run(executor.execute_iceberg_order(order))
+
+    assert result.status == OrderStatus.COMPLETED
+    assert client.place_order.call_count == 2
+    assert len(sleeps) == 1
+    assert 1.9 < sleeps[0] <= 2.0
+
+
+def test_iceberg_fills_reach_portfolio_monitor():
+    """Test iceberg tranche fills are published and applied to cached positions."""
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+
+    from core.event_bus import EventBus, OrderEvent
+    from core.portfolio_monitor import PortfolioMonitor
+    from models.enums import OrderSide, OrderStatus
+    from models.order import Order, StrategyParams
+
+    client = Mock()
+    client.place_order.return_value = {"orderID": "exchange-1"}
+    client.extract_order_id.return_value = "exchange-1"
+    client.get_order_status.return_value = {"size_matched": "100"}
+    client.config = SimpleNamespace(funder_address="0xABC")
+
+    order = Order(
+        order_id="order-1",
+        market_id="market-1",
+        token_id="token-1",
+        side=OrderSide.BUY,
+        total_size=100,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+        strategy_params=StrategyParams(
+            initial_tranche_size=100,
+            min_tranche_size=50,
+            max_tranche_size=100,
+            tranche_randomization=0.0,
+        ),
+    )
+
+    async def run_test():
+        bus = EventBus()
+        portfolio = PortfolioMonitor(client)
+        bus.subscribe(OrderEvent.FILLED, portfolio.apply_fill)
+        bus.subscribe(OrderEvent.PARTIALLY_FILLED, portfolio.apply_fill)
+        executor = OrderExecutor(client=client, logger=Mock(), poll_interval=0.0, event_bus=bus)
+
+        await bus.start()
+        result = await executor.execute_iceberg_order(order)
+        await bus._event_queue.join()
+        await bus.stop()
+        return result, portfolio.get_position("token-1")
+
+    result, position = asyncio.run(run_test())
+
+    assert result.status == OrderStatus.COMPLETED
+    assert position is not None
+    assert position.total_shares == 100
+    assert abs(position.avg_entry_price - 0.45) < 1e-9
@@ -0,0 +1,516 @@
+"""Tests for SQLite order persistence."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from core.event_bus import OrderEvent, OrderEventData
+from core.persistence import OrderDatabase
+from core.persistence_subscriber import PersistenceSubscriber
+from models.enums import OrderSide
+from models.order import Order
+
+
+def _make_order(order_id: str = "order-1") -> Order:
+    return Order(
+        order_id=order_id,
+        market_id="market-1",
+        token_id="token-1",
+        side=OrderSide.BUY,
+        total_size=1000,
+        target_price=0.45,
+        max_price=0.50,
+        min_price=0.40,
+    )
+
+
+def test_write_batch_single_transaction(tmp_path):
+    """Test write_batch stores orders, fills and events together."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    now = datetime.now()
+
+    db.write_batch(
+        orders=[(_make_order("order-1"), "iceberg"), (_make_order("order-2"), "kelly")],
+        fills=[("order-1", 100, 0.45, now), ("order-1", 50, 0.46, now)],
+        events=[("order-1", "queued", {"token_id": "token-1"}, now)],
+    )
+
+    history = db.get_order_history()
+    assert {row["order_id"] for row in history} == {"order-1", "order-2"}
+    assert [fill["amount"] for fill in db.get_fills("order-1")] == [100, 50]
+    assert db.get_events("order-1")[0]["event_type"] == "queued"
+
+
+def test_save_order_upserts(tmp_path):
+    """Test save_order replaces an existing row."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    order = _make_order()
+
+    db.save_order(order, "iceberg")
+    order.record_fill(400)
+    db.save_order(order, "iceberg")
+
+    history = db.get_order_history()
+    assert len(history) == 1
+    assert history[0]["filled_amount"] == 400
+
+
+def test_persistence_subscriber_records_fill_event(tmp_path):
+    """Test a fill event persists order state, event and fill."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    subscriber = PersistenceSubscriber(db)
+    order = _make_order()
+
+    event = OrderEventData(
+        event=OrderEvent.FILLED,
+        order_id=order.order_id,
+        timestamp=order.updated_at,
+        order_state=order,
+        details={"amount": 200, "price": 0.45, "strategy_type": "iceberg"},
+    )
+    asyncio.run(subscriber.handle_event(event))
+
+    assert db.get_order_history()[0]["strategy_type"] == "iceberg"
+    assert db.get_fills(order.order_id)[0]["amount"] == 200
+    assert db.get_events(order.order_id)[0]["event_type"] == "filled"
+    assert db.get_events(order.order_id)[0]["timestamp"] == order.updated_at.isoformat()
+
+
+def test_configure_applies_pragmas(tmp_path):
+    """Test the shared connection opens in WAL mode and can be reconfigured."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+
+    with db._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    db.configure(synchronous="full", busy_timeout=1000)
+
+    with db._get_connection() as conn:
+        assert conn is db._conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1000
+
+    with pytest.raises(ValueError):
+        db.configure(synchronous="sometimes")
+
+
+def test_configure_with_reader_checked_out(tmp_path):
+    """Test configure() doesn't wait on a held reader and readers catch up at checkout."""
+    db = OrderDatabase(str(tmp_path / "orders.db"), read_connections=1)
+    db.write_batch(orders=[(_make_order(), "iceberg")])
+
+    held = db.iter_active_orders()
+    next(held)
+    db.configure(busy_timeout=1234)
+    held.close()
+
+    with db._get_connection(write=False) as conn:
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+
+    db.close()
+
+
+def test_failed_write_rolls_back(tmp_path):
+    """Test an error inside a write transaction leaves no partial rows."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+
+    with pytest.raises(RuntimeError):
+        with db._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO events (order_id, event_type, timestamp, details) "
+                "VALUES ('order-1', 'queued', 'now', '{}')"
+            )
+            raise RuntimeError("boom")
+
+    assert db.get_events("order-1") == []
+
+
+def test_close_is_idempotent(tmp_path):
+    """Test closing twice is safe and later use fails clearly."""
+    import sqlite3
+
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    db.close()
+    db.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        db.get_order_history()
+
+
+def test_persistence_subscriber_coalesces_burst(tmp_path):
+    """Test a burst of events is written in a single batch once started."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    subscriber = PersistenceSubscriber(db, flush_interval=0.05)
+    order = _make_order()
+
+    async def run_test():
+        await subscriber.start()
+        for event in (OrderEvent.QUEUED, OrderEvent.STARTED, OrderEvent.COMPLETED):
+            await subscriber.handle_event(
+                OrderEventData(
+                    event=event,
+                    order_id=order.order_id,
+                    timestamp=datetime.now(),
+                    order_state=order,
+                    details={"strategy_type": "iceberg"},
+                )
+            )
+        await asyncio.sleep(0.2)
+        await subscriber.stop()
+
+    with patch.object(db, "write_batch", wraps=db.write_batch) as write_batch:
+        asyncio.run(run_test())
+
+    assert write_batch.call_count == 1
+    assert len(write_batch.call_args.kwargs["orders"]) == 1
+    assert [e["event_type"] for e in db.get_events(order.order_id)] == [
+        "queued",
+        "started",
+        "completed",
+    ]
+
+
+def test_persistence_subscriber_drops_only_poisoned_event(tmp_path):
+    """Test one unwritable event in a batch doesn't lose the rest of the batch."""
+    from unittest.mock import Mock
+
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    logger = Mock()
+    subscriber = PersistenceSubscriber(db, logger=logger, flush_interval=0.05)
+    order = _make_order()
+
+    async def run_test():
+        await subscriber.start()
+        for event, details in (
+            (OrderEvent.QUEUED, {"strategy_type": "iceberg"}),
+            (OrderEvent.STARTED, {"strategy_type": "iceberg", "bad": object()}),
+            (OrderEvent.COMPLETED, {"strategy_type": "iceberg"}),
+        ):
+            await subscriber.handle_event(
+                OrderEventData(
+                    event=event,
+                    order_id=order.order_id,
+                    timestamp=datetime.now(),
+                    order_state=order,
+                    details=details,
+                )
+            )
+        await asyncio.sleep(0.2)
+        await subscriber.stop()
+
+    with patch.object(db, "write_batch", wraps=db.write_batch) as write_batch:
+        asyncio.run(run_test())
+
+    # One failed batch, then each event on its own
+    assert write_batch.call_count == 4
+    assert [e["event_type"] for e in db.get_events(order.order_id)] == ["queued", "completed"]
+    logger.error.assert_called_once()
+    assert "started event for order-1" in logger.error.call_args[0][0]
+
+
+def test_persistence_subscriber_stop_flushes_queue(tmp_path):
+    """Test stop() writes events still waiting for the flusher."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    subscriber = PersistenceSubscriber(db, flush_interval=10.0)
+
+    async def run_test():
+        await subscriber.start()
+        await subscriber.handle_event(
+            OrderEventData(
+                event=OrderEvent.QUEUED,
+                order_id="order-1",
+                timestamp=datetime.now(),
+                order_state=None,
+                details={},
+            )
+        )
+        # Let the flusher take the event off the queue before stopping
+        await asyncio.sleep(0.01)
+        await subscriber.stop()
+
+    asyncio.run(run_test())
+
+    assert len(db.get_events("order-1")) == 1
+
+
+def test_json_columns_round_trip(tmp_path):
+    """Test strategy params and event details are stored as compact JSON."""
+    import json
+
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    order = _make_order()
+
+    db.save_order(order, "iceberg")
+    db.record_event(order.order_id, "queued", {"token_id": "token-1", "size": 10})
+
+    stored = db.get_order_history()[0]["strategy_params"]
+    assert json.loads(stored) == order.strategy_params.model_dump()
+
+    details = db.get_events(order.order_id)[0]["details"]
+    assert details == '{"token_id":"token-1","size":10}'
+
+    with db._get_connection(write=False) as conn:
+        row = conn.execute("SELECT details ->> 'size' FROM events").fetchone()
+    assert row[0] == 10
+
+
+def test_history_queries_use_composite_indexes(tmp_path):
+    """Test active and per-token lookups are served by the composite indexes."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+
+    with db._get_connection(write=False) as conn:
+        active_plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM orders "
+                "WHERE status IN ('queued', 'active', 'partially_filled') ORDER BY created_at"
+            )
+        )
+        token_plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM orders "
+                "WHERE token_id = ? ORDER BY created_at DESC LIMIT 10",
+                ("token-1",),
+            )
+        )
+
+    assert "idx_status_created" in active_plan
+    assert "idx_token_created" in token_plan
+    assert "TEMP B-TREE" not in token_plan
+
+
+def test_strategy_params_json_cached_by_value(tmp_path):
+    """Test strategy params JSON is reused for equal values and tracks mutation."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    order = _make_order()
+
+    with patch.object(
+        type(order.strategy_params),
+        "model_dump_json",
+        autospec=True,
+        side_effect=lambda self: f'{{"min":{self.min_tranche_size}}}',
+    ) as dump:
+        db.save_order(order, "iceberg")
+        db.save_order(_make_order("order-2"), "iceberg")
+        assert dump.call_count == 1
+
+        order.strategy_params.min_tranche_size = 20
+        db.save_order(order, "iceberg")
+        assert dump.call_count == 2
+
+    rows = {row["order_id"]: row for row in db.get_order_history()}
+    assert rows["order-1"]["strategy_params"] == '{"min":20}'
+    assert rows["order-2"]["strategy_params"] == '{"min":10}'
+
+
+def test_reads_do_not_wait_for_write_transaction(tmp_path):
+    """Test queries use the read-only connection and see committed state only."""
+    import sqlite3
+
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+
+    with db._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO events (order_id, event_type, timestamp, details) "
+            "VALUES ('order-1', 'queued', 'now', '{}')"
+        )
+        # Would deadlock on a single shared connection
+        assert db.get_events("order-1") == []
+
+    assert len(db.get_events("order-1")) == 1
+
+    with db._get_connection(write=False) as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM events")
+
+
+def test_write_batch_formats_shared_timestamp_once(tmp_path):
+    """Test rows sharing a timestamp object reuse one formatted string."""
+    calls = []
+
+    class CountingDatetime(datetime):
+        def isoformat(self, *args, **kwargs):
+            calls.append(self)
+            return super().isoformat(*args, **kwargs)
+
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    shared = CountingDatetime(2024, 1, 2, 3, 4, 5)
+    other = CountingDatetime(2024, 1, 2, 3, 4, 6)
+
+    db.write_batch(
+        fills=[("order-1", 10, 0.5, shared)],
+        events=[
+            ("order-1", "queued", {}, shared),
+            ("order-1", "started", {}, shared),
+            ("order-1", "filled", {}, other),
+        ],
+    )
+    assert calls == [shared, other]
+
+    stamps = [event["timestamp"] for event in db.get_events("order-1")]
+    assert stamps == [shared.isoformat()] * 2 + [other.isoformat()]
+    assert db.get_fills("order-1")[0]["timestamp"] == shared.isoformat()
+
+
+def test_iter_order_history_streams_rows(tmp_path):
+    """Test history iterators page through rows without holding a reader between chunks."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    db.write_batch(orders=[(_make_order(f"order-{i}"), "iceberg") for i in range(5)])
+
+    idle = db._read_pool.qsize()
+    with patch("core.persistence._READ_CHUNK_SIZE", 2):
+        rows = db.iter_order_history(token_id="token-1")
+        first = next(rows)
+        assert first["token_id"] == "token-1"
+        assert db._read_pool.qsize() == idle
+
+        newest_first = [first["order_id"]] + [row["order_id"] for row in rows]
+        assert sorted(newest_first) == [f"order-{i}" for i in range(5)]
+        assert len(set(newest_first)) == 5
+
+        assert [row["order_id"] for row in db.iter_active_orders()] == newest_first[::-1]
+        assert len(db.get_order_history(limit=3)) == 3
+
+    assert db._read_pool.qsize() == idle
+    assert len(db.load_active_orders()) == 5
+
+
+def test_reader_pool_exhausted_uses_temporary_reader(tmp_path):
+    """Test a read with every pooled reader checked out doesn't block."""
+    db = OrderDatabase(str(tmp_path / "orders.db"), read_connections=1)
+    db.write_batch(
+        orders=[(_make_order(), "iceberg")],
+        fills=[("order-1", 100, 0.45, datetime.now())],
+    )
+
+    with db._get_connection(write=False) as held:
+        assert db._read_pool.empty()
+        assert len(db.get_fills("order-1")) == 1
+
+    assert db._read_pool.get_nowait() is held
+
+
+def test_nested_reads_inside_streaming_iterator(tmp_path):
+    """Test reads issued while iterating history don't deadlock a one-reader pool."""
+    db = OrderDatabase(str(tmp_path / "orders.db"), read_connections=1)
+    db.write_batch(
+        orders=[(_make_order(f"order-{i}"), "iceberg") for i in range(3)],
+        fills=[(f"order-{i}", 10, 0.45, datetime.now()) for i in range(3)],
+    )
+
+    fills = {}
+    for row in db.iter_order_history():
+        fills[row["order_id"]] = db.get_fills(row["order_id"])
+    for row in db.iter_active_orders():
+        assert db.get_events(row["order_id"]) == []
+
+    assert {order_id: len(rows) for order_id, rows in fills.items()} == {
+        "order-0": 1,
+        "order-1": 1,
+        "order-2": 1,
+    }
+
+
+def test_concurrent_readers_use_separate_connections(tmp_path):
+    """Test overlapping queries check out distinct pooled readers."""
+    import sqlite3
+
+    db = OrderDatabase(str(tmp_path / "orders.db"), read_connections=2)
+
+    with db._get_connection(write=False) as first:
+        with db._get_connection(write=False) as second:
+            assert first is not second
+            assert db._read_pool.empty()
+
+    held = db.iter_order_history()
+    db.write_batch(orders=[(_make_order(), "iceberg")])
+    next(held)
+
+    db.close()
+    held.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+
+
+def test_checkpoint_reports_wal_frames(tmp_path):
+    """Test checkpoint returns SQLite's frame counts and validates the mode."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    db.write_batch(orders=[(_make_order(), "iceberg")])
+
+    busy, log, checkpointed = db.checkpoint("truncate")
+    assert busy == 0
+    assert checkpointed == log
+
+    with pytest.raises(ValueError):
+        db.checkpoint("sometimes")
+
+
+def test_persistence_subscriber_checkpoints_periodically(tmp_path):
+    """Test the flusher runs a WAL checkpoint every checkpoint_every batches."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    subscriber = PersistenceSubscriber(db, flush_interval=0, checkpoint_every=2)
+
+    async def run_test():
+        with patch.object(db, "checkpoint", wraps=db.checkpoint) as checkpoint:
+            await subscriber.start()
+            for i in range(4):
+                await subscriber.handle_event(
+                    OrderEventData(
+                        event=OrderEvent.QUEUED,
+                        order_id=f"order-{i}",
+                        timestamp=datetime.now(),
+                        order_state=None,
+                        details={},
+                    )
+                )
+                await asyncio.sleep(0.01)
+            await subscriber.stop()
+        return checkpoint.call_count
+
+    assert asyncio.run(run_test()) == 2
+    assert len(db.get_events("order-3")) == 1
+
+
+def test_synchronous_level_applied_at_open(tmp_path):
+    """Test the synchronous level chosen at construction is applied once on open."""
+    db = OrderDatabase(str(tmp_path / "orders.db"), synchronous="FULL")
+
+    with db._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    with pytest.raises(ValueError):
+        OrderDatabase(str(tmp_path / "other.db"), synchronous="sometimes")
+
+
+def test_persistence_subscriber_drops_oldest_when_full(tmp_path):
+    """Test a full backlog drops the oldest events and keeps the newest."""
+    db = OrderDatabase(str(tmp_path / "orders.db"))
+    subscriber = PersistenceSubscriber(db, flush_interval=10.0, max_queue_size=2)
+
+    async def run_test():
+        await subscriber.start()
+        for i in range(3):
+            await subscriber.handle_event(
+                OrderEventData(
+                    event=OrderEvent.QUEUED,
+                    order_id=f"order-{i}",
+                    timestamp=datetime.now(),
+                    order_state=None,
+                    details={},
+                )
+            )
+        await subscriber.stop()
+
+    asyncio.run(run_test())
+
+    assert db.get_events("order-0") == []
+    assert len(db.get_events("order-1")) == 1
+    assert len(db.get_events("order-2")) == 1
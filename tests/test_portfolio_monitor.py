@@ -0,0 +1,353 @@
+"""Tests for PortfolioMonitor."""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from core.event_bus import OrderEvent, OrderEventData
+from core.portfolio_monitor import PortfolioMonitor
+from models.enums import OrderSide
+from models.market_metadata import MarketMetadata, TokenInfo
+from models.order import Order
+from models.position import Position
+
+
+def _make_monitor(orders=None, positions=None):
+    """Build a monitor with a mocked client and HTTP session."""
+    client = Mock()
+    client.config = SimpleNamespace(funder_address="0xABC")
+    client.get_orders.return_value = orders or []
+
+    monitor = PortfolioMonitor(client, poll_interval=0.01)
+    response = Mock()
+    response.content = json.dumps(positions or []).encode()
+    monitor._http = Mock()
+    monitor._http.get = AsyncMock(return_value=response)
+    monitor._http.aclose = AsyncMock()
+    return monitor
+
+
+def test_update_positions_uses_shared_async_client():
+    """Test positions are fetched through the pooled async HTTP client."""
+
+    async def run_test():
+        monitor = _make_monitor(
+            positions=[
+                {"asset": "tok-1", "size": "12.5", "conditionId": "c1", "avgPrice": "0.4"},
+                {"asset": "tok-2", "size": "0"},
+                {"asset": "tok-3", "size": "3", "redeemable": True},
+            ]
+        )
+        http = monitor._http
+
+        await monitor._update_positions()
+        await monitor._update_positions()
+
+        assert http.get.await_count == 2
+        assert http.get.await_args.kwargs["params"]["user"] == "0xabc"
+        positions = monitor.get_positions_snapshot()
+        assert list(positions) == ["tok-1"]
+        assert positions["tok-1"].total_shares == 12.5
+
+    asyncio.run(run_test())
+
+
+def test_stop_closes_http_client():
+    """Test stopping the monitor closes the shared HTTP client."""
+
+    async def run_test():
+        monitor = _make_monitor(orders=[{"id": "o1", "asset_id": "tok-1"}])
+        http = monitor._http
+
+        await monitor.start()
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        http.aclose.assert_awaited_once()
+        assert monitor._http is None
+        assert "o1" in monitor.get_orders_snapshot()
+
+    asyncio.run(run_test())
+
+
+def test_snapshots_are_published_copy_on_write():
+    """Test snapshots are shared references replaced, not mutated, on update."""
+
+    async def run_test():
+        monitor = _make_monitor(orders=[{"id": "o1", "asset_id": "tok-1", "market": "c1"}])
+        monitor.client.client.get_market.return_value = {
+            "question": "Will it rain?",
+            "outcomes": ["Yes", "No"],
+            "tokens": [{"token_id": "tok-1"}, {"token_id": "tok-2"}],
+        }
+
+        await monitor._update_orders()
+        orders = monitor.get_orders_snapshot()
+        assert monitor.get_orders_snapshot() is orders
+
+        metadata = monitor.get_metadata_snapshot()
+        assert await monitor.get_market_question("tok-1") == "Will it rain?"
+        assert metadata == {}
+        assert set(monitor.get_metadata_snapshot()) == {"tok-1", "tok-2"}
+
+        await monitor._update_orders()
+        assert monitor.get_orders_snapshot() is not orders
+        assert orders == {"o1": {"id": "o1", "asset_id": "tok-1", "market": "c1"}}
+
+    asyncio.run(run_test())
+
+
+def test_update_positions_parses_fields_and_defaults():
+    """Test position price fields parse from strings and default to zero."""
+
+    async def run_test():
+        monitor = _make_monitor(
+            positions=[
+                {
+                    "asset": 123,
+                    "size": 4,
+                    "avgPrice": "0.25",
+                    "curPrice": 0.5,
+                    "cashPnl": None,
+                    "title": "Q?",
+                    "outcome": "Yes",
+                },
+                {"size": 5},
+            ]
+        )
+
+        await monitor._update_positions()
+
+        pos = monitor.get_positions_snapshot()["123"]
+        assert (pos.avg_entry_price, pos.current_price, pos.unrealized_pnl) == (0.25, 0.5, 0.0)
+        assert (pos.question, pos.outcome, pos.market_id) == ("Q?", "Yes", None)
+
+    asyncio.run(run_test())
+
+
+def test_refresh_stale_metadata_fetches_concurrently():
+    """Test stale metadata entries are refreshed in parallel."""
+
+    async def run_test():
+        tokens = ["tok-a", "tok-b", "tok-c"]
+        monitor = _make_monitor(
+            orders=[{"id": f"o-{t}", "asset_id": t, "market": f"c-{t}"} for t in tokens]
+        )
+        await monitor._update_orders()
+        monitor._market_metadata = {
+            t: MarketMetadata(
+                condition_id=f"c-{t}",
+                question="old",
+                tokens=[TokenInfo(token_id=t, outcome="Yes")],
+                cached_at=datetime(2000, 1, 1),
+            )
+            for t in tokens
+        }
+
+        # Each call waits for the others, so a serial refresh would time out
+        barrier = threading.Barrier(len(tokens), timeout=2)
+
+        def get_market(condition_id):
+            barrier.wait()
+            return {"question": f"new {condition_id}", "tokens": [{"token_id": condition_id[2:]}]}
+
+        monitor.client.client.get_market.side_effect = get_market
+
+        await monitor._refresh_stale_metadata()
+
+        metadata = monitor.get_metadata_snapshot()
+        assert {t: metadata[t].question for t in tokens} == {t: f"new c-{t}" for t in tokens}
+
+    asyncio.run(run_test())
+
+
+def test_metadata_cache_evicts_least_recently_fetched():
+    """Test the metadata cache is capped and drops the oldest fetched markets."""
+
+    async def run_test():
+        tokens = ["tok-a", "tok-b", "tok-c"]
+        monitor = _make_monitor(
+            orders=[{"id": f"o-{t}", "asset_id": t, "market": f"c-{t}"} for t in tokens]
+        )
+        monitor.max_metadata_entries = 2
+        monitor.client.client.get_market.side_effect = lambda condition_id: {
+            "question": condition_id,
+            "tokens": [{"token_id": condition_id[2:]}],
+        }
+        await monitor._update_orders()
+
+        for token_id in tokens:
+            await monitor.get_market_question(token_id)
+
+        assert list(monitor.get_metadata_snapshot()) == ["tok-b", "tok-c"]
+
+    asyncio.run(run_test())
+
+
+def test_update_positions_accepts_wrapped_response():
+    """Test positions wrapped in a {"data": [...]} object are still parsed."""
+
+    async def run_test():
+        monitor = _make_monitor()
+        wrapped = {"data": [{"asset": "tok-1", "size": 2, "outcome": None, "title": None}]}
+        response = monitor._http.get.return_value
+        response.content = json.dumps(wrapped).encode()
+        response.json.return_value = wrapped
+
+        await monitor._update_positions()
+
+        pos = monitor.get_positions_snapshot()["tok-1"]
+        assert (pos.total_shares, pos.outcome, pos.question) == (2.0, "Unknown", "Unknown")
+
+    asyncio.run(run_test())
+
+
+def test_expiring_metadata_served_while_one_refresh_runs():
+    """Test soft-expired metadata is returned at once and refreshed only once."""
+
+    async def run_test():
+        monitor = _make_monitor()
+        monitor.client.client.get_market.return_value = {
+            "question": "new",
+            "tokens": [{"token_id": "tok-a"}, {"token_id": "tok-b"}],
+        }
+        old = MarketMetadata(
+            condition_id="c1",
+            question="old",
+            tokens=[TokenInfo(token_id="tok-a", outcome="Yes")],
+            cached_at=datetime.now() - timedelta(seconds=100),
+            ttl_seconds=150,
+            soft_ttl_seconds=50,
+        )
+        monitor._market_metadata = {"tok-a": old, "tok-b": old}
+
+        questions = [await monitor.get_market_question(t) for t in ("tok-a", "tok-b", "tok-a")]
+        assert questions == ["old", "old", "old"]
+
+        await asyncio.gather(*monitor._metadata_fetches.values())
+        assert monitor.client.client.get_market.call_count == 1
+        assert await monitor.get_market_question("tok-a") == "new"
+
+    asyncio.run(run_test())
+
+
+def test_concurrent_misses_share_one_fetch():
+    """Test concurrent cache misses for one market wait on a single fetch."""
+
+    async def run_test():
+        monitor = _make_monitor(
+            orders=[
+                {"id": "o1", "asset_id": "tok-a", "market": "c1"},
+                {"id": "o2", "asset_id": "tok-b", "market": "c1"},
+            ]
+        )
+        monitor.client.client.get_market.return_value = {
+            "question": "Q",
+            "tokens": [{"token_id": "tok-a"}, {"token_id": "tok-b"}],
+        }
+        await monitor._update_orders()
+
+        questions = await asyncio.gather(
+            *(monitor.get_market_question(t) for t in ("tok-a", "tok-b", "tok-a"))
+        )
+
+        assert questions == ["Q", "Q", "Q"]
+        assert monitor.client.client.get_market.call_count == 1
+        assert monitor._metadata_fetches == {}
+
+    asyncio.run(run_test())
+
+
+def test_metadata_load_updates_positions_copy_on_write():
+    """Test a metadata load relabels positions without mutating published ones."""
+
+    async def run_test():
+        monitor = _make_monitor()
+        monitor._positions = {
+            "tok-a": Position(token_id="tok-a", outcome="Unknown", total_shares=5)
+        }
+        monitor.client.client.get_market.return_value = {
+            "question": "Q",
+            "outcomes": ["Yes", "No"],
+            "tokens": [{"token_id": "tok-a"}, {"token_id": "tok-b"}],
+        }
+
+        published = monitor.get_positions_snapshot()
+        await monitor._load_market_metadata("c1")
+
+        assert published["tok-a"].outcome == "Unknown"
+        assert published["tok-a"].question is None
+        position = monitor.get_position("tok-a")
+        assert (position.outcome, position.question) == ("Yes", "Q")
+        assert position.total_shares == 5
+        assert "tok-b" not in monitor.get_positions_snapshot()
+
+    asyncio.run(run_test())
+
+
+def _fill_event(side, amount, price):
+    """Build a fill event for a 100-share order on token tok1."""
+    order = Order(
+        order_id="o1",
+        token_id="tok1",
+        market_id="cond1",
+        side=side,
+        total_size=100,
+        target_price=price,
+        max_price=1.0,
+        min_price=0.0,
+    )
+    return OrderEventData(
+        event=OrderEvent.PARTIALLY_FILLED,
+        order_id=order.order_id,
+        timestamp=datetime.now(),
+        order_state=order,
+        details={"amount": amount, "price": price},
+    )
+
+
+def test_apply_fill_updates_positions_copy_on_write():
+    """Test fills adjust cached positions without mutating published snapshots."""
+    monitor = _make_monitor()
+
+    asyncio.run(monitor.apply_fill(_fill_event(OrderSide.BUY, 10, 0.4)))
+    first = monitor.get_positions_snapshot()
+    assert first["tok1"].total_shares == 10
+    assert first["tok1"].market_id == "cond1"
+
+    asyncio.run(monitor.apply_fill(_fill_event(OrderSide.BUY, 10, 0.6)))
+    second = monitor.get_positions_snapshot()
+    assert second["tok1"].total_shares == 20
+    assert abs(second["tok1"].avg_entry_price - 0.5) < 1e-9
+    assert first["tok1"].total_shares == 10
+
+    assert monitor.get_position("tok1") is second["tok1"]
+
+    asyncio.run(monitor.apply_fill(_fill_event(OrderSide.SELL, 20, 0.7)))
+    assert "tok1" not in monitor.get_positions_snapshot()
+    assert monitor.get_position("tok1") is None
+
+
+def test_positions_refresh_interval_limits_data_api_calls():
+    """Test positions are only fetched from the Data API once per interval."""
+    monitor = _make_monitor()
+    monitor.positions_refresh_interval = 300.0
+    http = monitor._http
+
+    async def run_test():
+        await monitor.start()
+        # Wait for several poll cycles rather than a fixed time, so a slow
+        # runner can't end the test after a single cycle
+        for _ in range(200):
+            if monitor.client.get_orders.call_count >= 3:
+                break
+            await asyncio.sleep(0.01)
+        await monitor.stop()
+
+    asyncio.run(run_test())
+
+    assert monitor.client.get_orders.call_count >= 3
+    assert http.get.await_count == 1
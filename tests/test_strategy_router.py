@@ -1,6 +1,6 @@
 """Tests for strategy router."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -92,3 +92,99 @@ def test_unknown_strategy_raises_error():
         import asyncio
 
         asyncio.run(router.execute_order(request))
+
+
+def test_execute_order_skips_routing_log_when_info_disabled():
+    """Test that the routing message is not built when INFO is disabled."""
+    import asyncio
+
+    logger = Mock()
+    logger.isEnabledFor.return_value = False
+    router = StrategyRouter(Mock(), logger=logger)
+
+    request = Mock()
+    request.strategy_type = Mock()
+
+    with pytest.raises(ValueError, match="Unknown strategy type"):
+        asyncio.run(router.execute_order(request))
+
+    logger.info.assert_not_called()
+
+
+def test_create_order_ids_are_unique():
+    """Test that successive orders from one router get distinct IDs."""
+    router = StrategyRouter(Mock())
+
+    request = OrderRequest(
+        market_id="market-123",
+        token_id="token-456",
+        side=OrderSide.BUY,
+        strategy_type=StrategyType.ICEBERG,
+        total_size=1000,
+        max_price=0.60,
+        min_price=0.40,
+        iceberg_params=StrategyParams(),
+    )
+
+    ids = {router.create_order_from_request(request).order_id for _ in range(100)}
+
+    assert len(ids) == 100
+    assert all(order_id.startswith(f"iceberg-{router._id_prefix}") for order_id in ids)
+
+
+def test_concurrent_orders_share_market_monitor():
+    """Test orders on the same token borrow one MarketMonitor until all finish."""
+    import asyncio
+
+    router = StrategyRouter(Mock())
+
+    async def run_test():
+        with patch("strategies.router.MarketMonitor") as monitor_cls:
+            monitor_cls.return_value.stop_monitoring = AsyncMock()
+
+            async with router._market_monitor("token-1", 50) as first:
+                async with router._market_monitor("token-1", 50) as second:
+                    assert first is second
+                assert ("token-1", 50) in router._monitors
+
+            assert monitor_cls.call_count == 1
+            assert router._monitors == {}
+            first.stop_monitoring.assert_awaited_once()
+
+    asyncio.run(run_test())
+
+
+def test_missing_strategy_params_fail_before_order_creation():
+    """Test missing params raise before an order or monitor is created."""
+    import asyncio
+
+    router = StrategyRouter(Mock())
+    router.create_order_from_request = Mock()
+
+    request = Mock()
+    request.micro_price_params = None
+    request.kelly_params = None
+
+    with patch("strategies.router.MarketMonitor") as monitor_cls:
+        with pytest.raises(ValueError, match="micro_price_params required"):
+            asyncio.run(router._execute_micro_price(request))
+        with pytest.raises(ValueError, match="kelly_params required"):
+            asyncio.run(router._execute_kelly(request))
+
+    router.create_order_from_request.assert_not_called()
+    monitor_cls.assert_not_called()
+
+
+def test_execute_order_dispatches_by_strategy_type():
+    """Test execute_order calls the handler registered for the strategy."""
+    import asyncio
+
+    router = StrategyRouter(Mock())
+    handler = AsyncMock(return_value="result")
+    router._dispatch[StrategyType.KELLY] = handler
+
+    request = Mock()
+    request.strategy_type = StrategyType.KELLY
+
+    assert asyncio.run(router.execute_order(request)) == "result"
+    handler.assert_awaited_once_with(request)
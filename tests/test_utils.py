@@ -35,3 +35,173 @@ def test_parse_token_ids():
     # Empty
     result = parse_token_ids("[]")
     assert result == []
+
+
+def test_fetch_market_data_decodes_body_and_handles_bad_json():
+    """Test market data is decoded from the response bytes."""
+    from unittest.mock import Mock, patch
+
+    from utils.gamma_parse import fetch_market_data
+
+    response = Mock()
+    response.content = b'{"id": "27824", "markets": []}'
+    with patch("utils.gamma_parse._SESSION.get", return_value=response):
+        assert fetch_market_data("https://example.test") == {"id": "27824", "markets": []}
+
+    response.content = b"not json"
+    with patch("utils.gamma_parse._SESSION.get", return_value=response):
+        assert fetch_market_data("https://example.test") is None
+
+
+def test_create_token_lookup_skips_incomplete_token_ids():
+    """Test lookup only includes named markets with both token IDs."""
+    from utils.gamma_parse import create_token_lookup
+
+    markets = [
+        {"groupItemTitle": "A", "id": "1", "clobTokenIds": '["y1", "n1"]', "conditionId": "c1"},
+        {"groupItemTitle": "B", "id": "2", "clobTokenIds": '["y2"]'},
+        {"groupItemTitle": "", "id": "3", "clobTokenIds": '["y3", "n3"]'},
+    ]
+
+    lookup = create_token_lookup(markets)
+
+    assert list(lookup) == ["A"]
+    assert lookup["A"].token_yes == "y1"
+    assert lookup["A"].token_no == "n1"
+    assert lookup["A"].to_dict() == {
+        "id": "1",
+        "token_yes": "y1",
+        "token_no": "n1",
+        "condition_id": "c1",
+        "slug": None,
+    }
+
+
+def test_format_market_as_markdown_rows_and_token_blocks():
+    """Test markdown export renders a table row and token block per market."""
+    from utils.gamma_parse import format_market_as_markdown
+
+    market = {
+        "groupItemTitle": "A",
+        "question": "Will it rain?",
+        "bestBid": "0.4",
+        "bestAsk": "0.45",
+        "lastTradePrice": "0.42",
+        "oneDayPriceChange": 0.015,
+        "volume": "1234.5",
+        "id": "7",
+        "clobTokenIds": '["yes-id", "no-id"]',
+    }
+
+    markdown = format_market_as_markdown({"title": "T", "id": "1"}, [market])
+
+    assert "| A | Will it rain? | 0.400 | 0.450 | 0.420 | +1.50% | $1,234 |" in markdown
+    assert "**YES Token:**\n```\nyes-id\n```" in markdown
+    assert "Market ID: `7`\n\n</details>\n" in markdown
+
+
+def test_prepend_to_markdown_file(tmp_path):
+    """Test new content is written above existing content."""
+    from utils.gamma_parse import prepend_to_markdown_file
+
+    target = tmp_path / "market_data.md"
+    prepend_to_markdown_file("first\n", str(target))
+    prepend_to_markdown_file("second\n", str(target))
+
+    assert target.read_text() == "second\nfirst\n"
+    assert not (tmp_path / "market_data.md.tmp").exists()
+
+
+def test_display_sub_markets_output(capsys):
+    """Test each sub-market prints its details block."""
+    from utils.gamma_parse import display_sub_markets
+
+    display_sub_markets(
+        [
+            {
+                "groupItemTitle": "A",
+                "closed": False,
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": '["0.4", "0.6"]',
+                "clobTokenIds": '["y1", "n1"]',
+                "volume": "1234.5",
+                "bestBid": "0.39",
+                "oneDayPriceChange": 0.012,
+            }
+        ]
+    )
+
+    out = capsys.readouterr().out
+    assert "\n[1] A\n" in out
+    assert "    Status: Active\n" in out
+    assert "    Prices: 0.400, 0.600\n" in out
+    assert "      Yes: y1\n      No:  n1\n" in out
+    assert "    Best Bid: 0.390\n" in out
+    assert "Best Ask" not in out
+    assert out.endswith("    24h Change: +1.20%\n")
+
+
+def test_fetch_market_data_async_over_shared_client():
+    """Test async fetches decode bodies and map failures to None."""
+    import asyncio
+
+    import httpx
+
+    from utils.gamma_parse import fetch_market_data_async
+
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=b'{"id": "%s"}' % request.url.path[-1:].encode())
+
+    async def run_test():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await asyncio.gather(
+                fetch_market_data_async(client, "https://gamma.test/markets/1"),
+                fetch_market_data_async(client, "https://gamma.test/markets/missing"),
+                fetch_market_data_async(client, "https://gamma.test/markets/2"),
+            )
+
+    assert asyncio.run(run_test()) == [{"id": "1"}, None, {"id": "2"}]
+
+
+def test_fetch_many_market_data_sync_keeps_input_order():
+    """Test the CLI wrapper fetches concurrently and returns results in URL order."""
+    import httpx
+
+    from utils.gamma_parse import fetch_many_market_data_sync
+
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=b'{"id": "%s"}' % request.url.path[-1:].encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    urls = [
+        "https://gamma.test/markets/1",
+        "https://gamma.test/markets/missing",
+        "https://gamma.test/markets/2",
+    ]
+
+    assert fetch_many_market_data_sync(urls, client) == [{"id": "1"}, None, {"id": "2"}]
+
+
+def test_main_fetches_several_urls_concurrently():
+    """Test main() routes multiple URLs through the concurrent fetch."""
+    from unittest.mock import patch
+
+    from utils import gamma_parse
+
+    urls = "https://gamma.test/markets/1 https://gamma.test/markets/2"
+    results = [{"id": "1", "title": "One"}, None]
+    with (
+        patch("builtins.input", return_value=urls),
+        patch.object(gamma_parse, "fetch_many_market_data_sync", return_value=results) as many,
+        patch.object(gamma_parse, "fetch_market_data") as fetch_one,
+        patch.object(gamma_parse, "display_market") as display,
+    ):
+        gamma_parse.main()
+
+    many.assert_called_once_with(urls.split())
+    fetch_one.assert_not_called()
+    display.assert_called_once_with(results[0])